@@ -31,7 +31,7 @@ def upgrade() -> None:
         sa.Column('email', sa.String(length=255), nullable=False),
         sa.Column('full_name', sa.String(length=255), nullable=False),
         sa.Column('hashed_password', sa.String(length=255), nullable=False),
-        sa.Column('role', sa.Enum('admin', 'manager', 'investigator', name='userrole'), nullable=False),
+        sa.Column('role', postgresql.ENUM('admin', 'manager', 'investigator', name='userrole', create_type=False), nullable=False),
         sa.Column('is_active', sa.Boolean(), nullable=True),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
         sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
@@ -48,8 +48,8 @@ def upgrade() -> None:
         sa.Column('case_number', sa.String(length=50), nullable=False),
         sa.Column('title', sa.String(length=255), nullable=False),
         sa.Column('description', sa.Text(), nullable=True),
-        sa.Column('status', sa.Enum('open', 'in_progress', 'closed', 'archived', name='casestatus'), nullable=False),
-        sa.Column('priority', sa.Enum('low', 'medium', 'high', 'critical', name='priority'), nullable=False),
+        sa.Column('status', postgresql.ENUM('open', 'in_progress', 'closed', 'archived', name='casestatus', create_type=False), nullable=False),
+        sa.Column('priority', postgresql.ENUM('low', 'medium', 'high', 'critical', name='priority', create_type=False), nullable=False),
         sa.Column('created_by', sa.Integer(), nullable=False),
         sa.Column('assigned_to', sa.Integer(), nullable=True),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
@@ -73,8 +73,8 @@ def upgrade() -> None:
         sa.Column('case_id', sa.Integer(), nullable=False),
         sa.Column('title', sa.String(length=255), nullable=False),
         sa.Column('description', sa.Text(), nullable=True),
-        sa.Column('evidence_type', sa.Enum('digital', 'physical', 'document', 'image', 'video', 'audio', 'log', 'other', name='evidencetype'), nullable=False),
-        sa.Column('status', sa.Enum('collected', 'analyzed', 'processed', 'archived', name='evidencestatus'), nullable=False),
+        sa.Column('evidence_type', postgresql.ENUM('digital', 'physical', 'document', 'image', 'video', 'audio', 'log', 'other', name='evidencetype', create_type=False), nullable=False),
+        sa.Column('status', postgresql.ENUM('collected', 'analyzed', 'processed', 'archived', name='evidencestatus', create_type=False), nullable=False),
         sa.Column('file_name', sa.String(length=255), nullable=True),
         sa.Column('file_path', sa.String(length=500), nullable=True),
         sa.Column('file_size', sa.Integer(), nullable=True),
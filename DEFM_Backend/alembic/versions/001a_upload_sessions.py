@@ -0,0 +1,67 @@
+"""Resumable upload sessions, 64-bit evidence file sizes
+
+Revision ID: 001a_upload_sessions
+Revises: 001_initial
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '001a_upload_sessions'
+down_revision = '001_initial'
+branch_labels = None
+depends_on = None
+
+upload_session_status = postgresql.ENUM(
+    'active', 'completing', 'completed', 'aborted', name='uploadsessionstatus', create_type=False
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    # Files over 2GB don't fit in a 32-bit integer; SQLite integers are 64-bit already
+    if bind.dialect.name != 'sqlite':
+        op.alter_column('evidence', 'file_size', type_=sa.BigInteger(),
+                        existing_type=sa.Integer(), existing_nullable=True)
+
+    # Databases set up by create_tables() at startup may already have the table
+    if sa.inspect(bind).has_table('upload_sessions'):
+        if bind.dialect.name == 'postgresql':
+            # Created before sessions could be completing; ADD VALUE can't
+            # run inside a transaction
+            with op.get_context().autocommit_block():
+                op.execute("ALTER TYPE uploadsessionstatus ADD VALUE IF NOT EXISTS 'completing' AFTER 'active'")
+        return
+
+    upload_session_status.create(bind, checkfirst=True)
+    op.create_table('upload_sessions',
+        sa.Column('id', sa.String(length=32), nullable=False),
+        sa.Column('evidence_id', sa.Integer(), nullable=False),
+        sa.Column('file_name', sa.String(length=255), nullable=False),
+        sa.Column('mime_type', sa.String(length=100), nullable=True),
+        sa.Column('total_size', sa.BigInteger(), nullable=False),
+        sa.Column('chunk_size', sa.Integer(), nullable=False),
+        sa.Column('total_chunks', sa.Integer(), nullable=False),
+        sa.Column('status', upload_session_status, nullable=False),
+        sa.Column('created_by', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['created_by'], ['users.id'], ),
+        sa.ForeignKeyConstraint(['evidence_id'], ['evidence.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_upload_sessions_id'), 'upload_sessions', ['id'], unique=False)
+    op.create_index(op.f('ix_upload_sessions_evidence_id'), 'upload_sessions', ['evidence_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_upload_sessions_evidence_id'), table_name='upload_sessions')
+    op.drop_index(op.f('ix_upload_sessions_id'), table_name='upload_sessions')
+    op.drop_table('upload_sessions')
+    upload_session_status.drop(op.get_bind(), checkfirst=True)
+    if op.get_bind().dialect.name != 'sqlite':
+        op.alter_column('evidence', 'file_size', type_=sa.Integer(),
+                        existing_type=sa.BigInteger(), existing_nullable=True)
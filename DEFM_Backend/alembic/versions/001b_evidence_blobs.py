@@ -0,0 +1,32 @@
+"""Content-addressed evidence blob store
+
+Revision ID: 001b_evidence_blobs
+Revises: 001a_upload_sessions
+Create Date: 2026-10-17 09:01:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '001b_evidence_blobs'
+down_revision = '001a_upload_sessions'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Databases set up by create_tables() at startup may already have the table
+    if sa.inspect(op.get_bind()).has_table('evidence_blobs'):
+        return
+    op.create_table('evidence_blobs',
+        sa.Column('file_hash', sa.String(length=64), nullable=False),
+        sa.Column('file_size', sa.BigInteger(), nullable=False),
+        sa.Column('ref_count', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint('file_hash')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('evidence_blobs')
@@ -0,0 +1,39 @@
+"""Evidence digests per algorithm
+
+Revision ID: 001c_evidence_hashes
+Revises: 001b_evidence_blobs
+Create Date: 2026-10-17 09:02:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '001c_evidence_hashes'
+down_revision = '001b_evidence_blobs'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Databases set up by create_tables() at startup may already have the table
+    if sa.inspect(op.get_bind()).has_table('evidence_hashes'):
+        return
+    op.create_table('evidence_hashes',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('evidence_id', sa.Integer(), nullable=False),
+        sa.Column('algorithm', sa.String(length=20), nullable=False),
+        sa.Column('digest', sa.String(length=128), nullable=False),
+        sa.Column('computed_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(['evidence_id'], ['evidence.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('evidence_id', 'algorithm', name='uq_evidence_hashes_evidence_algorithm')
+    )
+    op.create_index(op.f('ix_evidence_hashes_id'), 'evidence_hashes', ['id'], unique=False)
+    op.create_index(op.f('ix_evidence_hashes_evidence_id'), 'evidence_hashes', ['evidence_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_evidence_hashes_evidence_id'), table_name='evidence_hashes')
+    op.drop_index(op.f('ix_evidence_hashes_id'), table_name='evidence_hashes')
+    op.drop_table('evidence_hashes')
@@ -0,0 +1,50 @@
+"""Latest integrity check of each evidence item
+
+Revision ID: 001d_integrity_checks
+Revises: 001c_evidence_hashes
+Create Date: 2026-10-17 09:03:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '001d_integrity_checks'
+down_revision = '001c_evidence_hashes'
+branch_labels = None
+depends_on = None
+
+integrity_outcome = postgresql.ENUM('passed', 'failed', 'missing', name='integrityoutcome', create_type=False)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    # Databases set up by create_tables() at startup may already have the table
+    if sa.inspect(bind).has_table('evidence_integrity_checks'):
+        return
+    integrity_outcome.create(bind, checkfirst=True)
+    op.create_table('evidence_integrity_checks',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('evidence_id', sa.Integer(), nullable=False),
+        sa.Column('outcome', integrity_outcome, nullable=False),
+        sa.Column('last_verified_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('expected_hash', sa.String(length=255), nullable=True),
+        sa.Column('observed_hash', sa.String(length=255), nullable=True),
+        sa.Column('source', sa.String(length=20), nullable=True),
+        sa.ForeignKeyConstraint(['evidence_id'], ['evidence.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_evidence_integrity_checks_id'), 'evidence_integrity_checks', ['id'], unique=False)
+    op.create_index(op.f('ix_evidence_integrity_checks_evidence_id'), 'evidence_integrity_checks', ['evidence_id'], unique=True)
+    op.create_index(op.f('ix_evidence_integrity_checks_outcome'), 'evidence_integrity_checks', ['outcome'], unique=False)
+    op.create_index(op.f('ix_evidence_integrity_checks_last_verified_at'), 'evidence_integrity_checks', ['last_verified_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_evidence_integrity_checks_last_verified_at'), table_name='evidence_integrity_checks')
+    op.drop_index(op.f('ix_evidence_integrity_checks_outcome'), table_name='evidence_integrity_checks')
+    op.drop_index(op.f('ix_evidence_integrity_checks_evidence_id'), table_name='evidence_integrity_checks')
+    op.drop_index(op.f('ix_evidence_integrity_checks_id'), table_name='evidence_integrity_checks')
+    op.drop_table('evidence_integrity_checks')
+    integrity_outcome.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,34 @@
+"""Merkle trees of evidence chunk hashes
+
+Revision ID: 001e_merkle_trees
+Revises: 001d_integrity_checks
+Create Date: 2026-10-17 09:04:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '001e_merkle_trees'
+down_revision = '001d_integrity_checks'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Databases set up by create_tables() at startup may already have the table
+    if sa.inspect(op.get_bind()).has_table('merkle_trees'):
+        return
+    op.create_table('merkle_trees',
+        sa.Column('file_hash', sa.String(length=64), nullable=False),
+        sa.Column('chunk_size', sa.Integer(), nullable=False),
+        sa.Column('leaf_count', sa.Integer(), nullable=False),
+        sa.Column('root_hash', sa.String(length=64), nullable=False),
+        sa.Column('leaves', sa.LargeBinary(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint('file_hash')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('merkle_trees')
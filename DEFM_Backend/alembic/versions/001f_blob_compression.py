@@ -0,0 +1,30 @@
+"""Seekable compressed storage of archived blobs
+
+Revision ID: 001f_blob_compression
+Revises: 001e_merkle_trees
+Create Date: 2026-10-17 09:05:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '001f_blob_compression'
+down_revision = '001e_merkle_trees'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Databases set up by create_tables() at startup may already have the columns
+    columns = {column['name'] for column in sa.inspect(op.get_bind()).get_columns('evidence_blobs')}
+    if 'compressed' not in columns:
+        # Blobs stored so far are uncompressed
+        op.add_column('evidence_blobs', sa.Column('compressed', sa.Boolean(), server_default=sa.false(), nullable=False))
+    if 'stored_size' not in columns:
+        op.add_column('evidence_blobs', sa.Column('stored_size', sa.BigInteger(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('evidence_blobs', 'stored_size')
+    op.drop_column('evidence_blobs', 'compressed')
@@ -0,0 +1,35 @@
+"""Hot and cold storage tiers of blobs
+
+Revision ID: 001g_storage_tiers
+Revises: 001f_blob_compression
+Create Date: 2026-10-17 09:06:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '001g_storage_tiers'
+down_revision = '001f_blob_compression'
+branch_labels = None
+depends_on = None
+
+storage_tier = postgresql.ENUM('hot', 'cold', name='storagetier', create_type=False)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    # Databases set up by create_tables() at startup may already have the column
+    if 'tier' in {column['name'] for column in sa.inspect(bind).get_columns('evidence_blobs')}:
+        return
+    storage_tier.create(bind, checkfirst=True)
+    # Blobs stored so far are on the hot tier
+    op.add_column('evidence_blobs', sa.Column('tier', storage_tier, server_default='hot', nullable=False))
+    op.create_index(op.f('ix_evidence_blobs_tier'), 'evidence_blobs', ['tier'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_evidence_blobs_tier'), table_name='evidence_blobs')
+    op.drop_column('evidence_blobs', 'tier')
+    storage_tier.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,27 @@
+"""Storage backend holding each blob
+
+Revision ID: 001h_storage_backends
+Revises: 001g_storage_tiers
+Create Date: 2026-10-17 09:07:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '001h_storage_backends'
+down_revision = '001g_storage_tiers'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Databases set up by create_tables() at startup may already have the column
+    if 'storage_backend' in {column['name'] for column in sa.inspect(op.get_bind()).get_columns('evidence_blobs')}:
+        return
+    # Blobs stored so far are on the local filesystem
+    op.add_column('evidence_blobs', sa.Column('storage_backend', sa.String(length=20), server_default='local', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('evidence_blobs', 'storage_backend')
@@ -0,0 +1,56 @@
+"""Member index of archive evidence
+
+Revision ID: 001i_archive_members
+Revises: 001h_storage_backends
+Create Date: 2026-10-17 09:08:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '001i_archive_members'
+down_revision = '001h_storage_backends'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    # Databases set up by create_tables() at startup may already have the tables
+    if not inspector.has_table('archive_manifests'):
+        op.create_table('archive_manifests',
+            sa.Column('file_hash', sa.String(length=64), nullable=False),
+            sa.Column('archive_format', sa.String(length=10), nullable=False),
+            sa.Column('member_count', sa.Integer(), nullable=False),
+            sa.Column('total_size', sa.BigInteger(), nullable=False),
+            sa.Column('error', sa.Text(), nullable=True),
+            sa.Column('indexed_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+            sa.PrimaryKeyConstraint('file_hash')
+        )
+    if not inspector.has_table('archive_members'):
+        op.create_table('archive_members',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('file_hash', sa.String(length=64), nullable=False),
+            sa.Column('member_index', sa.Integer(), nullable=False),
+            sa.Column('path', sa.String(length=1024), nullable=False),
+            sa.Column('is_dir', sa.Boolean(), nullable=False),
+            sa.Column('size', sa.BigInteger(), nullable=False),
+            sa.Column('compressed_size', sa.BigInteger(), nullable=True),
+            sa.Column('modified_at', sa.DateTime(timezone=True), nullable=True),
+            sa.Column('sha256', sa.String(length=64), nullable=True),
+            sa.Column('encrypted', sa.Boolean(), nullable=False),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('file_hash', 'member_index', name='uq_archive_members_file_member')
+        )
+        op.create_index(op.f('ix_archive_members_id'), 'archive_members', ['id'], unique=False)
+        op.create_index(op.f('ix_archive_members_file_hash'), 'archive_members', ['file_hash'], unique=False)
+        op.create_index(op.f('ix_archive_members_sha256'), 'archive_members', ['sha256'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_archive_members_sha256'), table_name='archive_members')
+    op.drop_index(op.f('ix_archive_members_file_hash'), table_name='archive_members')
+    op.drop_index(op.f('ix_archive_members_id'), table_name='archive_members')
+    op.drop_table('archive_members')
+    op.drop_table('archive_manifests')
@@ -0,0 +1,41 @@
+"""Embedded file metadata of evidence
+
+Revision ID: 001j_evidence_metadata
+Revises: 001i_archive_members
+Create Date: 2026-10-17 09:09:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '001j_evidence_metadata'
+down_revision = '001i_archive_members'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Databases set up by create_tables() at startup may already have the table
+    if sa.inspect(op.get_bind()).has_table('evidence_metadata'):
+        return
+    op.create_table('evidence_metadata',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('file_hash', sa.String(length=64), nullable=False),
+        sa.Column('key', sa.String(length=100), nullable=False),
+        sa.Column('value', sa.String(length=1024), nullable=False),
+        sa.Column('source', sa.String(length=20), nullable=False),
+        sa.Column('extracted_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('file_hash', 'key', name='uq_evidence_metadata_file_key')
+    )
+    op.create_index(op.f('ix_evidence_metadata_id'), 'evidence_metadata', ['id'], unique=False)
+    op.create_index(op.f('ix_evidence_metadata_file_hash'), 'evidence_metadata', ['file_hash'], unique=False)
+    op.create_index('ix_evidence_metadata_key_value', 'evidence_metadata', ['key', 'value'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_evidence_metadata_key_value', table_name='evidence_metadata')
+    op.drop_index(op.f('ix_evidence_metadata_file_hash'), table_name='evidence_metadata')
+    op.drop_index(op.f('ix_evidence_metadata_id'), table_name='evidence_metadata')
+    op.drop_table('evidence_metadata')
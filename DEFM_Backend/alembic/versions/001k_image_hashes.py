@@ -0,0 +1,38 @@
+"""Perceptual hashes of image evidence
+
+Revision ID: 001k_image_hashes
+Revises: 001j_evidence_metadata
+Create Date: 2026-10-17 09:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '001k_image_hashes'
+down_revision = '001j_evidence_metadata'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Databases set up by create_tables() at startup may already have the table
+    if sa.inspect(op.get_bind()).has_table('image_hashes'):
+        return
+    op.create_table('image_hashes',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('file_hash', sa.String(length=64), nullable=False),
+        sa.Column('ahash', sa.BigInteger(), nullable=False),
+        sa.Column('dhash', sa.BigInteger(), nullable=False),
+        sa.Column('phash', sa.BigInteger(), nullable=False),
+        sa.Column('computed_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_image_hashes_id'), 'image_hashes', ['id'], unique=False)
+    op.create_index(op.f('ix_image_hashes_file_hash'), 'image_hashes', ['file_hash'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_image_hashes_file_hash'), table_name='image_hashes')
+    op.drop_index(op.f('ix_image_hashes_id'), table_name='image_hashes')
+    op.drop_table('image_hashes')
@@ -0,0 +1,62 @@
+"""Indexes for list page and dashboard queries
+
+Revision ID: 002_query_indexes
+Revises: 001k_image_hashes
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '002_query_indexes'
+down_revision = '001k_image_hashes'
+branch_labels = None
+depends_on = None
+
+# (name, table, columns); the equality columns come first, the sort column last
+INDEXES = [
+    # Evidence of a case, and an investigator's own evidence, newest first
+    ('ix_evidence_case_id_collected_at', 'evidence', ['case_id', 'collected_at']),
+    ('ix_evidence_collected_by_collected_at', 'evidence', ['collected_by', 'collected_at']),
+    # Evidence list of a case, paged by id
+    ('ix_evidence_case_id_id', 'evidence', ['case_id', 'id']),
+    # Custody history of one evidence item in time order, and paged by id
+    ('ix_chain_of_custody_evidence_id_timestamp', 'chain_of_custody', ['evidence_id', 'timestamp']),
+    ('ix_chain_of_custody_evidence_id_id', 'chain_of_custody', ['evidence_id', 'id']),
+    # A user's activity and notifications, newest first; id breaks timestamp
+    # ties in the order audit log pages are walked
+    ('ix_audit_logs_user_id_timestamp_id', 'audit_logs', ['user_id', 'timestamp', 'id']),
+    # History of one case, evidence item or user, newest first
+    ('ix_audit_logs_entity_type_entity_id_timestamp', 'audit_logs', ['entity_type', 'entity_id', 'timestamp']),
+    # Recent activity across all users
+    ('ix_audit_logs_timestamp_id', 'audit_logs', ['timestamp', 'id']),
+    # "Assigned to me" case lists, optionally by status, and the dashboard counts
+    ('ix_cases_assigned_to_status', 'cases', ['assigned_to', 'status']),
+    ('ix_cases_status', 'cases', ['status']),
+    # "Assigned to me" case list of any status, paged by id
+    ('ix_cases_assigned_to_id', 'cases', ['assigned_to', 'id']),
+]
+
+
+def upgrade() -> None:
+    # Databases set up by create_tables() at startup may already have these
+    postgresql = op.get_bind().dialect.name == 'postgresql'
+    if postgresql:
+        # Build without locking the tables against writes; CONCURRENTLY
+        # can't run inside a transaction
+        with op.get_context().autocommit_block():
+            for name, table, columns in INDEXES:
+                op.create_index(name, table, columns, unique=False, if_not_exists=True,
+                                postgresql_concurrently=True)
+    else:
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, if_not_exists=True)
+    # Give the planner statistics for the new indexes right away
+    for table in dict.fromkeys(table for _, table, _ in INDEXES):
+        op.execute(sa.text(f'ANALYZE {table}'))
+
+
+def downgrade() -> None:
+    for name, table, columns in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
@@ -0,0 +1,36 @@
+"""Index for paging archive members in archive order
+
+Revision ID: 003_archive_member_order
+Revises: 002_query_indexes
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '003_archive_member_order'
+down_revision = '002_query_indexes'
+branch_labels = None
+depends_on = None
+
+INDEX = ('ix_archive_members_file_hash_member_index_id', 'archive_members', ['file_hash', 'member_index', 'id'])
+
+
+def upgrade() -> None:
+    name, table, columns = INDEX
+    # Databases set up by create_tables() at startup may already have it
+    if op.get_bind().dialect.name == 'postgresql':
+        # Build without locking the table against writes; CONCURRENTLY
+        # can't run inside a transaction
+        with op.get_context().autocommit_block():
+            op.create_index(name, table, columns, unique=False, if_not_exists=True,
+                            postgresql_concurrently=True)
+    else:
+        op.create_index(name, table, columns, unique=False, if_not_exists=True)
+    op.execute(sa.text(f'ANALYZE {table}'))
+
+
+def downgrade() -> None:
+    name, table, _ = INDEX
+    op.drop_index(name, table_name=table, if_exists=True)
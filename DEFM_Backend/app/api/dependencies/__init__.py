@@ -6,11 +6,13 @@ from .auth import (
     require_admin_or_manager,
     get_audit_service
 )
+from .pagination import Page
 
 __all__ = [
     "get_current_user",
     "get_current_active_user", 
     "require_admin",
     "require_admin_or_manager",
-    "get_audit_service"
+    "get_audit_service",
+    "Page"
 ]
\ No newline at end of file
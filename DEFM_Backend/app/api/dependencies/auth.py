@@ -1,6 +1,7 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
 from app.core.security import verify_token
 from app.models.models import User
@@ -50,7 +51,7 @@ logger = logging.getLogger(__name__)
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials | None = Depends(security),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> User:
     """Get current authenticated user."""
     credentials_exception = HTTPException(
@@ -78,7 +79,7 @@ async def get_current_user(
         logger.error(f"Token verification failed: {str(e)}")
         raise credentials_exception
     
-    user = db.query(User).filter(User.username == username).first()
+    user = await db.scalar(select(User).where(User.username == username))
     if user is None:
         logger.warning(f"Token decoded but username not found: {token_data}")
         raise credentials_exception
@@ -117,7 +118,7 @@ async def require_admin_or_manager(current_user: User = Depends(get_current_user
     return current_user
 
 async def get_audit_service(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ) -> AuditService:
     """Get audit service with current user context."""
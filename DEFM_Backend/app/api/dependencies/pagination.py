@@ -0,0 +1,46 @@
+from fastapi import HTTPException, Query, Response, status
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, List, Optional
+from app.utils.pagination import NEXT_CURSOR_HEADER, InvalidCursor, Keyset
+
+
+class Page:
+    """
+    Paging parameters of a list endpoint.
+
+    Clients page either with ``skip``/``limit`` or by passing back the
+    ``X-Next-Cursor`` header of the previous response as ``cursor``. The
+    header is set whenever the page is full, offset pages included, so a
+    client can switch to cursors after the first request.
+    """
+
+    def __init__(
+        self,
+        response: Response,
+        skip: int = Query(0, ge=0, description="Rows to skip; use cursor instead for deep pages"),
+        limit: int = Query(100, ge=1, description="Maximum number of rows to return"),
+        cursor: Optional[str] = Query(None, description="X-Next-Cursor value of the previous page"),
+    ):
+        if cursor is not None and skip:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="skip cannot be combined with cursor"
+            )
+        self.response = response
+        self.skip = skip
+        self.limit = limit
+        self.cursor = cursor
+
+    async def fetch(self, db: AsyncSession, query: Select, keyset: Keyset) -> List[Any]:
+        """Get one page of a listing query and set the cursor of the next one."""
+        try:
+            query = keyset.paginate(query, self.cursor, self.skip, self.limit)
+        except InvalidCursor as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        rows = (await db.scalars(query)).all()
+        next_cursor = keyset.next_cursor(rows, self.limit)
+        if next_cursor is not None:
+            self.response.headers[NEXT_CURSOR_HEADER] = next_cursor
+        return rows
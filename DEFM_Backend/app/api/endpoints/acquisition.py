@@ -2,9 +2,11 @@ from datetime import datetime
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_current_user, get_audit_service
+from app.api.loaders import EVIDENCE_LOAD_OPTIONS
 from app.core.database import get_db
 from app.models.models import Evidence, Case, User
 from app.schemas.schemas import EvidenceCreate, Evidence as EvidenceSchema
@@ -16,8 +18,8 @@ router = APIRouter(prefix="/acquisition", tags=["Acquisition"])
 logger = logging.getLogger(__name__)
 
 
-def generate_evidence_number(db: Session) -> str:
-    last_evidence = db.query(Evidence).order_by(Evidence.id.desc()).first()
+async def generate_evidence_number(db: AsyncSession) -> str:
+    last_evidence = await db.scalar(select(Evidence).order_by(Evidence.id.desc()).limit(1))
     next_id = 1 if last_evidence is None else (last_evidence.id + 1)
     return f"EVD-{datetime.utcnow().strftime('%Y%m%d')}-{next_id:06d}"
 
@@ -25,12 +27,12 @@ def generate_evidence_number(db: Session) -> str:
 @router.post("/evidence", response_model=EvidenceSchema)
 async def acquire_evidence(
     evidence_data: EvidenceCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     audit_service: AuditService = Depends(get_audit_service),
 ):
     """Acquire new evidence through dedicated acquisition endpoint."""
-    case = db.query(Case).filter(Case.id == evidence_data.case_id).first()
+    case = await db.get(Case, evidence_data.case_id)
     if not case:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -39,7 +41,7 @@ async def acquire_evidence(
 
     try:
         evidence = Evidence(
-            evidence_number=generate_evidence_number(db),
+            evidence_number=await generate_evidence_number(db),
             case_id=evidence_data.case_id,
             title=evidence_data.title,
             description=evidence_data.description,
@@ -51,8 +53,7 @@ async def acquire_evidence(
         )
 
         db.add(evidence)
-        db.commit()
-        db.refresh(evidence)
+        await db.commit()
 
         await audit_service.log_action(
             action="evidence_acquired",
@@ -62,11 +63,16 @@ async def acquire_evidence(
         )
 
         logger.info("Evidence acquired by %s: %s", current_user.username, evidence.evidence_number)
-        return evidence
+        return await db.scalar(
+            select(Evidence)
+            .options(*EVIDENCE_LOAD_OPTIONS)
+            .where(Evidence.id == evidence.id)
+            .execution_options(populate_existing=True)
+        )
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error("Error acquiring evidence: %s", str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -77,20 +83,20 @@ async def acquire_evidence(
 @router.get("/evidence", response_model=List[EvidenceSchema])
 async def list_acquired_evidence(
     case_id: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """List acquired evidence with optional case filter."""
     try:
-        query = db.query(Evidence)
+        query = select(Evidence).options(*EVIDENCE_LOAD_OPTIONS)
 
         if case_id:
-            query = query.filter(Evidence.case_id == case_id)
+            query = query.where(Evidence.case_id == case_id)
 
         if current_user.role.value == "investigator":
-            query = query.filter(Evidence.collected_by == current_user.id)
+            query = query.where(Evidence.collected_by == current_user.id)
 
-        return query.order_by(Evidence.collected_at.desc()).all()
+        return (await db.scalars(query.order_by(Evidence.collected_at.desc()))).all()
     except Exception as e:
         logger.error("Error listing acquired evidence: %s", str(e))
         raise HTTPException(
@@ -1,11 +1,35 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.dependencies.roles import require_role
-from app.core.database import get_db
+from app.core.database import async_engine, engine, get_db, replica_set
+from app.core.pool_metrics import pool_stats
 from app.models.models import User
+from app.services.hash_pool import hash_pool
+from app.services.storage_tier_service import StorageTierService
 
 router = APIRouter(tags=["Admin"])
 
 @router.get("/users", dependencies=[Depends(require_role("admin"))])
-def list_users(db: Session = Depends(get_db)):
-    return db.query(User).all()
+async def list_users(db: AsyncSession = Depends(get_db)):
+    return (await db.scalars(select(User))).all()
+
+@router.get("/hash-pool", dependencies=[Depends(require_role("admin"))])
+def read_hash_pool_stats():
+    """Integrity hashing pool queue depth and throughput."""
+    return hash_pool.stats()
+
+@router.get("/storage-tiers", dependencies=[Depends(require_role("admin"))])
+async def read_storage_tier_usage(db: AsyncSession = Depends(get_db)):
+    """Blobs and bytes stored on the hot and cold storage tiers."""
+    # The tier service is shared with the migrator thread and stays synchronous
+    return await db.run_sync(lambda session: StorageTierService(session).tier_usage())
+
+@router.get("/db-pool", dependencies=[Depends(require_role("admin"))])
+def read_db_pool_stats():
+    """Database connection pool usage and checkout wait times, per engine."""
+    return {
+        "request": pool_stats(async_engine.pool),
+        "background": pool_stats(engine.pool),
+        "replicas": replica_set.stats(),
+    }
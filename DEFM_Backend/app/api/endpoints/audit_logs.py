@@ -1,63 +1,67 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from datetime import datetime, timedelta
 from app.core.database import get_db
 from app.models.models import AuditLog, User
 from app.schemas.schemas import AuditLog as AuditLogSchema
-from app.api.dependencies import get_current_user, require_admin
+from app.api.dependencies import Page, get_current_user, require_admin
+from app.api.loaders import AUDIT_LOG_LOAD_OPTIONS
+from app.utils.pagination import Keyset
 import logging
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Most recent first
+AUDIT_LOG_KEYSET = Keyset(AuditLog.timestamp, AuditLog.id, descending=True)
+
 @router.get("/", response_model=List[AuditLogSchema])
 async def read_audit_logs(
-    skip: int = 0,
-    limit: int = 100,
+    page: Page = Depends(),
     user_id: Optional[int] = None,
     action: Optional[str] = None,
     entity_type: Optional[str] = None,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_admin)
 ):
     """Get audit logs with filters (admin only)."""
-    query = db.query(AuditLog)
+    query = select(AuditLog).options(*AUDIT_LOG_LOAD_OPTIONS)
     
     # Apply filters
     if user_id:
-        query = query.filter(AuditLog.user_id == user_id)
+        query = query.where(AuditLog.user_id == user_id)
     if action:
-        query = query.filter(AuditLog.action.ilike(f"%{action}%"))
+        query = query.where(AuditLog.action.ilike(f"%{action}%"))
     if entity_type:
-        query = query.filter(AuditLog.entity_type == entity_type)
+        query = query.where(AuditLog.entity_type == entity_type)
     if start_date:
-        query = query.filter(AuditLog.timestamp >= start_date)
+        query = query.where(AuditLog.timestamp >= start_date)
     if end_date:
-        query = query.filter(AuditLog.timestamp <= end_date)
+        query = query.where(AuditLog.timestamp <= end_date)
     
-    # Order by most recent first
-    logs = query.order_by(AuditLog.timestamp.desc()).offset(skip).limit(limit).all()
-    return logs
+    return await page.fetch(db, query, AUDIT_LOG_KEYSET)
 
 @router.get("/recent", response_model=List[AuditLogSchema])
 async def read_recent_audit_logs(
     limit: int = Query(default=50, le=100),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_admin)
 ):
     """Get recent audit logs (admin only)."""
-    logs = db.query(AuditLog).order_by(AuditLog.timestamp.desc()).limit(limit).all()
+    logs = (await db.scalars(
+        select(AuditLog).options(*AUDIT_LOG_LOAD_OPTIONS).order_by(AuditLog.timestamp.desc()).limit(limit)
+    )).all()
     return logs
 
 @router.get("/user/{user_id}", response_model=List[AuditLogSchema])
 async def read_user_audit_logs(
     user_id: int,
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db),
+    page: Page = Depends(),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get audit logs for specific user."""
@@ -68,21 +72,19 @@ async def read_user_audit_logs(
             detail="Not enough permissions"
         )
     
-    logs = db.query(AuditLog).filter(
-        AuditLog.user_id == user_id
-    ).order_by(AuditLog.timestamp.desc()).offset(skip).limit(limit).all()
-    return logs
+    query = select(AuditLog).options(*AUDIT_LOG_LOAD_OPTIONS).where(AuditLog.user_id == user_id)
+    return await page.fetch(db, query, AUDIT_LOG_KEYSET)
 
 @router.get("/entity/{entity_type}/{entity_id}", response_model=List[AuditLogSchema])
 async def read_entity_audit_logs(
     entity_type: str,
     entity_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get audit logs for specific entity."""
-    logs = db.query(AuditLog).filter(
+    logs = (await db.scalars(select(AuditLog).options(*AUDIT_LOG_LOAD_OPTIONS).where(
         AuditLog.entity_type == entity_type,
         AuditLog.entity_id == entity_id
-    ).order_by(AuditLog.timestamp.desc()).all()
+    ).order_by(AuditLog.timestamp.desc()))).all()
     return logs
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import timedelta, datetime
 from app.core.database import get_db
 from app.core.security import verify_password, create_access_token
@@ -16,15 +16,15 @@ logger = logging.getLogger(__name__)
 @router.post("/login", response_model=Token)
 async def login(
     user_credentials: UserLogin,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Authenticate user and return access token."""
     try:
         username_input = user_credentials.username.strip()
         # Find user by username
-        user = db.query(User).filter(
+        user = await db.scalar(select(User).where(
             func.lower(User.username) == username_input.lower()
-        ).first()
+        ))
         
         if not user:
             logger.warning(f"Login attempt with non-existent username: {username_input}")
@@ -51,21 +51,22 @@ async def login(
             )
         
         # Update last login timestamp (non-blocking in readonly DB scenarios)
+        username = user.username
         try:
             user.last_login = datetime.utcnow()
-            db.commit()
+            await db.commit()
         except Exception as e:
-            db.rollback()
-            logger.warning(f"Could not update last_login for {user.username}: {e}")
+            await db.rollback()
+            logger.warning(f"Could not update last_login for {username}: {e}")
         
         # Create access token
         access_token_expires = timedelta(minutes=30)
         access_token = create_access_token(
-            data={"sub": user.username}, 
+            data={"sub": username}, 
             expires_delta=access_token_expires
         )
         
-        logger.info(f"Successful login for user: {user.username}")
+        logger.info(f"Successful login for user: {username}")
         
         return {
             "access_token": access_token,
@@ -84,15 +85,15 @@ async def login(
 @router.post("/token", response_model=Token)
 async def login_for_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """OAuth2 compatible token endpoint."""
     try:
         username_input = form_data.username.strip()
         # Find user by username
-        user = db.query(User).filter(
+        user = await db.scalar(select(User).where(
             func.lower(User.username) == username_input.lower()
-        ).first()
+        ))
         
         if not user:
             logger.warning(f"Login attempt with non-existent username: {username_input}")
@@ -119,21 +120,22 @@ async def login_for_access_token(
             )
         
         # Update last login timestamp (non-blocking in readonly DB scenarios)
+        username = user.username
         try:
             user.last_login = datetime.utcnow()
-            db.commit()
+            await db.commit()
         except Exception as e:
-            db.rollback()
-            logger.warning(f"Could not update last_login for {user.username}: {e}")
+            await db.rollback()
+            logger.warning(f"Could not update last_login for {username}: {e}")
         
         # Create access token
         access_token_expires = timedelta(minutes=30)
         access_token = create_access_token(
-            data={"sub": user.username}, 
+            data={"sub": username}, 
             expires_delta=access_token_expires
         )
         
-        logger.info(f"Successful login for user: {user.username}")
+        logger.info(f"Successful login for user: {username}")
         
         return {
             "access_token": access_token,
@@ -152,7 +154,7 @@ async def login_for_access_token(
 @router.post("/refresh", response_model=Token)
 async def refresh_token(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Refresh access token."""
     try:
@@ -1,13 +1,16 @@
 from typing import List, Dict, Any
 
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_current_user, get_audit_service
 from app.core.database import get_db
-from app.models.models import User, Evidence, Case
+from app.models.models import User, Evidence, Case, EvidenceHash, EvidenceIntegrityCheck, UploadSession
 from app.services.audit_service import AuditService
+from app.services.blob_store import release_stored_files, sync_archive_storage
 
 import logging
 
@@ -37,7 +40,7 @@ def ensure_bulk_permissions(current_user: User) -> None:
 async def bulk_update_evidence(
     bulk_update: BulkEvidenceUpdate,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     audit_service: AuditService = Depends(get_audit_service),
 ):
@@ -45,19 +48,29 @@ async def bulk_update_evidence(
     try:
         ensure_bulk_permissions(current_user)
 
-        existing_evidence = db.query(Evidence).filter(Evidence.id.in_(bulk_update.evidence_ids)).all()
+        existing_evidence = (
+            await db.scalars(select(Evidence).where(Evidence.id.in_(bulk_update.evidence_ids)))
+        ).all()
         if len(existing_evidence) != len(bulk_update.evidence_ids):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="One or more evidence records not found",
             )
 
-        updated_count = (
-            db.query(Evidence)
-            .filter(Evidence.id.in_(bulk_update.evidence_ids))
-            .update(bulk_update.updates, synchronize_session=False)
+        result = await db.execute(
+            update(Evidence)
+            .where(Evidence.id.in_(bulk_update.evidence_ids))
+            .values(bulk_update.updates)
+            .execution_options(synchronize_session=False)
         )
-        db.commit()
+        updated_count = result.rowcount
+        await db.commit()
+
+        if "status" in bulk_update.updates:
+            background_tasks.add_task(
+                sync_archive_storage,
+                [evidence.file_hash for evidence in existing_evidence if evidence.file_hash],
+            )
 
         background_tasks.add_task(
             log_bulk_operation,
@@ -75,7 +88,7 @@ async def bulk_update_evidence(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error("Bulk evidence update failed: %s", str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -87,7 +100,7 @@ async def bulk_update_evidence(
 async def bulk_update_cases(
     bulk_update: BulkCaseUpdate,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     audit_service: AuditService = Depends(get_audit_service),
 ):
@@ -95,19 +108,21 @@ async def bulk_update_cases(
     try:
         ensure_bulk_permissions(current_user)
 
-        existing_cases = db.query(Case).filter(Case.id.in_(bulk_update.case_ids)).all()
+        existing_cases = (await db.scalars(select(Case).where(Case.id.in_(bulk_update.case_ids)))).all()
         if len(existing_cases) != len(bulk_update.case_ids):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="One or more case records not found",
             )
 
-        updated_count = (
-            db.query(Case)
-            .filter(Case.id.in_(bulk_update.case_ids))
-            .update(bulk_update.updates, synchronize_session=False)
+        result = await db.execute(
+            update(Case)
+            .where(Case.id.in_(bulk_update.case_ids))
+            .values(bulk_update.updates)
+            .execution_options(synchronize_session=False)
         )
-        db.commit()
+        updated_count = result.rowcount
+        await db.commit()
 
         background_tasks.add_task(
             log_bulk_operation,
@@ -125,7 +140,7 @@ async def bulk_update_cases(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error("Bulk case update failed: %s", str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -137,7 +152,7 @@ async def bulk_update_cases(
 async def bulk_delete_evidence(
     evidence_ids: List[int],
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     audit_service: AuditService = Depends(get_audit_service),
 ):
@@ -145,15 +160,35 @@ async def bulk_delete_evidence(
     try:
         ensure_bulk_permissions(current_user)
 
-        existing_evidence = db.query(Evidence).filter(Evidence.id.in_(evidence_ids)).all()
+        existing_evidence = (await db.scalars(select(Evidence).where(Evidence.id.in_(evidence_ids)))).all()
         if len(existing_evidence) != len(evidence_ids):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="One or more evidence records not found",
             )
 
-        deleted_count = db.query(Evidence).filter(Evidence.id.in_(evidence_ids)).delete(synchronize_session=False)
-        db.commit()
+        stored_files = [(evidence.file_path, evidence.file_hash) for evidence in existing_evidence]
+
+        # Bulk deletes bypass ORM cascades, so clear dependent rows explicitly
+        no_sync = {"synchronize_session": False}
+        await db.execute(
+            delete(EvidenceHash).where(EvidenceHash.evidence_id.in_(evidence_ids)).execution_options(**no_sync)
+        )
+        await db.execute(
+            delete(UploadSession).where(UploadSession.evidence_id.in_(evidence_ids)).execution_options(**no_sync)
+        )
+        await db.execute(
+            delete(EvidenceIntegrityCheck)
+            .where(EvidenceIntegrityCheck.evidence_id.in_(evidence_ids))
+            .execution_options(**no_sync)
+        )
+        result = await db.execute(
+            delete(Evidence).where(Evidence.id.in_(evidence_ids)).execution_options(**no_sync)
+        )
+        deleted_count = result.rowcount
+        await db.commit()
+
+        await run_in_threadpool(release_stored_files, stored_files)
 
         background_tasks.add_task(
             log_bulk_operation,
@@ -171,7 +206,7 @@ async def bulk_delete_evidence(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error("Bulk evidence delete failed: %s", str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1,31 +1,39 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session, selectinload
-from sqlalchemy import desc
+from fastapi.responses import StreamingResponse
+from sqlalchemy import desc, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
+from urllib.parse import quote
 from datetime import datetime, timedelta
 from app.core.database import get_db
 from app.models.models import Case, User, Evidence, AuditLog, CaseStatus
 from app.schemas.schemas import (
     Case as CaseSchema, CaseCreate, CaseUpdate,
-    DashboardData, DashboardStats, RecentActivity
+    DashboardData, DashboardStats, RecentActivity, EvidenceArchiveRequest
 )
-from app.api.dependencies import get_current_user, get_audit_service
+from app.api.dependencies import Page, get_current_user, get_audit_service
+from app.api.loaders import AUDIT_LOG_LOAD_OPTIONS, CASE_LOAD_OPTIONS
 from app.services.audit_service import AuditService
+from app.services.evidence_export_service import EvidenceExportService
+from app.services.integrity_service import IntegrityService
+from app.utils.pagination import Keyset
 import logging
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+CASE_KEYSET = Keyset(Case.id)
+
 # ======================
 # Utility: generate_case_number
 # ======================
 
 
-def generate_case_number(db: Session) -> str:
+async def generate_case_number(db: AsyncSession) -> str:
     """
     Generate a unique case number in the format CASE-001, CASE-002, etc.
     """
-    last_case = db.query(Case).order_by(Case.id.desc()).first()
+    last_case = await db.scalar(select(Case).order_by(Case.id.desc()).limit(1))
     if last_case and last_case.case_number:
         last_number = int(last_case.case_number.split('-')[-1])
         new_number = last_number + 1
@@ -33,6 +41,17 @@ def generate_case_number(db: Session) -> str:
         new_number = 1
     return f"CASE-{new_number:03d}"
 
+
+async def _load_case(db: AsyncSession, case_id: int) -> Optional[Case]:
+    """Get a case with the users its schema nests, reloading it if already in the session."""
+    return await db.scalar(
+        select(Case)
+        .options(*CASE_LOAD_OPTIONS)
+        .where(Case.id == case_id)
+        .execution_options(populate_existing=True)
+    )
+
+
 # ======================
 # Dashboard
 # ======================
@@ -40,15 +59,15 @@ def generate_case_number(db: Session) -> str:
 
 @router.get("/dashboard", response_model=DashboardData)
 async def get_dashboard_data(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     try:
-        total_cases = db.query(Case).count()
-        active_evidence = db.query(Evidence).count()
-        pending_actions = db.query(Case).filter(
-            Case.status == CaseStatus.in_progress).count()
-        integrity_alerts = 2  # Hardcoded for now
+        total_cases = await db.scalar(select(func.count(Case.id)))
+        active_evidence = await db.scalar(select(func.count(Evidence.id)))
+        pending_actions = await db.scalar(select(func.count(Case.id)).where(
+            Case.status == CaseStatus.in_progress))
+        integrity_alerts = await db.run_sync(lambda session: IntegrityService(session).count_alerts())
 
         stats = DashboardStats(
             total_cases=total_cases,
@@ -57,14 +76,14 @@ async def get_dashboard_data(
             integrity_alerts=integrity_alerts
         )
 
-        recent_logs = (
-            db.query(AuditLog)
+        recent_logs = (await db.scalars(
+            select(AuditLog)
+            .options(*AUDIT_LOG_LOAD_OPTIONS)
             .join(User, AuditLog.user_id == User.id)
-            .filter(AuditLog.timestamp >= datetime.utcnow() - timedelta(days=7))
+            .where(AuditLog.timestamp >= datetime.utcnow() - timedelta(days=7))
             .order_by(desc(AuditLog.timestamp))
             .limit(10)
-            .all()
-        )
+        )).all()
 
         recent_activities = []
         for log in recent_logs:
@@ -135,43 +154,34 @@ async def get_dashboard_data(
 
 @router.get("/", response_model=List[CaseSchema])
 async def read_cases(
-    skip: int = 0,
-    limit: int = 100,
+    page: Page = Depends(),
     status: Optional[str] = None,
     assigned_to_me: bool = False,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    query = db.query(Case).options(
-        selectinload(Case.created_by_user),
-        selectinload(Case.assigned_to_user),
-        selectinload(Case.evidence_items)
-    )
+    query = select(Case).options(*CASE_LOAD_OPTIONS)
 
     if status:
         try:
             status_enum = CaseStatus(status)
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid case status")
-        query = query.filter(Case.status == status_enum)
+        query = query.where(Case.status == status_enum)
 
     if assigned_to_me:
-        query = query.filter(Case.assigned_to == current_user.id)
+        query = query.where(Case.assigned_to == current_user.id)
 
-    return query.offset(skip).limit(limit).all()
+    return await page.fetch(db, query, CASE_KEYSET)
 
 
 @router.get("/{case_id}", response_model=CaseSchema)
 async def read_case(
     case_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    case = db.query(Case).options(
-        selectinload(Case.created_by_user),
-        selectinload(Case.assigned_to_user),
-        selectinload(Case.evidence_items)
-    ).filter(Case.id == case_id).first()
+    case = await _load_case(db, case_id)
 
     if not case:
         raise HTTPException(
@@ -179,15 +189,84 @@ async def read_case(
     return case
 
 
+async def _stream_case_archive(
+    db: AsyncSession,
+    audit_service: AuditService,
+    case_id: int,
+    evidence_ids: Optional[List[int]] = None,
+) -> StreamingResponse:
+    case = await db.get(Case, case_id)
+    if not case:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Case not found")
+
+    service = EvidenceExportService(db)
+    items = await service.get_items(case_id, evidence_ids)
+    if evidence_ids is not None:
+        not_in_case = sorted(set(evidence_ids) - {item.id for item in items})
+        if not_in_case:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Evidence not found in this case: {', '.join(map(str, not_in_case))}"
+            )
+    if not items:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Case has no evidence")
+
+    await audit_service.log_action(
+        action="evidence_archive_downloaded",
+        entity_type="case",
+        entity_id=case.id,
+        details=f"Downloaded archive of {len(items)} evidence item(s) of case {case.case_number}",
+    )
+
+    filename = f"{case.case_number}-evidence.zip"
+    return StreamingResponse(
+        # Runs in a worker thread; the archive is built as the client reads it
+        service.stream_zip(items),
+        media_type="application/zip",
+        headers={"Content-Disposition": f"attachment; filename*=utf-8''{quote(filename)}"},
+    )
+
+
+@router.get("/{case_id}/evidence/archive")
+async def download_case_evidence_archive(
+    case_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    audit_service: AuditService = Depends(get_audit_service)
+):
+    """
+    Download all evidence files of a case as one ZIP64 archive.
+
+    The archive is streamed as it is built, without temp files, and ends
+    with a manifest.csv of evidence numbers and SHA-256 hashes.
+    """
+    return await _stream_case_archive(db, audit_service, case_id)
+
+
+@router.post("/{case_id}/evidence/archive")
+async def download_selected_evidence_archive(
+    case_id: int,
+    archive_request: EvidenceArchiveRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    audit_service: AuditService = Depends(get_audit_service)
+):
+    """Download selected evidence files of a case as one ZIP64 archive."""
+    evidence_ids = list(dict.fromkeys(archive_request.evidence_ids))
+    return await _stream_case_archive(db, audit_service, case_id, evidence_ids)
+
+
 @router.post("/", response_model=CaseSchema)
 async def create_case(
     case_create: CaseCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     audit_service: AuditService = Depends(get_audit_service)
 ):
     # Generate case number with DB passed
-    case_number = generate_case_number(db)
+    case_number = await generate_case_number(db)
 
     db_case = Case(
         case_number=case_number,
@@ -204,8 +283,7 @@ async def create_case(
     )
 
     db.add(db_case)
-    db.commit()
-    db.refresh(db_case)
+    await db.commit()
 
     await audit_service.log_action(
         action="case_created",
@@ -216,19 +294,19 @@ async def create_case(
 
     logger.info(
         f"Case created: {db_case.case_number} by {current_user.username}")
-    return db_case
+    return await _load_case(db, db_case.id)
 
 
 @router.put("/{case_id}", response_model=CaseSchema)
 async def update_case(
     case_id: int,
     case_update: CaseUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     audit_service: AuditService = Depends(get_audit_service)
 ):
     """Update a case. Only admin, manager, or assigned investigator can update."""
-    db_case = db.query(Case).filter(Case.id == case_id).first()
+    db_case = await db.get(Case, case_id)
     
     if not db_case:
         raise HTTPException(
@@ -254,8 +332,7 @@ async def update_case(
     for field, value in update_data.items():
         setattr(db_case, field, value)
     
-    db.commit()
-    db.refresh(db_case)
+    await db.commit()
     
     await audit_service.log_action(
         action="case_updated",
@@ -265,13 +342,13 @@ async def update_case(
     )
     
     logger.info(f"Case updated: {db_case.case_number} by {current_user.username}")
-    return db_case
+    return await _load_case(db, db_case.id)
 
 
 @router.delete("/{case_id}")
 async def delete_case(
     case_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     audit_service: AuditService = Depends(get_audit_service)
 ):
@@ -282,7 +359,7 @@ async def delete_case(
             detail="Not enough permissions"
         )
     
-    db_case = db.query(Case).filter(Case.id == case_id).first()
+    db_case = await db.get(Case, case_id)
     
     if not db_case:
         raise HTTPException(
@@ -290,8 +367,8 @@ async def delete_case(
     
     case_number = db_case.case_number
     
-    db.delete(db_case)
-    db.commit()
+    await db.delete(db_case)
+    await db.commit()
     
     await audit_service.log_action(
         action="case_deleted",
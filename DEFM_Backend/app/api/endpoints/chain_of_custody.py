@@ -1,41 +1,52 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from app.core.database import get_db
 from app.models.models import ChainOfCustody, Evidence, User
 from app.schemas.schemas import ChainOfCustody as ChainOfCustodySchema, ChainOfCustodyCreate
-from app.api.dependencies import get_current_user, get_audit_service
+from app.api.dependencies import Page, get_current_user, get_audit_service
+from app.api.loaders import CUSTODY_LOAD_OPTIONS
 from app.services.audit_service import AuditService
+from app.utils.pagination import Keyset
 import logging
 
 router = APIRouter(tags=["Chain of Custody"])
 logger = logging.getLogger(__name__)
 
+CUSTODY_KEYSET = Keyset(ChainOfCustody.id)
+
+
+async def _load_custody_record(db: AsyncSession, custody_id: int) -> Optional[ChainOfCustody]:
+    """Get a custody record with the user and evidence its schema nests."""
+    return await db.scalar(
+        select(ChainOfCustody)
+        .options(*CUSTODY_LOAD_OPTIONS)
+        .where(ChainOfCustody.id == custody_id)
+        .execution_options(populate_existing=True)
+    )
+
 # Get custody records for specific evidence - MUST be before /{custody_id}
 @router.get("/evidence/{evidence_id}", response_model=List[ChainOfCustodySchema])
 async def read_evidence_custody_chain(
     evidence_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get complete chain of custody for specific evidence."""
-    evidence = db.query(Evidence).filter(Evidence.id == evidence_id).first()
+    evidence = await db.get(Evidence, evidence_id)
     if not evidence:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Evidence not found"
         )
     
-    custody_records = (
-        db.query(ChainOfCustody)
-        .options(
-            selectinload(ChainOfCustody.handler_user),
-            selectinload(ChainOfCustody.evidence)
-        )
-        .filter(ChainOfCustody.evidence_id == evidence_id)
+    custody_records = (await db.scalars(
+        select(ChainOfCustody)
+        .options(*CUSTODY_LOAD_OPTIONS)
+        .where(ChainOfCustody.evidence_id == evidence_id)
         .order_by(ChainOfCustody.timestamp.desc())
-        .all()
-    )
+    )).all()
     
     return custody_records
 
@@ -43,46 +54,30 @@ async def read_evidence_custody_chain(
 # Main endpoint to list all custody records
 @router.get("/", response_model=List[ChainOfCustodySchema])
 async def read_chain_of_custody(
-    skip: int = 0,
-    limit: int = 100,
+    page: Page = Depends(),
     evidence_id: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get chain of custody records with optional filters."""
-    query = (
-        db.query(ChainOfCustody)
-        .options(
-            selectinload(ChainOfCustody.handler_user),
-            selectinload(ChainOfCustody.evidence)
-        )
-    )
+    query = select(ChainOfCustody).options(*CUSTODY_LOAD_OPTIONS)
     
     # Apply filters
     if evidence_id:
-        query = query.filter(ChainOfCustody.evidence_id == evidence_id)
+        query = query.where(ChainOfCustody.evidence_id == evidence_id)
     
-    custody_records = query.offset(skip).limit(limit).all()
-    return custody_records
+    return await page.fetch(db, query, CUSTODY_KEYSET)
 
 
 # Get custody record by ID - must be last
 @router.get("/{custody_id}", response_model=ChainOfCustodySchema)
 async def read_custody_record(
     custody_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get chain of custody record by ID."""
-    custody_record = (
-        db.query(ChainOfCustody)
-        .options(
-            selectinload(ChainOfCustody.handler_user),
-            selectinload(ChainOfCustody.evidence)
-        )
-        .filter(ChainOfCustody.id == custody_id)
-        .first()
-    )
+    custody_record = await _load_custody_record(db, custody_id)
     if custody_record is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -93,13 +88,13 @@ async def read_custody_record(
 @router.post("/", response_model=ChainOfCustodySchema)
 async def create_custody_record(
     custody_create: ChainOfCustodyCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     audit_service: AuditService = Depends(get_audit_service)
 ):
     """Create new chain of custody record."""
     # Verify evidence exists
-    evidence = db.query(Evidence).filter(Evidence.id == custody_create.evidence_id).first()
+    evidence = await db.get(Evidence, custody_create.evidence_id)
     if not evidence:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -108,7 +103,7 @@ async def create_custody_record(
     
     # Verify transferred_to user exists if specified
     if custody_create.transferred_to:
-        transferred_to_user = db.query(User).filter(User.id == custody_create.transferred_to).first()
+        transferred_to_user = await db.get(User, custody_create.transferred_to)
         if not transferred_to_user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -117,7 +112,7 @@ async def create_custody_record(
     
     # Verify transferred_from user exists if specified
     if custody_create.transferred_from:
-        transferred_from_user = db.query(User).filter(User.id == custody_create.transferred_from).first()
+        transferred_from_user = await db.get(User, custody_create.transferred_from)
         if not transferred_from_user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -136,8 +131,7 @@ async def create_custody_record(
     )
     
     db.add(db_custody)
-    db.commit()
-    db.refresh(db_custody)
+    await db.commit()
     
     # Log the action
     await audit_service.log_action(
@@ -148,7 +142,7 @@ async def create_custody_record(
     )
     
     logger.info(f"Custody record created for evidence {evidence.evidence_number} by {current_user.username}")
-    return db_custody
+    return await _load_custody_record(db, db_custody.id)
 
 @router.post("/transfer", response_model=ChainOfCustodySchema)
 async def transfer_evidence_custody(
@@ -157,13 +151,13 @@ async def transfer_evidence_custody(
     location: str,
     purpose: str,
     notes: Optional[str] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     audit_service: AuditService = Depends(get_audit_service)
 ):
     """Transfer evidence custody to another user."""
     # Verify evidence exists
-    evidence = db.query(Evidence).filter(Evidence.id == evidence_id).first()
+    evidence = await db.get(Evidence, evidence_id)
     if not evidence:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -171,7 +165,7 @@ async def transfer_evidence_custody(
         )
     
     # Verify target user exists
-    target_user = db.query(User).filter(User.id == transferred_to).first()
+    target_user = await db.get(User, transferred_to)
     if not target_user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -198,8 +192,7 @@ async def transfer_evidence_custody(
     )
     
     db.add(db_custody)
-    db.commit()
-    db.refresh(db_custody)
+    await db.commit()
     
     # Log the action
     await audit_service.log_action(
@@ -210,12 +203,12 @@ async def transfer_evidence_custody(
     )
     
     logger.info(f"Evidence {evidence.evidence_number} transferred from {current_user.username} to {target_user.username}")
-    return db_custody
+    return await _load_custody_record(db, db_custody.id)
 
 @router.delete("/{custody_id}")
 async def delete_custody_record(
     custody_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     audit_service: AuditService = Depends(get_audit_service)
 ):
@@ -226,7 +219,7 @@ async def delete_custody_record(
             detail="Not enough permissions"
         )
     
-    db_custody = db.query(ChainOfCustody).filter(ChainOfCustody.id == custody_id).first()
+    db_custody = await db.get(ChainOfCustody, custody_id)
     if db_custody is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -234,8 +227,8 @@ async def delete_custody_record(
         )
     
     custody_info = f"Evidence ID: {db_custody.evidence_id}, Action: {db_custody.action}"
-    db.delete(db_custody)
-    db.commit()
+    await db.delete(db_custody)
+    await db.commit()
     
     # Log the action
     await audit_service.log_action(
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.models.models import Case, Evidence, User
@@ -8,9 +9,9 @@ router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 
 
 @router.get("/stats")
-def get_dashboard_stats(db: Session = Depends(get_db)):
+async def get_dashboard_stats(db: AsyncSession = Depends(get_db)):
     return {
-        "total_cases": db.query(Case).count(),
-        "total_evidence": db.query(Evidence).count(),
-        "total_users": db.query(User).count(),
+        "total_cases": await db.scalar(select(func.count(Case.id))),
+        "total_evidence": await db.scalar(select(func.count(Evidence.id))),
+        "total_users": await db.scalar(select(func.count(User.id))),
     }
@@ -1,23 +1,63 @@
 from datetime import datetime
+import asyncio
+import json
+import mimetypes
 import os
+from functools import partial
 from typing import List, Optional
+from urllib.parse import quote
 
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
-from fastapi.responses import FileResponse
-from sqlalchemy.orm import Session, selectinload
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status, UploadFile, File
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_current_user, get_audit_service
+from app.api.dependencies import Page, get_current_user, get_audit_service
+from app.api.loaders import EVIDENCE_LOAD_OPTIONS
 from app.core.config import settings
-from app.core.database import get_db
-from app.models.models import Evidence, Case, User, EvidenceType, EvidenceStatus
+from app.core.database import AsyncSessionLocal, get_db
+from app.models.models import ArchiveMember, Evidence, Case, User, EvidenceType, EvidenceStatus, EvidenceMetadata, IntegrityOutcome
 from app.schemas.schemas import (
     Evidence as EvidenceSchema,
     EvidenceCreate,
     EvidenceUpdate,
     FileUpload,
+    EvidenceHash as EvidenceHashSchema,
+    IntegrityBatchRequest,
+    EvidenceMetadata as EvidenceMetadataSchema,
+    SimilarEvidence,
+    ArchiveManifest as ArchiveManifestSchema,
+    ArchiveMember as ArchiveMemberSchema,
 )
+from app.services.archive_service import ArchiveService, is_archive_evidence
 from app.services.audit_service import AuditService
-from app.utils.file_utils import validate_file, save_upload_file
+from app.services.blob_store import (
+    new_blob_temp_path,
+    open_stored_file,
+    release_stored_files,
+    replace_evidence_file,
+    stat_stored_file,
+    stored_file_exists,
+    sync_archive_storage,
+)
+from app.services.hash_pool import hash_pool
+from app.services.evidence_processing import evidence_pipeline
+from app.services.evidence_hash_service import EvidenceHashService, parse_hash_algorithms
+from app.services.integrity_service import IntegrityService
+from app.services.merkle_service import MerkleService
+from app.services.metadata_service import MetadataService
+from app.services.rendition_service import RENDITION_MEDIA_TYPE, RenditionService, is_image_evidence
+from app.services.similarity_service import SimilarityService
+from app.utils.perceptual_hash import HASH_TYPES
+from app.utils.file_utils import (
+    MultiHasher,
+    compute_file_digests,
+    save_upload_file,
+    validate_file,
+)
+from app.utils.http_range import RangeFileResponse
+from app.utils.pagination import Keyset
 
 import logging
 
@@ -25,81 +65,87 @@ router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
-def generate_evidence_number(db: Session) -> str:
+async def generate_evidence_number(db: AsyncSession) -> str:
     """Generate a sequential evidence number."""
-    last_evidence = db.query(Evidence).order_by(Evidence.id.desc()).first()
+    last_evidence = await db.scalar(select(Evidence).order_by(Evidence.id.desc()).limit(1))
     next_id = 1 if last_evidence is None else (last_evidence.id + 1)
     return f"EVD-{datetime.utcnow().strftime('%Y%m%d')}-{next_id:06d}"
 
 
 def compute_file_hash_from_path(file_path: str) -> str:
     """Compute SHA-256 hash for a file already stored on disk."""
-    import hashlib
+    return compute_file_digests(file_path, ["sha256"])["sha256"]
 
-    sha256_hash = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            sha256_hash.update(chunk)
-    return sha256_hash.hexdigest()
+
+async def _load_evidence(db: AsyncSession, evidence_id: int) -> Optional[Evidence]:
+    """Get evidence with the case and user its schema nests, reloading it if already in the session."""
+    return await db.scalar(
+        select(Evidence)
+        .options(*EVIDENCE_LOAD_OPTIONS)
+        .where(Evidence.id == evidence_id)
+        .execution_options(populate_existing=True)
+    )
 
 
 os.makedirs(settings.UPLOAD_DIRECTORY, exist_ok=True)
 
 
+EVIDENCE_KEYSET = Keyset(Evidence.id)
+# Archive order; member_index is only unique within one archive
+ARCHIVE_MEMBER_KEYSET = Keyset(ArchiveMember.member_index, ArchiveMember.id)
+
+
 @router.get("/", response_model=List[EvidenceSchema])
 async def read_evidence(
-    skip: int = 0,
-    limit: int = 100,
+    page: Page = Depends(),
     case_id: Optional[int] = None,
     evidence_type: Optional[str] = None,
     status: Optional[str] = None,
-    db: Session = Depends(get_db),
+    metadata_key: Optional[str] = Query(None, description="Only evidence whose file has this metadata field, e.g. exif.model"),
+    metadata_value: Optional[str] = Query(None, description="Exact value of metadata_key to match"),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get evidence with optional filters."""
-    query = db.query(Evidence).options(
-        selectinload(Evidence.collected_by_user),
-        selectinload(Evidence.case),
-        selectinload(Evidence.custody_records),
-    )
+    query = select(Evidence).options(*EVIDENCE_LOAD_OPTIONS)
 
     if case_id:
-        query = query.filter(Evidence.case_id == case_id)
+        query = query.where(Evidence.case_id == case_id)
 
     if evidence_type:
         try:
             evidence_type_enum = EvidenceType(evidence_type)
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid evidence type")
-        query = query.filter(Evidence.evidence_type == evidence_type_enum)
+        query = query.where(Evidence.evidence_type == evidence_type_enum)
 
     if status:
         try:
             evidence_status_enum = EvidenceStatus(status)
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid evidence status")
-        query = query.filter(Evidence.status == evidence_status_enum)
+        query = query.where(Evidence.status == evidence_status_enum)
 
-    return query.offset(skip).limit(limit).all()
+    if metadata_value is not None and not metadata_key:
+        raise HTTPException(status_code=400, detail="metadata_value requires metadata_key")
+
+    if metadata_key:
+        metadata_match = select(EvidenceMetadata.file_hash).where(EvidenceMetadata.key == metadata_key)
+        if metadata_value is not None:
+            metadata_match = metadata_match.where(EvidenceMetadata.value == metadata_value)
+        query = query.where(Evidence.file_hash.in_(metadata_match))
+
+    return await page.fetch(db, query, EVIDENCE_KEYSET)
 
 
 @router.get("/{evidence_id}", response_model=EvidenceSchema)
 async def read_evidence_item(
     evidence_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get evidence by ID."""
-    evidence = (
-        db.query(Evidence)
-        .options(
-            selectinload(Evidence.collected_by_user),
-            selectinload(Evidence.case),
-            selectinload(Evidence.custody_records),
-        )
-        .filter(Evidence.id == evidence_id)
-        .first()
-    )
+    evidence = await _load_evidence(db, evidence_id)
     if evidence is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -111,7 +157,7 @@ async def read_evidence_item(
 @router.post("/", response_model=EvidenceSchema)
 async def create_evidence(
     evidence_create: EvidenceCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     audit_service: AuditService = Depends(get_audit_service),
 ):
@@ -120,7 +166,7 @@ async def create_evidence(
     if not case_id:
         # Graceful fallback for legacy desktop bundles that may submit
         # empty case_id; attach to the most recently created case.
-        fallback_case = db.query(Case).order_by(Case.id.desc()).first()
+        fallback_case = await db.scalar(select(Case).order_by(Case.id.desc()).limit(1))
         if not fallback_case:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -128,7 +174,7 @@ async def create_evidence(
             )
         case_id = fallback_case.id
 
-    case = db.query(Case).filter(Case.id == case_id).first()
+    case = await db.get(Case, case_id)
     if not case:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -136,7 +182,7 @@ async def create_evidence(
         )
 
     db_evidence = Evidence(
-        evidence_number=generate_evidence_number(db),
+        evidence_number=await generate_evidence_number(db),
         case_id=case_id,
         title=evidence_create.title,
         description=evidence_create.description,
@@ -148,8 +194,7 @@ async def create_evidence(
     )
 
     db.add(db_evidence)
-    db.commit()
-    db.refresh(db_evidence)
+    await db.commit()
 
     await audit_service.log_action(
         action="evidence_created",
@@ -163,19 +208,19 @@ async def create_evidence(
         db_evidence.evidence_number,
         current_user.username,
     )
-    return db_evidence
+    return await _load_evidence(db, db_evidence.id)
 
 
 @router.post("/{evidence_id}/upload", response_model=FileUpload)
 async def upload_evidence_file(
     evidence_id: int,
     file: UploadFile = File(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     audit_service: AuditService = Depends(get_audit_service),
 ):
     """Upload file for evidence and persist computed SHA-256 hash."""
-    evidence = db.query(Evidence).filter(Evidence.id == evidence_id).first()
+    evidence = await db.get(Evidence, evidence_id)
     if not evidence:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -185,23 +230,16 @@ async def upload_evidence_file(
     await validate_file(file)
 
     try:
-        upload_dir = os.path.join(
-            settings.UPLOAD_DIRECTORY,
-            str(evidence.case_id),
-            str(evidence_id),
+        hasher = MultiHasher(merkle_chunk_size=settings.MERKLE_CHUNK_SIZE)
+        temp_path, file_size, file_hash = await save_upload_file(file, new_blob_temp_path(), hasher)
+        await replace_evidence_file(
+            db, evidence, temp_path, file_hash, file_size, file.filename, file.content_type
         )
-        file_path = os.path.join(upload_dir, file.filename)
-
-        saved_path, file_size, file_hash = await save_upload_file(file, file_path)
 
-        evidence.file_name = file.filename
-        evidence.file_path = saved_path
-        evidence.file_size = file_size
-        evidence.file_hash = file_hash
-        evidence.mime_type = file.content_type
-
-        db.commit()
-        db.refresh(evidence)
+        digests = hasher.hexdigests()
+        await EvidenceHashService(db).record_hashes(evidence, digests)
+        await MerkleService(db).record_tree(file_hash, hasher.merkle)
+        evidence_pipeline.submit(evidence_id)
 
         await audit_service.log_action(
             action="file_uploaded",
@@ -222,6 +260,7 @@ async def upload_evidence_file(
             content_type=file.content_type or "application/octet-stream",
             file_size=file_size,
             file_hash=file_hash,
+            hashes=digests,
         )
     except HTTPException:
         raise
@@ -236,27 +275,329 @@ async def upload_evidence_file(
 @router.get("/{evidence_id}/download")
 async def download_evidence_file(
     evidence_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Download evidence file."""
-    evidence = db.query(Evidence).filter(Evidence.id == evidence_id).first()
+    evidence = await db.get(Evidence, evidence_id)
     if not evidence or not evidence.file_path:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Evidence file not found",
         )
-    if not os.path.exists(evidence.file_path):
+    if not await run_in_threadpool(stored_file_exists, evidence.file_path):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Physical file not found",
         )
 
     filename = evidence.file_name or os.path.basename(evidence.file_path)
-    return FileResponse(
+    # The stored hash is a strong validator, so browsers can resume and
+    # seek (e.g. scrub through video) with Range/If-Range requests
+    if os.path.exists(evidence.file_path):
+        return RangeFileResponse(
+            path=evidence.file_path,
+            media_type=evidence.mime_type or "application/octet-stream",
+            filename=filename,
+            etag=evidence.file_hash,
+        )
+
+    # Archived (compressed) file: only the frames covering each range are inflated
+    size, mtime = await run_in_threadpool(stat_stored_file, evidence.file_path)
+    return RangeFileResponse(
         path=evidence.file_path,
         media_type=evidence.mime_type or "application/octet-stream",
         filename=filename,
+        etag=evidence.file_hash,
+        opener=partial(open_stored_file, evidence.file_path),
+        size=size,
+        mtime=mtime,
+    )
+
+
+@router.get("/{evidence_id}/thumbnail")
+async def get_evidence_thumbnail(
+    evidence_id: int,
+    size: int = Query(256, description="Longest edge in pixels, one of THUMBNAIL_SIZES"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get a cached preview of image evidence.
+
+    Renditions are keyed by the file hash and never change, so they are
+    served with long-lived cache headers.
+    """
+    sizes = RenditionService.sizes()
+    if size not in sizes:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported thumbnail size, use one of: {', '.join(map(str, sizes))}",
+        )
+
+    evidence = await db.get(Evidence, evidence_id)
+    if not evidence or not evidence.file_path:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Evidence file not found",
+        )
+
+    try:
+        path = await RenditionService().get_rendition(evidence, size)
+    except Exception as e:
+        logger.error("Thumbnail rendering failed for %s: %s", evidence.evidence_number, str(e))
+        path = None
+    if path is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No thumbnail available for this evidence",
+        )
+
+    return RangeFileResponse(
+        path=path,
+        media_type=RENDITION_MEDIA_TYPE,
+        etag=f"{evidence.file_hash}-{size}",
+        content_disposition_type="inline",
+        headers={"Cache-Control": "private, max-age=31536000, immutable"},
+    )
+
+
+@router.get("/{evidence_id}/metadata", response_model=List[EvidenceMetadataSchema])
+async def get_evidence_metadata(
+    evidence_id: int,
+    refresh: bool = Query(False, description="Parse the file again instead of using stored metadata"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get the metadata embedded in an evidence file (EXIF, GPS, document properties).
+
+    Metadata is extracted after upload; a file that has not been processed
+    yet is parsed now.
+    """
+    evidence = await db.get(Evidence, evidence_id)
+    if not evidence or not evidence.file_path:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Evidence file not found",
+        )
+
+    try:
+        rows = await MetadataService(db).extract(evidence, force=refresh)
+    except Exception as e:
+        logger.error("Metadata extraction failed for %s: %s", evidence.evidence_number, str(e))
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Metadata could not be read from the evidence file",
+        )
+    return rows or []
+
+
+@router.get("/{evidence_id}/similar", response_model=List[SimilarEvidence])
+async def find_similar_evidence(
+    evidence_id: int,
+    max_distance: int = Query(8, ge=0, le=20, description="Maximum Hamming distance between 64-bit hashes"),
+    hash_type: str = Query("phash", description="Perceptual hash to compare: phash, dhash or ahash"),
+    limit: int = Query(50, ge=1, le=500),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Find visually similar image evidence across all cases.
+
+    Matches resized or recompressed copies that an exact file hash misses,
+    nearest first. Other evidence with identical content has distance 0.
+    """
+    if hash_type not in HASH_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported hash type, use one of: {', '.join(HASH_TYPES)}",
+        )
+
+    evidence = await db.get(Evidence, evidence_id)
+    if not evidence or not evidence.file_path or not evidence.file_hash:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Evidence file not found",
+        )
+    if not is_image_evidence(evidence):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Similarity search is only available for image evidence",
+        )
+
+    evidence_number = evidence.evidence_number
+    service = SimilarityService(db)
+    try:
+        image_hash = await service.compute(evidence)
+    except Exception as e:
+        logger.error("Perceptual hashing failed for %s: %s", evidence_number, str(e))
+        image_hash = None
+    if image_hash is None:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Image could not be decoded",
+        )
+
+    matches = await service.find_similar(evidence_id, image_hash, hash_type, max_distance, limit)
+    return [
+        SimilarEvidence(
+            evidence_id=other.id,
+            evidence_number=other.evidence_number,
+            case_id=other.case_id,
+            title=other.title,
+            file_name=other.file_name,
+            file_hash=other.file_hash,
+            distance=distance,
+        )
+        for other, distance in matches
+    ]
+
+
+async def _get_archive_evidence(db: AsyncSession, evidence_id: int) -> Evidence:
+    evidence = await db.get(Evidence, evidence_id)
+    if not evidence or not evidence.file_path or not evidence.file_hash:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Evidence file not found",
+        )
+    if not is_archive_evidence(evidence):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Evidence file is not a zip, 7z or rar archive",
+        )
+    return evidence
+
+
+async def _get_archive_manifest(db: AsyncSession, evidence: Evidence, force: bool = False):
+    try:
+        manifest = await ArchiveService(db).index(evidence, force=force)
+    except Exception as e:
+        logger.error("Archive indexing failed for %s: %s", evidence.evidence_number, str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Archive could not be indexed",
+        )
+    if manifest is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Evidence file is not a readable archive",
+        )
+    return manifest
+
+
+@router.get("/{evidence_id}/archive", response_model=ArchiveManifestSchema)
+async def get_archive_manifest(
+    evidence_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get the member manifest of archive evidence.
+
+    Archives are listed after upload; one that has not been listed yet is
+    indexed now.
+    """
+    evidence = await _get_archive_evidence(db, evidence_id)
+    return await _get_archive_manifest(db, evidence)
+
+
+@router.post("/{evidence_id}/archive/index", response_model=ArchiveManifestSchema)
+async def reindex_archive(
+    evidence_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    audit_service: AuditService = Depends(get_audit_service),
+):
+    """Rebuild the member manifest of archive evidence."""
+    evidence = await _get_archive_evidence(db, evidence_id)
+    manifest = await _get_archive_manifest(db, evidence, force=True)
+
+    await audit_service.log_action(
+        action="archive_indexed",
+        entity_type="evidence",
+        entity_id=evidence.id,
+        details=f"Indexed {manifest.member_count} archive members of evidence {evidence.evidence_number}",
+    )
+    return manifest
+
+
+@router.get("/{evidence_id}/archive/members", response_model=List[ArchiveMemberSchema])
+async def list_archive_members(
+    evidence_id: int,
+    page: Page = Depends(),
+    prefix: Optional[str] = Query(None, description="Only members whose path starts with this"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """List the members of archive evidence in archive order, with their SHA-256."""
+    evidence = await _get_archive_evidence(db, evidence_id)
+    await _get_archive_manifest(db, evidence)
+    query = ArchiveService(db).members_query(evidence.file_hash, prefix=prefix)
+    return await page.fetch(db, query, ARCHIVE_MEMBER_KEYSET)
+
+
+@router.get("/{evidence_id}/archive/members/{member_id}/download")
+async def download_archive_member(
+    evidence_id: int,
+    member_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    audit_service: AuditService = Depends(get_audit_service),
+):
+    """
+    Download a single archive member.
+
+    The member is decompressed as it is sent; the archive is never
+    extracted to disk.
+    """
+    evidence = await _get_archive_evidence(db, evidence_id)
+    service = ArchiveService(db)
+    manifest = await service.get_manifest(evidence.file_hash)
+    member = await service.get_member(evidence.file_hash, member_id) if manifest else None
+    if member is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Archive member not found",
+        )
+    if member.is_dir:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Archive member is a directory",
+        )
+    if member.encrypted:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Archive member is encrypted",
+        )
+    if not await run_in_threadpool(stored_file_exists, evidence.file_path):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Physical file not found",
+        )
+
+    await audit_service.log_action(
+        action="archive_member_downloaded",
+        entity_type="evidence",
+        entity_id=evidence.id,
+        details=f"Downloaded archive member {member.path} of evidence {evidence.evidence_number}",
+    )
+
+    filename = os.path.basename(member.path.rstrip("/")) or f"member-{member.member_index}"
+    quoted = quote(filename)
+    headers = {
+        "Content-Disposition": (
+            f"attachment; filename*=utf-8''{quoted}" if quoted != filename
+            else f'attachment; filename="{filename}"'
+        ),
+        "Content-Length": str(member.size),
+    }
+    if member.sha256:
+        headers["ETag"] = f'"{member.sha256}"'
+    return StreamingResponse(
+        ArchiveService.stream_member(evidence.file_path, manifest.archive_format, member.path),
+        media_type=mimetypes.guess_type(filename)[0] or "application/octet-stream",
+        headers=headers,
     )
 
 
@@ -264,12 +605,13 @@ async def download_evidence_file(
 async def update_evidence(
     evidence_id: int,
     evidence_update: EvidenceUpdate,
-    db: Session = Depends(get_db),
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     audit_service: AuditService = Depends(get_audit_service),
 ):
     """Update evidence."""
-    db_evidence = db.query(Evidence).filter(Evidence.id == evidence_id).first()
+    db_evidence = await db.get(Evidence, evidence_id)
     if db_evidence is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -277,11 +619,15 @@ async def update_evidence(
         )
 
     update_data = evidence_update.model_dump(exclude_unset=True)
+    previous_status = db_evidence.status
     for field, value in update_data.items():
         setattr(db_evidence, field, value)
 
-    db.commit()
-    db.refresh(db_evidence)
+    await db.commit()
+
+    if db_evidence.status != previous_status and db_evidence.file_hash:
+        # Compress the file once archived, restore it when un-archived
+        background_tasks.add_task(sync_archive_storage, [db_evidence.file_hash])
 
     await audit_service.log_action(
         action="evidence_updated",
@@ -295,13 +641,13 @@ async def update_evidence(
         db_evidence.evidence_number,
         current_user.username,
     )
-    return db_evidence
+    return await _load_evidence(db, db_evidence.id)
 
 
 @router.delete("/{evidence_id}")
 async def delete_evidence(
     evidence_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     audit_service: AuditService = Depends(get_audit_service),
 ):
@@ -312,7 +658,7 @@ async def delete_evidence(
             detail="Not enough permissions",
         )
 
-    db_evidence = db.query(Evidence).filter(Evidence.id == evidence_id).first()
+    db_evidence = await db.get(Evidence, evidence_id)
     if db_evidence is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -320,15 +666,12 @@ async def delete_evidence(
         )
 
     evidence_number = db_evidence.evidence_number
+    file_path, file_hash = db_evidence.file_path, db_evidence.file_hash
 
-    if db_evidence.file_path and os.path.exists(db_evidence.file_path):
-        try:
-            os.remove(db_evidence.file_path)
-        except Exception as e:
-            logger.error("Failed to delete physical file: %s", str(e))
+    await db.delete(db_evidence)
+    await db.commit()
 
-    db.delete(db_evidence)
-    db.commit()
+    await run_in_threadpool(release_stored_files, [(file_path, file_hash)])
 
     await audit_service.log_action(
         action="evidence_deleted",
@@ -341,15 +684,41 @@ async def delete_evidence(
     return {"message": "Evidence deleted successfully"}
 
 
+@router.get("/{evidence_id}/hashes", response_model=List[EvidenceHashSchema])
+async def read_evidence_hashes(
+    evidence_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Get every digest recorded for the evidence file."""
+    evidence = await db.get(Evidence, evidence_id)
+    if not evidence:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Evidence not found",
+        )
+    return await EvidenceHashService(db).list_hashes(evidence_id)
+
+
 @router.post("/{evidence_id}/verify-integrity")
 async def verify_evidence_integrity(
     evidence_id: int,
-    db: Session = Depends(get_db),
+    algorithms: Optional[str] = None,
+    force: bool = Query(False, description="Re-read the file even if a recent result for it is cached"),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     audit_service: AuditService = Depends(get_audit_service),
 ):
-    """Verify evidence file integrity using hash comparison."""
-    evidence = db.query(Evidence).filter(Evidence.id == evidence_id).first()
+    """
+    Verify evidence file integrity using hash comparison.
+
+    ``algorithms`` is a comma-separated list (or ``all``) of digests to
+    check; SHA-256 is always checked. All digests are computed in one pass.
+    A result computed within HASH_CACHE_TTL_SECONDS for the same, unchanged
+    file is reused unless ``force`` is set.
+    """
+    requested_algorithms = parse_hash_algorithms(algorithms)
+    evidence = await db.get(Evidence, evidence_id)
     if not evidence:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -362,14 +731,44 @@ async def verify_evidence_integrity(
             detail="No file or hash information available",
         )
 
-    if not os.path.exists(evidence.file_path):
+    if not await run_in_threadpool(stored_file_exists, evidence.file_path):
+        # The integrity service is shared with the scanner thread and stays synchronous
+        await db.run_sync(lambda session: IntegrityService(session).record_result(evidence, IntegrityOutcome.missing))
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Physical file not found",
         )
 
-    current_hash = compute_file_hash_from_path(evidence.file_path)
-    integrity_verified = current_hash == evidence.file_hash
+    expected_digests = await EvidenceHashService(db).get_hashes(evidence)
+    missing = [alg for alg in requested_algorithms if alg not in expected_digests]
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"No recorded {', '.join(missing)} digest for this evidence",
+        )
+
+    current_digests, cached_at = await hash_pool.verified_digests(
+        evidence.file_path, requested_algorithms, force=force
+    )
+    current_hash = current_digests["sha256"]
+    result_source = "cached" if cached_at is not None else "fresh"
+    hash_results = {
+        algorithm: {
+            "expected": expected_digests[algorithm],
+            "current": digest,
+            "verified": digest == expected_digests[algorithm],
+        }
+        for algorithm, digest in current_digests.items()
+    }
+    integrity_verified = all(result["verified"] for result in hash_results.values())
+
+    if cached_at is None:
+        # A cached result says nothing new about the file, so it must not
+        # postpone the scanner's next real check
+        outcome = IntegrityOutcome.passed if integrity_verified else IntegrityOutcome.failed
+        await db.run_sync(
+            lambda session: IntegrityService(session).record_result(evidence, outcome, current_hash)
+        )
 
     await audit_service.log_action(
         action="integrity_check",
@@ -377,7 +776,10 @@ async def verify_evidence_integrity(
         entity_id=evidence_id,
         details=(
             f"Integrity check for {evidence.evidence_number}: "
-            f"{'PASSED' if integrity_verified else 'FAILED'}"
+            f"{'PASSED' if integrity_verified else 'FAILED'} "
+            f"({', '.join(sorted(hash_results))}; {result_source} result"
+            + (f" computed at {datetime.utcfromtimestamp(cached_at).isoformat()}" if cached_at is not None else "")
+            + ")"
         ),
     )
 
@@ -387,5 +789,153 @@ async def verify_evidence_integrity(
         "integrity_verified": integrity_verified,
         "original_hash": evidence.file_hash,
         "current_hash": current_hash,
+        "hashes": hash_results,
+        "result_source": result_source,
+        "cached_at": datetime.utcfromtimestamp(cached_at).isoformat() if cached_at is not None else None,
         "checked_at": datetime.utcnow().isoformat(),
     }
+
+
+@router.post("/{evidence_id}/verify-chunks")
+async def verify_evidence_chunks(
+    evidence_id: int,
+    sample: int = Query(default=0, ge=0, description="Number of random chunks to check, 0 for all"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    audit_service: AuditService = Depends(get_audit_service),
+):
+    """
+    Verify evidence file integrity chunk by chunk against its Merkle tree.
+
+    Chunks are hashed in parallel; with ``sample`` only that many random
+    chunks are checked for a quick spot check. Mismatches are reported as
+    exact byte ranges.
+    """
+    evidence = await db.get(Evidence, evidence_id)
+    if not evidence:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Evidence not found",
+        )
+
+    if not evidence.file_path or not evidence.file_hash:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No file or hash information available",
+        )
+
+    if not await run_in_threadpool(stored_file_exists, evidence.file_path):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Physical file not found",
+        )
+
+    merkle_service = MerkleService(db)
+    tree = await merkle_service.get_tree(evidence.file_hash)
+    if tree is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No chunk hashes recorded for this evidence file",
+        )
+
+    report = await merkle_service.verify_chunks(evidence, tree, sample)
+
+    await audit_service.log_action(
+        action="integrity_check_chunks",
+        entity_type="evidence",
+        entity_id=evidence_id,
+        details=(
+            f"Chunk integrity check for {evidence.evidence_number}: "
+            f"{'PASSED' if report['integrity_verified'] else 'FAILED'} "
+            f"({report['checked_chunks']}/{report['total_chunks']} chunks, "
+            f"{len(report['corrupted_chunks'])} corrupted)"
+        ),
+    )
+
+    report["checked_at"] = datetime.utcnow().isoformat()
+    return report
+
+
+@router.post("/verify-integrity/batch")
+async def verify_evidence_integrity_batch(
+    batch_request: IntegrityBatchRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    audit_service: AuditService = Depends(get_audit_service),
+):
+    """
+    Verify a list of evidence files, streaming one NDJSON result per line
+    as each file finishes hashing.
+    """
+    evidence_ids = list(dict.fromkeys(batch_request.evidence_ids))
+    found = {
+        evidence.id: (evidence.evidence_number, evidence.file_path, evidence.file_hash)
+        for evidence in await db.scalars(select(Evidence).where(Evidence.id.in_(evidence_ids)))
+    }
+
+    await audit_service.log_action(
+        action="integrity_check_batch",
+        entity_type="evidence",
+        details=(
+            f"Batch integrity check requested for {len(evidence_ids)} evidence item(s)"
+            + (" (forced re-read)" if batch_request.force else "")
+        ),
+    )
+
+    # Submit no more files at once than the hashing queue holds, so a large
+    # batch waits for its own earlier files instead of being turned away
+    submissions = asyncio.Semaphore(hash_pool.max_queue)
+
+    async def verify_one(evidence_id: int) -> dict:
+        if evidence_id not in found:
+            return {"evidence_id": evidence_id, "error": "Evidence not found"}
+
+        evidence_number, file_path, file_hash = found[evidence_id]
+        result = {"evidence_id": evidence_id, "evidence_number": evidence_number}
+        if not file_path or not file_hash:
+            return {**result, "error": "No file or hash information available"}
+        if not await run_in_threadpool(stored_file_exists, file_path):
+            return {**result, "outcome": IntegrityOutcome.missing.value, "integrity_verified": False}
+
+        try:
+            async with submissions:
+                digests, cached_at = await hash_pool.verified_digests(
+                    file_path, ["sha256"], force=batch_request.force
+                )
+        except HTTPException as e:
+            # The queue was filled by other requests; the client can retry this item
+            return {**result, "error": e.detail, "retry_after": (e.headers or {}).get("Retry-After")}
+        except Exception as e:
+            return {**result, "error": f"Failed to hash file: {str(e)}"}
+        integrity_verified = digests["sha256"] == file_hash
+        return {
+            **result,
+            "outcome": (IntegrityOutcome.passed if integrity_verified else IntegrityOutcome.failed).value,
+            "integrity_verified": integrity_verified,
+            "original_hash": file_hash,
+            "current_hash": digests["sha256"],
+            "result_source": "cached" if cached_at is not None else "fresh",
+            "cached_at": datetime.utcfromtimestamp(cached_at).isoformat() if cached_at is not None else None,
+        }
+
+    async def stream_results():
+        # The request session is closed once streaming starts, so results
+        # are recorded through a session owned by the stream.
+        async with AsyncSessionLocal() as results_db:
+            for next_result in asyncio.as_completed([verify_one(i) for i in evidence_ids]):
+                result = await next_result
+                result["checked_at"] = datetime.utcnow().isoformat()
+                if "outcome" in result and result.get("result_source") != "cached":
+                    evidence = await results_db.get(Evidence, result["evidence_id"])
+                    if evidence is not None:
+                        await results_db.run_sync(
+                            lambda session: IntegrityService(session).record_result(
+                                evidence,
+                                IntegrityOutcome(result["outcome"]),
+                                result.get("current_hash"),
+                                source="batch",
+                            )
+                        )
+                yield json.dumps(result) + "\n"
+
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
@@ -3,8 +3,8 @@ from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from pydantic import BaseModel
-from sqlalchemy import desc
-from sqlalchemy.orm import Session
+from sqlalchemy import desc, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_current_user
 from app.core.database import get_db
@@ -28,19 +28,18 @@ class NotificationResponse(BaseModel):
 async def get_notifications(
     unread_only: bool = Query(False, description="Show only unread notifications"),
     limit: int = Query(50, le=100, description="Maximum number of notifications to return"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get user notifications derived from recent audit logs."""
     try:
         week_ago = datetime.utcnow() - timedelta(days=7)
-        audit_logs = (
-            db.query(AuditLog)
-            .filter(AuditLog.user_id == current_user.id, AuditLog.timestamp >= week_ago)
+        audit_logs = (await db.scalars(
+            select(AuditLog)
+            .where(AuditLog.user_id == current_user.id, AuditLog.timestamp >= week_ago)
             .order_by(desc(AuditLog.timestamp))
             .limit(limit)
-            .all()
-        )
+        )).all()
 
         notifications: List[NotificationResponse] = []
         for log in audit_logs:
@@ -78,7 +77,7 @@ async def get_notifications(
 @router.post("/mark-read/{notification_id}")
 async def mark_notification_read(
     notification_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Mark a notification as read (placeholder implementation)."""
@@ -94,7 +93,7 @@ async def mark_notification_read(
 
 @router.post("/mark-all-read")
 async def mark_all_notifications_read(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Mark all notifications as read (placeholder implementation)."""
@@ -110,16 +109,15 @@ async def mark_all_notifications_read(
 
 @router.get("/count")
 async def get_notification_count(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get count of recent notifications."""
     try:
         week_ago = datetime.utcnow() - timedelta(days=7)
-        count = (
-            db.query(AuditLog)
-            .filter(AuditLog.user_id == current_user.id, AuditLog.timestamp >= week_ago)
-            .count()
+        count = await db.scalar(
+            select(func.count(AuditLog.id))
+            .where(AuditLog.user_id == current_user.id, AuditLog.timestamp >= week_ago)
         )
         return {"unread_count": count}
     except Exception as e:
@@ -1,58 +1,67 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Response
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 import os
 from app.core.database import get_db
 from app.models.models import Report, Case, User
 from app.schemas.schemas import Report as ReportSchema, ReportCreate
-from app.api.dependencies import get_current_user, get_audit_service
+from app.api.dependencies import Page, get_current_user, get_audit_service
+from app.api.loaders import REPORT_LOAD_OPTIONS
 from app.services.audit_service import AuditService
 from app.services.report_service import ReportService
+from app.utils.http_range import RangeFileResponse
+from app.utils.pagination import Keyset
 
 import logging
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Newest reports first
+REPORT_KEYSET = Keyset(Report.generated_at, Report.id, descending=True)
+
 # Ensure reports directory exists
 os.makedirs("./reports", exist_ok=True)
+
+
+async def _load_report(db: AsyncSession, report_id: int) -> Optional[Report]:
+    """Get a report with the case its schema nests."""
+    return await db.scalar(
+        select(Report)
+        .options(*REPORT_LOAD_OPTIONS)
+        .where(Report.id == report_id)
+        .execution_options(populate_existing=True)
+    )
+
     
 @router.get("/", response_model=List[ReportSchema])
 async def read_reports(
-    skip: int = 0,
-    limit: int = 100,
+    page: Page = Depends(),
     case_id: Optional[int] = None,
     report_type: Optional[str] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get reports with optional filters."""
-    query = db.query(Report)
+    query = select(Report).options(*REPORT_LOAD_OPTIONS)
     
     # Apply filters
     if case_id:
-        query = query.filter(Report.case_id == case_id)
+        query = query.where(Report.case_id == case_id)
     if report_type:
-        query = query.filter(Report.report_type == report_type)
+        query = query.where(Report.report_type == report_type)
 
-    # Always return newest reports first.
-    reports = (
-        query.order_by(desc(Report.generated_at), desc(Report.id))
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
-    return reports
+    return await page.fetch(db, query, REPORT_KEYSET)
 
 @router.get("/{report_id}", response_model=ReportSchema)
 async def read_report(
     report_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get report by ID."""
-    report = db.query(Report).filter(Report.id == report_id).first()
+    report = await _load_report(db, report_id)
     if report is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -63,13 +72,13 @@ async def read_report(
 @router.post("/", response_model=ReportSchema)
 async def create_report(
     report_create: ReportCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     audit_service: AuditService = Depends(get_audit_service)
 ):
     """Create new report."""
     # Verify case exists
-    case = db.query(Case).filter(Case.id == report_create.case_id).first()
+    case = await db.get(Case, report_create.case_id)
     if not case:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -85,8 +94,7 @@ async def create_report(
     )
     
     db.add(db_report)
-    db.commit()
-    db.refresh(db_report)
+    await db.commit()
     
     # Log the action
     await audit_service.log_action(
@@ -97,7 +105,7 @@ async def create_report(
     )
     
     logger.info(f"Report created: {db_report.title} by {current_user.username}")
-    return db_report
+    return await _load_report(db, db_report.id)
 
 @router.post("/generate/{case_id}")
 async def generate_case_report(
@@ -106,13 +114,13 @@ async def generate_case_report(
     include_evidence: bool = True,
     include_custody: bool = True,
     format: str = "pdf",
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     audit_service: AuditService = Depends(get_audit_service)
 ):
     """Generate comprehensive case report."""
     # Verify case exists
-    case = db.query(Case).filter(Case.id == case_id).first()
+    case = await db.get(Case, case_id)
     if not case:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -162,12 +170,12 @@ async def generate_case_report(
 @router.get("/{report_id}/download")
 async def download_report(
     report_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     audit_service: AuditService = Depends(get_audit_service)
 ):
     """Download report file."""
-    report = db.query(Report).filter(Report.id == report_id).first()
+    report = await db.get(Report, report_id)
     if not report:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -201,30 +209,17 @@ async def download_report(
     elif file_extension == ".docx":
         content_type = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
     
-    # Read file content
-    try:
-        with open(report.file_path, 'rb') as f:
-            file_content = f.read()
-        
-        filename = os.path.basename(report.file_path)
-        
-        return Response(
-            content=file_content,
-            media_type=content_type,
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
-        )
-        
-    except Exception as e:
-        logger.error(f"File download error: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to download report file"
-        )
+    # Stream from disk rather than loading the whole report into memory
+    return RangeFileResponse(
+        path=report.file_path,
+        media_type=content_type,
+        filename=os.path.basename(report.file_path),
+    )
 
 @router.delete("/{report_id}")
 async def delete_report(
     report_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     audit_service: AuditService = Depends(get_audit_service)
 ):
@@ -235,7 +230,7 @@ async def delete_report(
             detail="Not enough permissions"
         )
     
-    db_report = db.query(Report).filter(Report.id == report_id).first()
+    db_report = await db.get(Report, report_id)
     if db_report is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -251,8 +246,8 @@ async def delete_report(
         except Exception as e:
             logger.error(f"Failed to delete report file: {str(e)}")
     
-    db.delete(db_report)
-    db.commit()
+    await db.delete(db_report)
+    await db.commit()
     
     # Log the action
     await audit_service.log_action(
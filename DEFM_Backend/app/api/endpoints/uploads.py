@@ -0,0 +1,237 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies import get_current_user, get_audit_service
+from app.core.config import settings
+from app.core.database import get_db
+from app.models.models import Evidence, User, UploadSessionStatus
+from app.schemas.schemas import (
+    FileUpload,
+    UploadSession as UploadSessionSchema,
+    UploadSessionCreate,
+)
+from app.services.audit_service import AuditService
+from app.services.blob_store import new_blob_temp_path, replace_evidence_file
+from app.services.evidence_hash_service import EvidenceHashService
+from app.services.evidence_processing import evidence_pipeline
+from app.services.merkle_service import MerkleService
+from app.services.upload_service import ChunkedUploadService
+from app.utils.file_utils import MultiHasher, validate_file_extension
+
+import logging
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+
+async def get_evidence_or_404(db: AsyncSession, evidence_id: int) -> Evidence:
+    evidence = await db.get(Evidence, evidence_id)
+    if not evidence:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Evidence not found",
+        )
+    return evidence
+
+
+async def get_active_session_or_404(service: ChunkedUploadService, evidence_id: int, session_id: str):
+    upload_session = await service.get_session(evidence_id, session_id)
+    if not upload_session:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Upload session not found",
+        )
+    if upload_session.status != UploadSessionStatus.active:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Upload session is {upload_session.status.value}",
+        )
+    return upload_session
+
+
+async def build_session_response(service: ChunkedUploadService, upload_session) -> UploadSessionSchema:
+    response = UploadSessionSchema.model_validate(upload_session)
+    if upload_session.status == UploadSessionStatus.active:
+        missing, missing_ranges = await service.missing_chunks(upload_session)
+        response.missing_chunks = missing
+        response.missing_chunk_ranges = missing_ranges
+        response.received_chunks = upload_session.total_chunks - missing
+    elif upload_session.status == UploadSessionStatus.completed:
+        response.received_chunks = upload_session.total_chunks
+    return response
+
+
+@router.post("/{evidence_id}/uploads", response_model=UploadSessionSchema)
+async def create_upload_session(
+    evidence_id: int,
+    session_create: UploadSessionCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    audit_service: AuditService = Depends(get_audit_service),
+):
+    """Open a resumable upload session for a large evidence file."""
+    evidence = await get_evidence_or_404(db, evidence_id)
+    validate_file_extension(session_create.file_name)
+
+    service = ChunkedUploadService(db)
+    upload_session = await service.create_session(
+        evidence=evidence,
+        file_name=session_create.file_name,
+        total_size=session_create.total_size,
+        created_by=current_user.id,
+        chunk_size=session_create.chunk_size,
+        mime_type=session_create.mime_type,
+    )
+
+    await audit_service.log_action(
+        action="upload_session_created",
+        entity_type="evidence",
+        entity_id=evidence_id,
+        details=(
+            f"Opened upload session {upload_session.id} for {upload_session.file_name} "
+            f"({upload_session.total_size} bytes, {upload_session.total_chunks} chunks) "
+            f"on evidence {evidence.evidence_number}"
+        ),
+    )
+
+    return await build_session_response(service, upload_session)
+
+
+@router.get("/{evidence_id}/uploads/{session_id}", response_model=UploadSessionSchema)
+async def read_upload_session(
+    evidence_id: int,
+    session_id: str,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Get upload session progress, including which chunks are still missing."""
+    service = ChunkedUploadService(db)
+    upload_session = await service.get_session(evidence_id, session_id)
+    if not upload_session:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Upload session not found",
+        )
+    return await build_session_response(service, upload_session)
+
+
+@router.put("/{evidence_id}/uploads/{session_id}/chunks/{chunk_index}")
+async def upload_chunk(
+    evidence_id: int,
+    session_id: str,
+    chunk_index: int,
+    request: Request,
+    x_chunk_sha256: Optional[str] = Header(default=None),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Upload one chunk of a session. Chunks may arrive in any order and in parallel."""
+    service = ChunkedUploadService(db)
+    upload_session = await get_active_session_or_404(service, evidence_id, session_id)
+
+    size = await service.write_chunk(
+        upload_session,
+        chunk_index,
+        request.stream(),
+        expected_sha256=x_chunk_sha256,
+    )
+
+    return {
+        "session_id": session_id,
+        "chunk_index": chunk_index,
+        "size": size,
+    }
+
+
+@router.post("/{evidence_id}/uploads/{session_id}/complete", response_model=FileUpload)
+async def complete_upload_session(
+    evidence_id: int,
+    session_id: str,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    audit_service: AuditService = Depends(get_audit_service),
+):
+    """Assemble all chunks into the evidence file and record its SHA-256 hash."""
+    evidence = await get_evidence_or_404(db, evidence_id)
+    service = ChunkedUploadService(db)
+    upload_session = await get_active_session_or_404(service, evidence_id, session_id)
+
+    missing, missing_ranges = await service.missing_chunks(upload_session, max_ranges=1)
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"{missing} chunk(s) still missing, first missing chunk is {missing_ranges[0][0]}",
+        )
+
+    # Only one request gets to assemble the session
+    await service.claim_for_completion(upload_session)
+    try:
+        hasher = MultiHasher(merkle_chunk_size=settings.MERKLE_CHUNK_SIZE)
+        temp_path, file_size, file_hash = await run_in_threadpool(
+            service.assemble, upload_session, new_blob_temp_path(), hasher
+        )
+        await replace_evidence_file(
+            db, evidence, temp_path, file_hash, file_size, upload_session.file_name, upload_session.mime_type
+        )
+    except Exception:
+        # Let the client fix the problem and complete again
+        await service.reopen(session_id)
+        raise
+
+    digests = hasher.hexdigests()
+    await EvidenceHashService(db).record_hashes(evidence, digests)
+    await MerkleService(db).record_tree(file_hash, hasher.merkle)
+    await service.close_session(upload_session, UploadSessionStatus.completed)
+    evidence_pipeline.submit(evidence_id)
+
+    await audit_service.log_action(
+        action="file_uploaded",
+        entity_type="evidence",
+        entity_id=evidence_id,
+        details=(
+            f"Uploaded file: {upload_session.file_name} for evidence {evidence.evidence_number} "
+            f"via upload session {session_id}"
+        ),
+    )
+
+    logger.info(
+        "Chunked upload completed: %s for evidence %s by %s",
+        upload_session.file_name,
+        evidence.evidence_number,
+        current_user.username,
+    )
+
+    return FileUpload(
+        filename=upload_session.file_name,
+        content_type=upload_session.mime_type or "application/octet-stream",
+        file_size=file_size,
+        file_hash=file_hash,
+        hashes=digests,
+    )
+
+
+@router.delete("/{evidence_id}/uploads/{session_id}")
+async def abort_upload_session(
+    evidence_id: int,
+    session_id: str,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    audit_service: AuditService = Depends(get_audit_service),
+):
+    """Abort an upload session and discard its chunks."""
+    service = ChunkedUploadService(db)
+    upload_session = await get_active_session_or_404(service, evidence_id, session_id)
+
+    await service.close_session(upload_session, UploadSessionStatus.aborted)
+
+    await audit_service.log_action(
+        action="upload_session_aborted",
+        entity_type="evidence",
+        entity_id=evidence_id,
+        details=f"Aborted upload session {session_id}",
+    )
+
+    return {"message": "Upload session aborted"}
@@ -1,18 +1,21 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from app.core.database import get_db
 from app.models.models import User, UserRole
 from app.schemas.schemas import User as UserSchema, UserCreate, UserUpdate
 from app.core.security import get_password_hash
-from app.api.dependencies import get_current_user, require_admin, get_audit_service
+from app.api.dependencies import Page, get_current_user, require_admin, get_audit_service
 from app.services.audit_service import AuditService
+from app.utils.pagination import Keyset
 import logging
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+USER_KEYSET = Keyset(User.id)
+
 @router.get("/me", response_model=UserSchema)
 async def read_users_me(current_user: User = Depends(get_current_user)):
     """Get current user information."""
@@ -20,19 +23,17 @@ async def read_users_me(current_user: User = Depends(get_current_user)):
 
 @router.get("/", response_model=List[UserSchema])
 async def read_users(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db),
+    page: Page = Depends(),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_admin)
 ):
     """Get all users (admin only)."""
-    users = db.query(User).offset(skip).limit(limit).all()
-    return users
+    return await page.fetch(db, select(User), USER_KEYSET)
 
 @router.get("/{user_id}", response_model=UserSchema)
 async def read_user(
     user_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get user by ID."""
@@ -43,7 +44,7 @@ async def read_user(
             detail="Not enough permissions"
         )
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -54,7 +55,7 @@ async def read_user(
 @router.post("/", response_model=UserSchema)
 async def create_user(
     user_create: UserCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_admin),
     audit_service: AuditService = Depends(get_audit_service)
 ):
@@ -70,7 +71,7 @@ async def create_user(
         )
 
     # Check if username already exists
-    db_user = db.query(User).filter(func.lower(User.username) == username.lower()).first()
+    db_user = await db.scalar(select(User).where(func.lower(User.username) == username.lower()))
     if db_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -78,7 +79,7 @@ async def create_user(
         )
     
     # Check if email already exists
-    db_user = db.query(User).filter(func.lower(User.email) == email).first()
+    db_user = await db.scalar(select(User).where(func.lower(User.email) == email))
     if db_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -104,8 +105,8 @@ async def create_user(
     )
     
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     
     # Log the action
     await audit_service.log_action(
@@ -122,7 +123,7 @@ async def create_user(
 async def update_user(
     user_id: int,
     user_update: UserUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     audit_service: AuditService = Depends(get_audit_service)
 ):
@@ -134,7 +135,7 @@ async def update_user(
             detail="Not enough permissions"
         )
     
-    db_user = db.query(User).filter(User.id == user_id).first()
+    db_user = await db.get(User, user_id)
     if db_user is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -149,8 +150,8 @@ async def update_user(
     for field, value in update_data.items():
         setattr(db_user, field, value)
     
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     
     # Log the action
     await audit_service.log_action(
@@ -166,12 +167,12 @@ async def update_user(
 @router.delete("/{user_id}")
 async def delete_user(
     user_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_admin),
     audit_service: AuditService = Depends(get_audit_service)
 ):
     """Delete user (admin only)."""
-    db_user = db.query(User).filter(User.id == user_id).first()
+    db_user = await db.get(User, user_id)
     if db_user is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -186,8 +187,8 @@ async def delete_user(
         )
     
     username = db_user.username
-    db.delete(db_user)
-    db.commit()
+    await db.delete(db_user)
+    await db.commit()
     
     # Log the action
     await audit_service.log_action(
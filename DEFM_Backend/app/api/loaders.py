@@ -0,0 +1,32 @@
+"""
+Eager-load options for the relationships nested in response schemas.
+
+An async session can't lazily load a relationship while the response is
+serialized, so every query whose rows are returned through one of these
+schemas loads the nested objects up front.
+"""
+from sqlalchemy.orm import selectinload
+from app.models.models import AuditLog, Case, ChainOfCustody, Evidence, Report
+
+CASE_LOAD_OPTIONS = (
+    selectinload(Case.created_by_user),
+    selectinload(Case.assigned_to_user),
+)
+
+EVIDENCE_LOAD_OPTIONS = (
+    selectinload(Evidence.collected_by_user),
+    selectinload(Evidence.case).options(*CASE_LOAD_OPTIONS),
+)
+
+CUSTODY_LOAD_OPTIONS = (
+    selectinload(ChainOfCustody.handler_user),
+    selectinload(ChainOfCustody.evidence).options(*EVIDENCE_LOAD_OPTIONS),
+)
+
+REPORT_LOAD_OPTIONS = (
+    selectinload(Report.case).options(*CASE_LOAD_OPTIONS),
+)
+
+AUDIT_LOG_LOAD_OPTIONS = (
+    selectinload(AuditLog.user),
+)
@@ -1,6 +1,7 @@
 from pydantic_settings import BaseSettings
 from pydantic import Field, field_validator
-from typing import List
+from typing import List, Optional
+import hashlib
 import os
 
 
@@ -12,6 +13,68 @@ class Settings(BaseSettings):
         default="sqlite:///./defm.db",
         description="Database connection URL"
     )
+    DATABASE_POOL_SIZE: int = Field(
+        default=10,
+        description="Connections kept open in each database engine's pool"
+    )
+    DATABASE_MAX_OVERFLOW: int = Field(
+        default=20,
+        description="Extra connections opened beyond the pool size under load, closed again when returned"
+    )
+    DATABASE_POOL_TIMEOUT: float = Field(
+        default=30,
+        description="Seconds to wait for a free connection before the request fails"
+    )
+    DATABASE_POOL_RECYCLE: int = Field(
+        default=1800,
+        description="Seconds after which a pooled connection is replaced, -1 to keep connections indefinitely"
+    )
+    DATABASE_POOL_PRE_PING: bool = Field(
+        default=True,
+        description="Test each connection on checkout and replace it if the server dropped it"
+    )
+    DATABASE_REPLICA_URLS: str = Field(
+        default="",
+        description="Comma-separated URLs of read replicas that serve GET requests; all queries go to the primary when empty"
+    )
+    DATABASE_REPLICA_HEALTH_CHECK_INTERVAL_SECONDS: int = Field(
+        default=10,
+        description="Seconds between health checks of each read replica; failing replicas get no reads until they pass again"
+    )
+    DATABASE_READ_YOUR_WRITES_SECONDS: float = Field(
+        default=5,
+        description="Seconds after a user's write during which their reads go to the primary; keep above the replication lag"
+    )
+
+    # SQLite (desktop and single-node deployments)
+    SQLITE_JOURNAL_MODE: str = Field(
+        default="wal",
+        description="SQLite journal mode; WAL lets readers run while a write commits"
+    )
+    SQLITE_SYNCHRONOUS: str = Field(
+        default="normal",
+        description="SQLite synchronous level; NORMAL in WAL mode syncs at checkpoints instead of every commit"
+    )
+    SQLITE_CACHE_SIZE_KB: int = Field(
+        default=64 * 1024,
+        description="SQLite page cache size per connection in KiB"
+    )
+    SQLITE_MMAP_SIZE: int = Field(
+        default=256 * 1024 * 1024,
+        description="Bytes of the SQLite database file read through memory-mapped I/O, 0 to disable"
+    )
+    SQLITE_BUSY_TIMEOUT_MS: int = Field(
+        default=5000,
+        description="Milliseconds a SQLite connection waits for a lock before failing with 'database is locked'"
+    )
+    SQLITE_TEMP_STORE: str = Field(
+        default="memory",
+        description="Where SQLite keeps temporary tables and indexes: default, file or memory"
+    )
+    SQLITE_CHECKPOINT_INTERVAL_SECONDS: int = Field(
+        default=300,
+        description="Seconds between WAL checkpoints that write the log back and truncate it, 0 to disable"
+    )
 
     # Security
     SECRET_KEY: str = Field(
@@ -36,6 +99,170 @@ class Settings(BaseSettings):
         default=100000000,
         description="Maximum file size in bytes (100MB)"
     )
+    UPLOAD_CHUNK_SIZE: int = Field(
+        default=1024 * 1024,
+        description="Chunk size in bytes used when streaming uploads to disk"
+    )
+    UPLOAD_SESSION_CHUNK_SIZE: int = Field(
+        default=8 * 1024 * 1024,
+        description="Default chunk size in bytes for resumable upload sessions"
+    )
+    MAX_CHUNKED_UPLOAD_SIZE: int = Field(
+        default=1024 ** 4,
+        description="Maximum file size in bytes accepted through resumable upload sessions (1TB)"
+    )
+    UPLOAD_SESSION_MIN_CHUNK_SIZE: int = Field(
+        default=1024 * 1024,
+        description="Smallest chunk size in bytes a client may choose for an upload session"
+    )
+    UPLOAD_SESSION_MAX_CHUNK_SIZE: int = Field(
+        default=256 * 1024 * 1024,
+        description="Largest chunk size in bytes a client may choose for an upload session"
+    )
+    UPLOAD_SESSION_MAX_CHUNKS: int = Field(
+        default=1024 * 1024,
+        description="Maximum number of chunks in one upload session"
+    )
+    UPLOAD_SESSION_EXPIRY_HOURS: int = Field(
+        default=72,
+        description="Hours without a new chunk after which an active upload session is aborted and its chunks deleted"
+    )
+    UPLOAD_SESSION_CLEANUP_INTERVAL_SECONDS: int = Field(
+        default=3600,
+        description="Seconds between sweeps for expired upload sessions and orphaned chunk directories"
+    )
+    UPLOAD_MAX_CONCURRENT: int = Field(
+        default=16,
+        description="Maximum number of uploads processed at once on this node; more get 503 with Retry-After"
+    )
+    UPLOAD_MAX_IN_FLIGHT_PER_USER: int = Field(
+        default=4,
+        description="Maximum number of uploads a single user may run at once; more get 429"
+    )
+    UPLOAD_RETRY_AFTER_SECONDS: int = Field(
+        default=5,
+        description="Retry-After value in seconds sent when uploads are rejected for capacity"
+    )
+    EVIDENCE_HASH_ALGORITHMS: str = Field(
+        default="md5,sha1,sha256",
+        description="Comma-separated list of digests computed for every evidence file (sha256 is always included)"
+    )
+    MERKLE_CHUNK_SIZE: int = Field(
+        default=4 * 1024 * 1024,
+        description="Chunk size in bytes of the Merkle tree built for each evidence file"
+    )
+    HASH_WORKER_POOL_SIZE: int = Field(
+        default=4,
+        description="Number of worker threads used for integrity hashing"
+    )
+    HASH_WORKER_MAX_QUEUE: int = Field(
+        default=64,
+        description="Maximum number of hashing jobs waiting for a worker before requests are rejected"
+    )
+    HASH_CACHE_TTL_SECONDS: int = Field(
+        default=3600,
+        description="How long in seconds a verification result is reused for an unchanged file; 0 disables the cache"
+    )
+    HASH_CACHE_MAX_ENTRIES: int = Field(
+        default=10000,
+        description="Maximum number of file versions whose digests are cached"
+    )
+    EVIDENCE_PROCESSING_ENABLED: bool = Field(
+        default=True,
+        description="Run post-upload processing (thumbnails, ...) in the background"
+    )
+    PROCESSING_POOL_SIZE: int = Field(
+        default=2,
+        description="Number of worker processes for CPU-bound evidence processing"
+    )
+    THUMBNAIL_SIZES: str = Field(
+        default="128,256,512",
+        description="Comma-separated longest-edge sizes in pixels of image evidence thumbnails"
+    )
+    INTEGRITY_SCAN_ENABLED: bool = Field(
+        default=True,
+        description="Run the background integrity scanner"
+    )
+    INTEGRITY_SCAN_INTERVAL_SECONDS: int = Field(
+        default=300,
+        description="Pause in seconds between integrity scanner batches"
+    )
+    INTEGRITY_SCAN_BATCH_SIZE: int = Field(
+        default=50,
+        description="Number of evidence files re-hashed per integrity scanner batch"
+    )
+    INTEGRITY_SCAN_BANDWIDTH: int = Field(
+        default=20 * 1024 * 1024,
+        description="Maximum read rate in bytes per second for the integrity scanner"
+    )
+    STORAGE_BACKEND: str = Field(
+        default="local",
+        description="Where new evidence files are stored: local or s3"
+    )
+    S3_BUCKET: Optional[str] = Field(
+        default=None,
+        description="Bucket for evidence files when STORAGE_BACKEND is s3"
+    )
+    S3_PREFIX: str = Field(
+        default="",
+        description="Key prefix for evidence objects in the bucket"
+    )
+    S3_ENDPOINT_URL: Optional[str] = Field(
+        default=None,
+        description="Endpoint of an S3-compatible store such as MinIO; AWS when unset"
+    )
+    S3_REGION: Optional[str] = Field(
+        default=None,
+        description="Region of the bucket"
+    )
+    S3_ACCESS_KEY_ID: Optional[str] = Field(
+        default=None,
+        description="Access key; the default AWS credential chain is used when unset"
+    )
+    S3_SECRET_ACCESS_KEY: Optional[str] = Field(
+        default=None,
+        description="Secret key; the default AWS credential chain is used when unset"
+    )
+    S3_MAX_POOL_CONNECTIONS: int = Field(
+        default=32,
+        description="HTTP connections kept in the shared S3 client pool"
+    )
+    S3_MULTIPART_CHUNK_SIZE: int = Field(
+        default=16 * 1024 * 1024,
+        description="Part size in bytes for multipart uploads (at least 5 MiB)"
+    )
+    S3_READ_AHEAD_SIZE: int = Field(
+        default=4 * 1024 * 1024,
+        description="Bytes fetched per ranged GET when reading evidence objects"
+    )
+    COLD_STORAGE_DIRECTORY: Optional[str] = Field(
+        default=None,
+        description="Directory on the slower, larger volume for evidence of closed and archived cases; tiering is off when unset"
+    )
+    STORAGE_TIERING_INTERVAL_SECONDS: int = Field(
+        default=600,
+        description="Seconds between storage tier migration batches"
+    )
+    STORAGE_TIERING_BATCH_SIZE: int = Field(
+        default=20,
+        description="Number of stored files moved between tiers per batch"
+    )
+    STORAGE_TIERING_BANDWIDTH: int = Field(
+        default=20 * 1024 * 1024,
+        description="Maximum copy rate in bytes per second for storage tier migration"
+    )
+    ARCHIVE_COMPRESSION_ENABLED: bool = Field(
+        default=True,
+        description="Compress evidence files once all evidence referring to them is archived"
+    )
+    ARCHIVE_FRAME_SIZE: int = Field(
+        default=1024 * 1024,
+        description="Uncompressed bytes per independently decompressible frame of archived files"
+    )
+    ARCHIVE_COMPRESSION_LEVEL: int = Field(
+        default=6,
+        description="zlib compression level for archived evidence files"
+    )
     ALLOWED_FILE_TYPES: str = Field(
         default="pdf,doc,docx,txt,jpg,jpeg,png,gif,mp4,avi,mov,zip,rar,7z,log",
         description="Comma-separated list of allowed file extensions"
@@ -95,12 +322,60 @@ class Settings(BaseSettings):
             if normalized in {"0", "false", "no", "off", "release", "prod", "production"}:
                 return False
         return value
+    
+    @field_validator("STORAGE_BACKEND")
+    @classmethod
+    def validate_storage_backend(cls, value: str) -> str:
+        normalized = value.strip().lower()
+        if normalized not in {"local", "s3"}:
+            raise ValueError("STORAGE_BACKEND must be 'local' or 's3'")
+        return normalized
+
+    @field_validator("EVIDENCE_HASH_ALGORITHMS")
+    @classmethod
+    def validate_evidence_hash_algorithms(cls, value: str) -> str:
+        for algorithm in (alg.strip().lower() for alg in value.split(",") if alg.strip()):
+            # Variable-length digests (shake_*) can't be recorded as a plain hexdigest
+            if algorithm not in hashlib.algorithms_available or algorithm.startswith("shake_"):
+                raise ValueError(f"EVIDENCE_HASH_ALGORITHMS: unsupported hash algorithm '{algorithm}'")
+        return value
+
+    @field_validator("SQLITE_JOURNAL_MODE", "SQLITE_SYNCHRONOUS", "SQLITE_TEMP_STORE")
+    @classmethod
+    def validate_sqlite_pragma(cls, value: str, info) -> str:
+        allowed = {
+            "SQLITE_JOURNAL_MODE": {"delete", "truncate", "persist", "memory", "wal", "off"},
+            "SQLITE_SYNCHRONOUS": {"off", "normal", "full", "extra"},
+            "SQLITE_TEMP_STORE": {"default", "file", "memory"},
+        }[info.field_name]
+        normalized = value.strip().lower()
+        if normalized not in allowed:
+            raise ValueError(f"{info.field_name} must be one of: {', '.join(sorted(allowed))}")
+        return normalized
         
     @property
     def allowed_origins_list(self) -> List[str]:
         """Get CORS origins as a list."""
         return [origin.strip() for origin in self.ALLOWED_ORIGINS.split(",")]
     
+    @property
+    def database_replica_urls_list(self) -> List[str]:
+        """Get read replica URLs as a list."""
+        return [url.strip() for url in self.DATABASE_REPLICA_URLS.split(",") if url.strip()]
+    
+    @property
+    def evidence_hash_algorithms_list(self) -> List[str]:
+        """Get evidence hash algorithms as a list, always including sha256."""
+        algorithms = [alg.strip().lower() for alg in self.EVIDENCE_HASH_ALGORITHMS.split(",") if alg.strip()]
+        if "sha256" not in algorithms:
+            algorithms.append("sha256")
+        return algorithms
+    
+    @property
+    def thumbnail_sizes_list(self) -> List[int]:
+        """Get thumbnail sizes as a sorted list of integers."""
+        return sorted({int(size) for size in self.THUMBNAIL_SIZES.split(",") if size.strip()})
+    
     @property
     def allowed_file_types_list(self) -> List[str]:
         """Get allowed file types as a list."""
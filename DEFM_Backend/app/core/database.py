@@ -1,9 +1,16 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.sql.dml import UpdateBase
 from app.core.config import settings
+from app.core.pool_metrics import InstrumentedAsyncQueuePool, InstrumentedQueuePool
+from app.core.replicas import ReplicaSet, replica_reads_allowed
+from app.core.sqlite_profile import apply_sqlite_pragmas
 from dotenv import load_dotenv
 from pathlib import Path
+from typing import Any, AsyncIterator, Dict
 import os
 
 # Ensure the database directory exists for SQLite
@@ -27,23 +34,117 @@ if DATABASE_URL.startswith("sqlite:///"):
     if db_dir:
         os.makedirs(db_dir, exist_ok=True)
 
+# Async drivers for the databases we support; URLs that already name an
+# async driver are used as they are.
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+}
+
+
+def async_database_url(url: str) -> str:
+    """Get the URL of the same database through its asyncio driver."""
+    parsed = make_url(url)
+    drivername = ASYNC_DRIVERS.get(parsed.drivername, parsed.drivername)
+    return parsed.set(drivername=drivername).render_as_string(hide_password=False)
+
+
+def pool_options(url: str, poolclass: type) -> Dict[str, Any]:
+    """
+    Engine arguments of the configured connection pool.
+
+    An in-memory SQLite database lives in a single connection, so it
+    keeps SQLAlchemy's default pool for it.
+    """
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        return {}
+    return {
+        "poolclass": poolclass,
+        "pool_size": settings.DATABASE_POOL_SIZE,
+        "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+        "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+        "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+    }
+
+
+# Synchronous engine for background jobs, worker threads and startup tasks
 engine = create_engine(
     DATABASE_URL,
     connect_args={"check_same_thread": False} if DATABASE_URL.startswith(
         "sqlite") else {},
+    **pool_options(DATABASE_URL, InstrumentedQueuePool),
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for request handlers, so a slow query doesn't block the event loop.
+# Pooled for file SQLite too, where SQLAlchemy would otherwise open a new
+# aiosqlite connection and thread for every session.
+async_engine = create_async_engine(
+    async_database_url(DATABASE_URL),
+    **pool_options(DATABASE_URL, InstrumentedAsyncQueuePool),
+)
+# Read replicas for the reads of GET requests, see RoutingSession
+replica_set = ReplicaSet([
+    create_async_engine(async_database_url(url), **pool_options(url, InstrumentedAsyncQueuePool))
+    for url in settings.database_replica_urls_list
+])
+
+
+class RoutingSession(Session):
+    """
+    Session that sends the reads of read-only requests to a replica.
+
+    Everything else goes to the primary: flushes, INSERT/UPDATE/DELETE
+    statements, SELECT ... FOR UPDATE, and every query after the session
+    first wrote, so a request always reads its own writes. The replica is
+    chosen once per session, keeping a request on one consistent copy.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._replica = None
+        self._wrote = False
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if (
+            self._flushing
+            or isinstance(clause, UpdateBase)
+            or getattr(clause, "_for_update_arg", None) is not None
+        ):
+            self._wrote = True
+        if self._wrote or not replica_reads_allowed():
+            return async_engine.sync_engine
+        if self._replica is None:
+            self._replica = replica_set.choose() or async_engine
+        return self._replica.sync_engine
+
+
+# Objects stay loaded after commit: an async session can't lazily
+# refresh them while the response is serialized.
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    sync_session_class=RoutingSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+IS_SQLITE = make_url(DATABASE_URL).get_backend_name() == "sqlite"
+if IS_SQLITE:
+    # WAL, page cache, mmap etc. are per connection, so they're set as each one opens
+    event.listen(engine, "connect", apply_sqlite_pragmas)
+    event.listen(async_engine.sync_engine, "connect", apply_sqlite_pragmas)
+
 Base = declarative_base()
 
 
-def get_db():
+async def get_db() -> AsyncIterator[AsyncSession]:
     """Database dependency."""
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
 def create_tables():
@@ -1,8 +1,14 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from app.core.database import create_tables
+from app.core.database import IS_SQLITE, async_engine, create_tables, engine, replica_set
 from app.core.config import settings
+from app.core.sqlite_profile import sqlite_checkpointer
 from app.services.initial_data import create_initial_data
+from app.services.hash_pool import hash_pool
+from app.services.processing_pool import processing_pool
+from app.services.integrity_service import integrity_scanner
+from app.services.storage_tier_service import storage_tier_migrator
+from app.services.upload_service import upload_session_cleaner
 import logging
 import os
 
@@ -32,6 +38,28 @@ async def lifespan(app: FastAPI):
         create_initial_data()
         logger.info("✓ Initial data created")
         
+        upload_session_cleaner.start()
+        logger.info(f"✓ Upload session cleaner running (expiry: {settings.UPLOAD_SESSION_EXPIRY_HOURS}h)")
+        
+        if settings.INTEGRITY_SCAN_ENABLED:
+            integrity_scanner.start()
+            logger.info("✓ Integrity scanner running")
+        
+        if settings.COLD_STORAGE_DIRECTORY:
+            os.makedirs(settings.COLD_STORAGE_DIRECTORY, exist_ok=True)
+            storage_tier_migrator.start()
+            logger.info(f"✓ Storage tier migrator running (cold tier: {settings.COLD_STORAGE_DIRECTORY})")
+        
+        if IS_SQLITE and settings.SQLITE_JOURNAL_MODE == "wal" and settings.SQLITE_CHECKPOINT_INTERVAL_SECONDS > 0:
+            sqlite_checkpointer.start(engine)
+            logger.info("✓ SQLite WAL checkpointer running")
+        
+        if replica_set.replicas:
+            await replica_set.check()
+            replica_set.start()
+            healthy = sum(replica.healthy for replica in replica_set.replicas)
+            logger.info(f"✓ Read replicas: {healthy} of {len(replica_set.replicas)} healthy")
+        
         logger.info("=" * 60)
         logger.info("✓ DEFM API is ready!")
         logger.info(f"✓ Documentation: http://localhost:8000/docs")
@@ -46,4 +74,15 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("=" * 60)
     logger.info("DEFM API shutting down...")
+    await upload_session_cleaner.stop()
+    await integrity_scanner.stop()
+    await storage_tier_migrator.stop()
+    await sqlite_checkpointer.stop()
+    await replica_set.stop()
+    hash_pool.shutdown()
+    processing_pool.shutdown()
+    # Pooled aiosqlite connections each keep a thread alive that would block exit
+    await async_engine.dispose()
+    await replica_set.dispose()
+    engine.dispose()
     logger.info("=" * 60)
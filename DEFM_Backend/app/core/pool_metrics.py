@@ -0,0 +1,108 @@
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+from typing import Any, Dict, List
+import bisect
+import threading
+import time
+
+# Upper bounds in seconds of the checkout wait histogram buckets
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class PoolMetrics:
+    """
+    Checkout counters and a wait time histogram of one connection pool.
+
+    Wait time is the time a checkout spends getting a connection from the
+    pool, including opening a new one when the pool isn't full yet. A
+    histogram that shifts right under load means requests are queueing
+    for connections and the pool is too small for the traffic.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_count = 0
+        self.wait_sum = 0.0
+        self.wait_max = 0.0
+        self._buckets: List[int] = [0] * (len(WAIT_BUCKETS) + 1)
+
+    def observe(self, wait: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_count += 1
+            self.wait_sum += wait
+            self.wait_max = max(self.wait_max, wait)
+            self._buckets[bisect.bisect_left(WAIT_BUCKETS, wait)] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            # Cumulative counts per upper bound, like a Prometheus histogram
+            buckets, total = {}, 0
+            for bound, count in zip(WAIT_BUCKETS + (float("inf"),), self._buckets):
+                total += count
+                buckets["+Inf" if bound == float("inf") else str(bound)] = total
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_seconds": {
+                    "count": self.wait_count,
+                    "sum": round(self.wait_sum, 6),
+                    "max": round(self.wait_max, 6),
+                    "buckets": buckets,
+                },
+            }
+
+
+class _InstrumentedPoolMixin:
+    """Times every checkout of a queue pool into its ``metrics``."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.observe(time.perf_counter() - started, timed_out=True)
+            raise
+        self.metrics.observe(time.perf_counter() - started)
+        return connection
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    """QueuePool with checkout metrics, for the synchronous engine."""
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool with checkout metrics, for the async engine."""
+
+
+def pool_stats(pool: Pool) -> Dict[str, Any]:
+    """Get the live state and checkout metrics of an engine's pool."""
+    if not isinstance(pool, QueuePool):
+        # e.g. the single shared connection of an in-memory SQLite database
+        return {"pool_class": type(pool).__name__, "status": pool.status()}
+
+    # overflow() counts from -size while the pool is still filling up
+    opened = pool.size() + pool.overflow()
+    stats = {
+        "pool_class": type(pool).__name__,
+        "pool_size": pool.size(),
+        "max_overflow": pool._max_overflow,
+        "timeout_seconds": pool.timeout(),
+        "connections": opened,
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+    }
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        stats.update(metrics.snapshot())
+    return stats
@@ -0,0 +1,182 @@
+from app.core.config import settings
+from app.core.pool_metrics import pool_stats
+from app.core.security import user_from_headers
+from contextvars import ContextVar
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Receive, Scope, Send
+from typing import Any, Dict, List, Optional
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# Seconds a replica gets to answer a health check
+HEALTH_CHECK_TIMEOUT = 5
+
+READ_ONLY_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+# Set for requests whose reads may be served by a replica
+_replica_reads: ContextVar[bool] = ContextVar("replica_reads", default=False)
+
+
+def replica_reads_allowed() -> bool:
+    """Whether the current request's reads may go to a replica."""
+    return _replica_reads.get()
+
+
+class Replica:
+    """A read replica and its health as of the last check."""
+
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+        self.healthy = True
+        self.last_error: Optional[str] = None
+        # A dropped connection takes the replica out right away instead of
+        # at the next health check
+        event.listen(engine.sync_engine, "handle_error", self._on_error)
+
+    @property
+    def name(self) -> str:
+        return self.engine.url.render_as_string(hide_password=True)
+
+    def mark(self, healthy: bool, error: Optional[str] = None) -> None:
+        if healthy and not self.healthy:
+            logger.info(f"Read replica {self.name} is healthy again")
+        elif not healthy and self.healthy:
+            logger.warning(f"Read replica {self.name} taken out of rotation: {error}")
+        self.healthy = healthy
+        self.last_error = error
+
+    def _on_error(self, context) -> None:
+        if context.is_disconnect:
+            self.mark(False, str(context.original_exception))
+
+
+class ReplicaSet:
+    """
+    Read replicas used round-robin, with a background health check.
+
+    Reads fall back to the primary when no replica is configured or none
+    is healthy.
+    """
+
+    def __init__(self, engines: List[AsyncEngine]):
+        self.replicas = [Replica(engine) for engine in engines]
+        self._next = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def choose(self) -> Optional[AsyncEngine]:
+        """Get the next healthy replica, None to read from the primary."""
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[self._next % len(self.replicas)]
+            self._next += 1
+            if replica.healthy:
+                return replica.engine
+        return None
+
+    async def check(self) -> None:
+        """Check every replica and update its health."""
+        await asyncio.gather(*(self._check(replica) for replica in self.replicas))
+
+    @staticmethod
+    async def _check(replica: Replica) -> None:
+        try:
+            await asyncio.wait_for(ReplicaSet._ping(replica.engine), HEALTH_CHECK_TIMEOUT)
+        except Exception as e:
+            replica.mark(False, str(e) or type(e).__name__)
+        else:
+            replica.mark(True)
+
+    @staticmethod
+    async def _ping(engine: AsyncEngine) -> None:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+    def start(self) -> None:
+        """Start the health check loop on the running event loop."""
+        if self.replicas and self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"Health checks of {len(self.replicas)} read replica(s) started")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(settings.DATABASE_REPLICA_HEALTH_CHECK_INTERVAL_SECONDS)
+            await self.check()
+
+    async def dispose(self) -> None:
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    def stats(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "url": replica.name,
+                "healthy": replica.healthy,
+                "last_error": replica.last_error,
+                "pool": pool_stats(replica.engine.pool),
+            }
+            for replica in self.replicas
+        ]
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Let the reads of read-only requests go to a replica.
+
+    A replica lags the primary, so for DATABASE_READ_YOUR_WRITES_SECONDS
+    after a user's write request finishes, that user's requests keep
+    reading from the primary and see their own change. Writes are
+    tracked per process, so with several API nodes the load balancer
+    should keep a user on one node.
+    """
+
+    def __init__(self, app: ASGIApp, replicas: ReplicaSet):
+        self.app = app
+        self.replicas = replicas
+        # User -> monotonic time until which their reads stay on the primary
+        self.primary_until: Dict[str, float] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.replicas.replicas:
+            await self.app(scope, receive, send)
+            return
+
+        user = user_from_headers(dict(scope["headers"]))
+        if scope["method"] not in READ_ONLY_METHODS:
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                if user is not None:
+                    self.primary_until[user] = time.monotonic() + settings.DATABASE_READ_YOUR_WRITES_SECONDS
+            return
+
+        if user is not None and self._wrote_recently(user):
+            await self.app(scope, receive, send)
+            return
+
+        token = _replica_reads.set(True)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _replica_reads.reset(token)
+
+    def _wrote_recently(self, user: str) -> bool:
+        until = self.primary_until.get(user)
+        if until is None:
+            return False
+        if until > time.monotonic():
+            return True
+        del self.primary_until[user]
+        return False
@@ -1,5 +1,5 @@
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Mapping, Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from app.core.config import settings
@@ -68,4 +68,25 @@ def verify_token(token: str) -> Optional[dict]:
         return None
     except Exception as e:
         logger.error(f"Token verification error: {str(e)}")
-        return None
\ No newline at end of file
+        return None
+
+
+def user_from_headers(headers: Mapping[bytes, bytes]) -> Optional[str]:
+    """
+    Get the username of a request's bearer token from its raw ASGI headers.
+
+    For middleware that runs before the authentication dependency; the
+    endpoint still authenticates the request itself.
+
+    Args:
+        headers: Request headers keyed by lowercase header name
+
+    Returns:
+        The token's subject, or None if there is no valid bearer token
+    """
+    authorization = headers.get(b"authorization", b"").decode("latin-1")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    payload = verify_token(token.strip())
+    return payload.get("sub") if payload else None
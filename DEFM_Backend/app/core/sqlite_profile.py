@@ -0,0 +1,93 @@
+from app.core.config import settings
+from sqlalchemy.engine import Engine
+from typing import Optional
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """
+    Apply the SQLite performance profile to a new connection.
+
+    WAL lets readers keep reading while a write commits, and with
+    ``synchronous=NORMAL`` a commit only appends to the log; the database
+    file is synced at checkpoints. A committed transaction can be lost on
+    power failure, never corrupted. The busy timeout makes a writer wait
+    for the lock instead of failing at once with "database is locked".
+
+    Registered as a ``connect`` listener on both engines; the cursor API
+    is the same for the sqlite3 and aiosqlite connections.
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"PRAGMA busy_timeout = {int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+        cursor.execute(f"PRAGMA journal_mode = {settings.SQLITE_JOURNAL_MODE}")
+        cursor.execute(f"PRAGMA synchronous = {settings.SQLITE_SYNCHRONOUS}")
+        # A negative cache size is in KiB rather than pages
+        cursor.execute(f"PRAGMA cache_size = -{int(settings.SQLITE_CACHE_SIZE_KB)}")
+        cursor.execute(f"PRAGMA mmap_size = {int(settings.SQLITE_MMAP_SIZE)}")
+        cursor.execute(f"PRAGMA temp_store = {settings.SQLITE_TEMP_STORE}")
+    finally:
+        cursor.close()
+
+
+class SQLiteCheckpointer:
+    """
+    Background job that checkpoints the SQLite write-ahead log.
+
+    SQLite checkpoints on its own once the log reaches 1000 pages, but
+    only as far as no reader is still using older pages, so under steady
+    read traffic the log can keep growing. Each run copies the log into
+    the database and truncates it back to zero bytes.
+    """
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self, engine: Engine) -> None:
+        """Start the checkpoint loop on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(engine))
+            logger.info("SQLite checkpointer started")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("SQLite checkpointer stopped")
+
+    async def _run(self, engine: Engine) -> None:
+        while True:
+            await asyncio.sleep(settings.SQLITE_CHECKPOINT_INTERVAL_SECONDS)
+            try:
+                await asyncio.to_thread(self.checkpoint, engine)
+            except Exception as e:
+                logger.error(f"SQLite checkpoint failed: {str(e)}")
+
+    @staticmethod
+    def checkpoint(engine: Engine) -> bool:
+        """
+        Checkpoint and truncate the write-ahead log.
+
+        Returns:
+            False if readers or writers kept the checkpoint from completing
+        """
+        with engine.connect() as connection:
+            busy, log_pages, checkpointed_pages = connection.exec_driver_sql(
+                "PRAGMA wal_checkpoint(TRUNCATE)"
+            ).one()
+        if busy:
+            logger.info("SQLite checkpoint postponed: database busy")
+        else:
+            logger.debug(f"SQLite checkpoint wrote back {checkpointed_pages} of {log_pages} WAL pages")
+        return not busy
+
+
+sqlite_checkpointer = SQLiteCheckpointer()
@@ -0,0 +1,217 @@
+from app.core.config import settings
+from app.core.security import user_from_headers
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from typing import Dict, List, Optional, Tuple
+import logging
+import os
+import re
+
+logger = logging.getLogger(__name__)
+
+# Multipart evidence upload and raw chunk upload of resumable sessions
+MULTIPART_UPLOAD_PATH = re.compile(r"/evidence/\d+/upload$")
+CHUNK_UPLOAD_PATH = re.compile(r"/evidence/\d+/uploads/[^/]+/chunks/\d+$")
+
+# Room for the multipart boundaries and part headers around the file
+MULTIPART_OVERHEAD = 64 * 1024
+# How much of the body is buffered to find the first part's headers
+MAX_PEEK_SIZE = 64 * 1024
+FILENAME_PATTERN = re.compile(rb'filename="([^"]*)"', re.IGNORECASE)
+
+
+class UploadAdmissionMiddleware:
+    """
+    Admit or reject uploads before their body is read.
+
+    FastAPI spools a multipart body to a temp file before the endpoint
+    runs, so checks in the endpoint only happen after the full transfer.
+    This middleware rejects uploads up front when:
+
+    - the node already runs UPLOAD_MAX_CONCURRENT uploads (503 + Retry-After)
+    - the user already runs UPLOAD_MAX_IN_FLIGHT_PER_USER uploads (429)
+    - Content-Length exceeds the allowed size (413)
+    - the filename in the first multipart part has a disallowed extension (400)
+
+    Bodies without a Content-Length are counted while they stream and cut
+    off with 413 once they exceed the limit.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.in_flight = 0
+        self.in_flight_by_user: Dict[str, int] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        path = scope["path"]
+        if method == "POST" and MULTIPART_UPLOAD_PATH.search(path):
+            max_file_size = settings.MAX_FILE_SIZE
+            max_body_size = max_file_size + MULTIPART_OVERHEAD
+            multipart = True
+        elif method == "PUT" and CHUNK_UPLOAD_PATH.search(path):
+            # A chunk PUT carries a single chunk, not the whole file
+            max_file_size = max_body_size = settings.UPLOAD_SESSION_MAX_CHUNK_SIZE
+            multipart = False
+        else:
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        user = user_from_headers(headers)
+        rejection = self._check_capacity(user)
+        if rejection is None:
+            rejection = self._check_content_length(headers, max_body_size, max_file_size)
+        if rejection is not None:
+            await rejection(scope, receive, send)
+            return
+
+        self._acquire(user)
+        try:
+            replay: List[Message] = []
+            if multipart:
+                replay, filename = await self._peek_filename(receive)
+                rejection = self._check_filename(filename)
+                if rejection is not None:
+                    await rejection(scope, receive, send)
+                    return
+            await self._call_limited(scope, receive, send, replay, max_body_size)
+        finally:
+            self._release(user)
+
+    def _check_capacity(self, user: Optional[str]) -> Optional[JSONResponse]:
+        retry_after = {"Retry-After": str(settings.UPLOAD_RETRY_AFTER_SECONDS)}
+        if self.in_flight >= settings.UPLOAD_MAX_CONCURRENT:
+            logger.warning(f"Upload rejected, node is at {self.in_flight} concurrent uploads")
+            return JSONResponse(
+                status_code=503,
+                content={"detail": "Too many uploads in progress, try again later"},
+                headers=retry_after,
+            )
+        if user is not None and self.in_flight_by_user.get(user, 0) >= settings.UPLOAD_MAX_IN_FLIGHT_PER_USER:
+            return JSONResponse(
+                status_code=429,
+                content={"detail": f"At most {settings.UPLOAD_MAX_IN_FLIGHT_PER_USER} uploads per user may run at once"},
+                headers=retry_after,
+            )
+        return None
+
+    @staticmethod
+    def _check_content_length(
+        headers: Dict[bytes, bytes],
+        max_body_size: int,
+        max_file_size: int
+    ) -> Optional[JSONResponse]:
+        content_length = headers.get(b"content-length")
+        if content_length is None:
+            return None
+        try:
+            length = int(content_length)
+        except ValueError:
+            return JSONResponse(status_code=400, content={"detail": "Invalid Content-Length"})
+        if length > max_body_size:
+            return JSONResponse(
+                status_code=413,
+                content={"detail": f"File size exceeds maximum allowed size of {max_file_size} bytes"},
+            )
+        return None
+
+    @staticmethod
+    def _check_filename(filename: Optional[str]) -> Optional[JSONResponse]:
+        if not filename:
+            return None
+        file_ext = os.path.splitext(filename)[1].lstrip(".").lower()
+        if file_ext not in settings.allowed_file_types_list:
+            return JSONResponse(
+                status_code=400,
+                content={"detail": f"File type .{file_ext} is not allowed. Allowed types: {', '.join(settings.allowed_file_types_list)}"},
+            )
+        return None
+
+    def _acquire(self, user: Optional[str]) -> None:
+        self.in_flight += 1
+        if user is not None:
+            self.in_flight_by_user[user] = self.in_flight_by_user.get(user, 0) + 1
+
+    def _release(self, user: Optional[str]) -> None:
+        self.in_flight -= 1
+        if user is not None:
+            remaining = self.in_flight_by_user.get(user, 1) - 1
+            if remaining > 0:
+                self.in_flight_by_user[user] = remaining
+            else:
+                self.in_flight_by_user.pop(user, None)
+
+    @staticmethod
+    async def _peek_filename(receive: Receive) -> Tuple[List[Message], Optional[str]]:
+        """Read body messages until the headers of the first multipart part are complete."""
+        messages: List[Message] = []
+        buffered = b""
+        while len(buffered) < MAX_PEEK_SIZE:
+            message = await receive()
+            messages.append(message)
+            if message["type"] != "http.request":
+                break
+            buffered += message.get("body", b"")
+            headers_end = buffered.find(b"\r\n\r\n")
+            if headers_end != -1:
+                match = FILENAME_PATTERN.search(buffered[:headers_end])
+                return messages, match.group(1).decode("utf-8", errors="replace") if match else None
+            if not message.get("more_body", False):
+                break
+        return messages, None
+
+    async def _call_limited(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        replay: List[Message],
+        max_body_size: int
+    ) -> None:
+        """Run the endpoint, cutting the body off once it grows past the limit."""
+        received = 0
+        too_large = False
+        response_started = False
+        replaced = False
+
+        async def limited_receive() -> Message:
+            nonlocal received, too_large
+            message = replay.pop(0) if replay else await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > max_body_size:
+                    too_large = True
+                    # Makes the endpoint stop reading as if the client went away
+                    return {"type": "http.disconnect"}
+            return message
+
+        async def guarded_send(message: Message) -> None:
+            nonlocal response_started, replaced
+            if message["type"] == "http.response.start":
+                response_started = True
+                if too_large:
+                    # Replace whatever error the endpoint made of the cut-off body
+                    replaced = True
+                    await self._too_large_response(max_body_size)(scope, receive, send)
+            if not replaced:
+                await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except Exception:
+            if not too_large or response_started:
+                raise
+        if too_large and not response_started:
+            await self._too_large_response(max_body_size)(scope, receive, send)
+
+    @staticmethod
+    def _too_large_response(max_body_size: int) -> JSONResponse:
+        return JSONResponse(
+            status_code=413,
+            content={"detail": f"Request body exceeds maximum allowed size of {max_body_size} bytes"},
+        )
@@ -6,11 +6,23 @@ from .models import (
     Report,
     EvidenceTag,
     AuditLog,
+    UploadSession,
+    EvidenceBlob,
+    EvidenceHash,
+    EvidenceIntegrityCheck,
+    MerkleTree,
+    ArchiveManifest,
+    ArchiveMember,
+    EvidenceMetadata,
+    ImageHash,
     UserRole,
     CaseStatus,
     EvidenceType,
     EvidenceStatus,
     Priority,
+    UploadSessionStatus,
+    IntegrityOutcome,
+    StorageTier,
 )
 
 __all__ = [
@@ -21,9 +33,21 @@ __all__ = [
     "Report",
     "EvidenceTag",
     "AuditLog",
+    "UploadSession",
+    "EvidenceBlob",
+    "EvidenceHash",
+    "EvidenceIntegrityCheck",
+    "MerkleTree",
+    "ArchiveManifest",
+    "ArchiveMember",
+    "EvidenceMetadata",
+    "ImageHash",
     "UserRole",
     "CaseStatus",
     "EvidenceType",
     "EvidenceStatus",
     "Priority",
+    "UploadSessionStatus",
+    "IntegrityOutcome",
+    "StorageTier",
 ]
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Enum, Float
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, Boolean, Text, ForeignKey, Enum, Float, UniqueConstraint, LargeBinary, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -31,6 +31,21 @@ class EvidenceStatus(enum.Enum):
     processed = "processed"
     archived = "archived"
 
+class UploadSessionStatus(enum.Enum):
+    active = "active"
+    completing = "completing"
+    completed = "completed"
+    aborted = "aborted"
+
+class IntegrityOutcome(enum.Enum):
+    passed = "passed"
+    failed = "failed"
+    missing = "missing"
+
+class StorageTier(enum.Enum):
+    hot = "hot"
+    cold = "cold"
+
 class Priority(enum.Enum):
     low = "low"
     medium = "medium"
@@ -60,6 +75,11 @@ class User(Base):
 
 class Case(Base):
     __tablename__ = "cases"
+    __table_args__ = (
+        Index("ix_cases_assigned_to_status", "assigned_to", "status"),
+        Index("ix_cases_status", "status"),
+        Index("ix_cases_assigned_to_id", "assigned_to", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     case_number = Column(String(50), unique=True, index=True, nullable=False)
@@ -87,6 +107,11 @@ class Case(Base):
 
 class Evidence(Base):
     __tablename__ = "evidence"
+    __table_args__ = (
+        Index("ix_evidence_case_id_collected_at", "case_id", "collected_at"),
+        Index("ix_evidence_collected_by_collected_at", "collected_by", "collected_at"),
+        Index("ix_evidence_case_id_id", "case_id", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     evidence_number = Column(String(50), unique=True, index=True, nullable=False)
@@ -99,7 +124,7 @@ class Evidence(Base):
     # File information
     file_name = Column(String(255))
     file_path = Column(String(500))
-    file_size = Column(Integer)
+    file_size = Column(BigInteger)
     file_hash = Column(String(255))  # SHA-256 hash for integrity
     mime_type = Column(String(100))
     
@@ -118,9 +143,16 @@ class Evidence(Base):
     collected_by_user = relationship("User", back_populates="evidence_entries")
     custody_records = relationship("ChainOfCustody", back_populates="evidence")
     tags = relationship("EvidenceTag", back_populates="evidence")
+    upload_sessions = relationship("UploadSession", back_populates="evidence", cascade="all, delete-orphan")
+    hashes = relationship("EvidenceHash", back_populates="evidence", cascade="all, delete-orphan")
+    integrity_check = relationship("EvidenceIntegrityCheck", back_populates="evidence", uselist=False, cascade="all, delete-orphan")
 
 class ChainOfCustody(Base):
     __tablename__ = "chain_of_custody"
+    __table_args__ = (
+        Index("ix_chain_of_custody_evidence_id_timestamp", "evidence_id", "timestamp"),
+        Index("ix_chain_of_custody_evidence_id_id", "evidence_id", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     evidence_id = Column(Integer, ForeignKey("evidence.id"), nullable=False)
@@ -167,6 +199,11 @@ class EvidenceTag(Base):
 
 class AuditLog(Base):
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        Index("ix_audit_logs_user_id_timestamp_id", "user_id", "timestamp", "id"),
+        Index("ix_audit_logs_entity_type_entity_id_timestamp", "entity_type", "entity_id", "timestamp"),
+        Index("ix_audit_logs_timestamp_id", "timestamp", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -179,4 +216,124 @@ class AuditLog(Base):
     details = Column(Text)
     
     # Relationships
-    user = relationship("User", back_populates="audit_logs")
\ No newline at end of file
+    user = relationship("User", back_populates="audit_logs")
+
+class UploadSession(Base):
+    __tablename__ = "upload_sessions"
+    
+    id = Column(String(32), primary_key=True, index=True)
+    evidence_id = Column(Integer, ForeignKey("evidence.id"), nullable=False, index=True)
+    file_name = Column(String(255), nullable=False)
+    mime_type = Column(String(100))
+    total_size = Column(BigInteger, nullable=False)
+    chunk_size = Column(Integer, nullable=False)
+    total_chunks = Column(Integer, nullable=False)
+    status = Column(Enum(UploadSessionStatus), nullable=False, default=UploadSessionStatus.active)
+    created_by = Column(Integer, ForeignKey("users.id"), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    completed_at = Column(DateTime(timezone=True))
+    
+    # Relationships
+    evidence = relationship("Evidence", back_populates="upload_sessions")
+
+class EvidenceBlob(Base):
+    __tablename__ = "evidence_blobs"
+    
+    file_hash = Column(String(64), primary_key=True)  # SHA-256 of the content
+    file_size = Column(BigInteger, nullable=False)
+    ref_count = Column(Integer, nullable=False, default=0)
+    storage_backend = Column(String(20), nullable=False, default="local")  # local, s3
+    tier = Column(Enum(StorageTier), nullable=False, default=StorageTier.hot, index=True)
+    compressed = Column(Boolean, nullable=False, default=False)  # stored as seekable zlib frames
+    stored_size = Column(BigInteger)  # bytes on disk, differs from file_size when compressed
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+class EvidenceHash(Base):
+    __tablename__ = "evidence_hashes"
+    __table_args__ = (UniqueConstraint("evidence_id", "algorithm", name="uq_evidence_hashes_evidence_algorithm"),)
+    
+    id = Column(Integer, primary_key=True, index=True)
+    evidence_id = Column(Integer, ForeignKey("evidence.id"), nullable=False, index=True)
+    algorithm = Column(String(20), nullable=False)  # md5, sha1, sha256, sha512
+    digest = Column(String(128), nullable=False)
+    computed_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    # Relationships
+    evidence = relationship("Evidence", back_populates="hashes")
+
+class EvidenceIntegrityCheck(Base):
+    __tablename__ = "evidence_integrity_checks"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    evidence_id = Column(Integer, ForeignKey("evidence.id"), nullable=False, unique=True, index=True)
+    outcome = Column(Enum(IntegrityOutcome), nullable=False, index=True)
+    last_verified_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    expected_hash = Column(String(255))
+    observed_hash = Column(String(255))
+    source = Column(String(20))  # scanner, manual, batch
+    
+    # Relationships
+    evidence = relationship("Evidence", back_populates="integrity_check")
+
+class MerkleTree(Base):
+    __tablename__ = "merkle_trees"
+    
+    file_hash = Column(String(64), primary_key=True)  # SHA-256 of the whole file the tree describes
+    chunk_size = Column(Integer, nullable=False)
+    leaf_count = Column(Integer, nullable=False)
+    root_hash = Column(String(64), nullable=False)
+    leaves = Column(LargeBinary, nullable=False)  # Concatenated 32-byte SHA-256 leaf hashes
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+class ArchiveManifest(Base):
+    __tablename__ = "archive_manifests"
+    
+    file_hash = Column(String(64), primary_key=True)  # SHA-256 of the archive the manifest describes
+    archive_format = Column(String(10), nullable=False)  # zip, 7z, rar
+    member_count = Column(Integer, nullable=False, default=0)
+    total_size = Column(BigInteger, nullable=False, default=0)  # uncompressed size of all members
+    error = Column(Text)  # why the archive could not be (fully) read
+    indexed_at = Column(DateTime(timezone=True), server_default=func.now())
+
+class ArchiveMember(Base):
+    __tablename__ = "archive_members"
+    __table_args__ = (
+        UniqueConstraint("file_hash", "member_index", name="uq_archive_members_file_member"),
+        # Member list of one archive, paged in archive order
+        Index("ix_archive_members_file_hash_member_index_id", "file_hash", "member_index", "id"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    file_hash = Column(String(64), nullable=False, index=True)
+    member_index = Column(Integer, nullable=False)  # position in the archive's directory
+    path = Column(String(1024), nullable=False)
+    is_dir = Column(Boolean, nullable=False, default=False)
+    size = Column(BigInteger, nullable=False, default=0)
+    compressed_size = Column(BigInteger)
+    modified_at = Column(DateTime(timezone=True))
+    sha256 = Column(String(64), index=True)  # None for directories and encrypted members
+    encrypted = Column(Boolean, nullable=False, default=False)
+
+class EvidenceMetadata(Base):
+    __tablename__ = "evidence_metadata"
+    __table_args__ = (
+        UniqueConstraint("file_hash", "key", name="uq_evidence_metadata_file_key"),
+        Index("ix_evidence_metadata_key_value", "key", "value"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    file_hash = Column(String(64), nullable=False, index=True)  # SHA-256 of the file the metadata was read from
+    key = Column(String(100), nullable=False)  # e.g. exif.model, gps.latitude, document.author
+    value = Column(String(1024), nullable=False)
+    source = Column(String(20), nullable=False)  # image, docx, pdf
+    extracted_at = Column(DateTime(timezone=True), server_default=func.now())
+
+class ImageHash(Base):
+    __tablename__ = "image_hashes"
+    
+    id = Column(Integer, primary_key=True, index=True)  # lets the similarity index load new rows incrementally
+    file_hash = Column(String(64), nullable=False, unique=True, index=True)  # SHA-256 of the image
+    ahash = Column(BigInteger, nullable=False)  # 64-bit perceptual hashes, stored as signed integers
+    dhash = Column(BigInteger, nullable=False)
+    phash = Column(BigInteger, nullable=False)
+    computed_at = Column(DateTime(timezone=True), server_default=func.now())
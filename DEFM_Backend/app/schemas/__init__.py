@@ -11,6 +11,9 @@ __all__ = [
     "EvidenceTag", "EvidenceTagCreate", "EvidenceTagBase",
     "AuditLog",
     "DashboardStats", "RecentActivity", "DashboardData",
-    "FileUpload",
-    "UserRole", "CaseStatus", "EvidenceType", "EvidenceStatus", "Priority"
+    "FileUpload", "EvidenceHash", "IntegrityBatchRequest", "EvidenceArchiveRequest",
+    "EvidenceMetadata", "SimilarEvidence", "ArchiveManifest", "ArchiveMember",
+    "UploadSessionCreate", "UploadSession",
+    "UserRole", "CaseStatus", "EvidenceType", "EvidenceStatus", "Priority",
+    "UploadSessionStatus"
 ]
\ No newline at end of file
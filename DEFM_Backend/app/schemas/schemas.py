@@ -1,6 +1,6 @@
-from pydantic import BaseModel, EmailStr, validator
+from pydantic import BaseModel, EmailStr, Field, validator
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple
 from enum import Enum
 
 # Enums
@@ -43,6 +43,13 @@ class Priority(str, Enum):
     high = "high"
     critical = "critical"
 
+
+class UploadSessionStatus(str, Enum):
+    active = "active"
+    completing = "completing"
+    completed = "completed"
+    aborted = "aborted"
+
 # Base schemas
 
 
@@ -345,3 +352,127 @@ class FileUpload(BaseModel):
     content_type: str
     file_size: int
     file_hash: str
+    hashes: Dict[str, str] = {}
+
+
+class EvidenceHash(BaseModel):
+    algorithm: str
+    digest: str
+    computed_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+class EvidenceMetadata(BaseModel):
+    key: str
+    value: str
+    source: str
+    extracted_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+class SimilarEvidence(BaseModel):
+    evidence_id: int
+    evidence_number: str
+    case_id: int
+    title: str
+    file_name: Optional[str] = None
+    file_hash: Optional[str] = None
+    distance: int
+
+# Archive manifest schemas
+
+
+class ArchiveManifest(BaseModel):
+    file_hash: str
+    archive_format: str
+    member_count: int
+    total_size: int
+    error: Optional[str] = None
+    indexed_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class ArchiveMember(BaseModel):
+    id: int
+    member_index: int
+    path: str
+    is_dir: bool
+    size: int
+    compressed_size: Optional[int] = None
+    modified_at: Optional[datetime] = None
+    sha256: Optional[str] = None
+    encrypted: bool
+
+    class Config:
+        from_attributes = True
+
+# Resumable upload schemas
+
+
+class UploadSessionCreate(BaseModel):
+    file_name: str
+    total_size: int
+    chunk_size: Optional[int] = None
+    mime_type: Optional[str] = None
+
+    @validator("total_size")
+    def validate_total_size(cls, value):
+        if value <= 0:
+            raise ValueError("total_size must be positive")
+        return value
+
+    @validator("chunk_size")
+    def validate_chunk_size(cls, value):
+        if value is not None and value <= 0:
+            raise ValueError("chunk_size must be positive")
+        return value
+
+
+class UploadSession(BaseModel):
+    id: str
+    evidence_id: int
+    file_name: str
+    mime_type: Optional[str] = None
+    total_size: int
+    chunk_size: int
+    total_chunks: int
+    status: UploadSessionStatus
+    created_by: int
+    created_at: datetime
+    completed_at: Optional[datetime] = None
+    received_chunks: int = 0
+    missing_chunks: int = 0
+    # Inclusive (first, last) chunk index runs, at most 1000 of them
+    missing_chunk_ranges: List[Tuple[int, int]] = []
+
+    class Config:
+        from_attributes = True
+
+
+class EvidenceArchiveRequest(BaseModel):
+    evidence_ids: List[int]
+
+    @validator("evidence_ids")
+    def validate_evidence_ids(cls, value):
+        if not value:
+            raise ValueError("At least one evidence ID is required")
+        return value
+
+
+# Largest number of evidence items one batch integrity check may cover
+MAX_INTEGRITY_BATCH_SIZE = 1000
+
+
+class IntegrityBatchRequest(BaseModel):
+    evidence_ids: List[int] = Field(max_length=MAX_INTEGRITY_BATCH_SIZE)
+    force: bool = False
+
+    @validator("evidence_ids")
+    def validate_evidence_ids(cls, value):
+        if not value:
+            raise ValueError("At least one evidence ID is required")
+        return value
@@ -0,0 +1,157 @@
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import SessionLocal
+from app.models.models import ArchiveManifest, ArchiveMember, Evidence
+from app.services.processing_pool import processing_pool
+from app.services.storage_backend import backend_for
+from app.utils.archive_utils import (
+    ArchiveError,
+    detect_archive_format,
+    iter_archive_members,
+    stream_archive_member,
+)
+from typing import Iterator, List, Optional
+import asyncio
+import logging
+import os
+import weakref
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_EXTENSIONS = {"zip", "7z", "rar"}
+MEMBER_BATCH_SIZE = 500
+
+# Serialises indexing of the same content by the pipeline and on-demand requests
+_index_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+
+def is_archive_evidence(evidence: Evidence) -> bool:
+    """Check whether an evidence file is an archive we can list."""
+    extension = os.path.splitext(evidence.file_name or "")[1].lstrip(".").lower()
+    return extension in ARCHIVE_EXTENSIONS
+
+
+def index_archive(file_path: str, file_hash: str) -> Optional[int]:
+    """
+    Build the member manifest of a stored archive.
+
+    Runs in a worker process. Members are hashed while they are streamed
+    out of the archive and written in batches, so memory use does not grow
+    with the number of members. A previous manifest of the same content
+    is replaced.
+
+    Args:
+        file_path: Locator of the stored archive
+        file_hash: SHA-256 of the archive, which keys the manifest
+
+    Returns:
+        Number of members listed, or None if the file is not an archive
+    """
+    db = SessionLocal()
+    try:
+        with backend_for(file_path).open(file_path) as f:
+            archive_format = detect_archive_format(f)
+            if archive_format is None:
+                return None
+
+            db.query(ArchiveMember).filter(ArchiveMember.file_hash == file_hash).delete(synchronize_session=False)
+            db.query(ArchiveManifest).filter(ArchiveManifest.file_hash == file_hash).delete(synchronize_session=False)
+            db.commit()
+            # The manifest is added last, so its presence means the listing is complete
+            manifest = ArchiveManifest(file_hash=file_hash, archive_format=archive_format)
+
+            member_count = 0
+            total_size = 0
+            batch: List[ArchiveMember] = []
+            try:
+                for member in iter_archive_members(f, archive_format):
+                    batch.append(ArchiveMember(file_hash=file_hash, **member))
+                    member_count += 1
+                    total_size += member["size"] or 0
+                    if len(batch) >= MEMBER_BATCH_SIZE:
+                        db.add_all(batch)
+                        db.commit()
+                        batch = []
+            except ArchiveError as e:
+                # Keep what was listed before the archive turned out unreadable
+                manifest.error = str(e)
+            except Exception as e:
+                manifest.error = f"Archive could not be read: {str(e)}"
+
+            db.add_all(batch)
+            manifest.member_count = member_count
+            manifest.total_size = total_size
+            db.add(manifest)
+            db.commit()
+            return member_count
+    finally:
+        db.close()
+
+
+class ArchiveService:
+    """Service for the member manifests of archive evidence."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_manifest(self, file_hash: str, reload: bool = False) -> Optional[ArchiveManifest]:
+        return await self.db.get(ArchiveManifest, file_hash, populate_existing=reload)
+
+    def members_query(self, file_hash: str, prefix: Optional[str] = None) -> Select:
+        """
+        Build the query of an archive's members, to be sorted and paged by the caller.
+
+        Args:
+            file_hash: SHA-256 of the archive
+            prefix: Only members whose path starts with this
+        """
+        query = select(ArchiveMember).where(ArchiveMember.file_hash == file_hash)
+        if prefix:
+            query = query.where(ArchiveMember.path.startswith(prefix, autoescape=True))
+        return query
+
+    async def get_member(self, file_hash: str, member_id: int) -> Optional[ArchiveMember]:
+        return await self.db.scalar(select(ArchiveMember).where(
+            ArchiveMember.id == member_id,
+            ArchiveMember.file_hash == file_hash
+        ))
+
+    async def index(self, evidence: Evidence, force: bool = False) -> Optional[ArchiveManifest]:
+        """
+        List the members of archive evidence in the processing pool.
+
+        Content is indexed once; identical uploads share the manifest
+        unless force is set.
+
+        Returns:
+            The manifest, or None if the evidence is not an archive
+        """
+        if not evidence.file_path or not evidence.file_hash:
+            return None
+        file_hash, file_path = evidence.file_hash, evidence.file_path
+        lock = _index_locks.get(file_hash)
+        if lock is None:
+            lock = _index_locks[file_hash] = asyncio.Lock()
+        async with lock:
+            if not force:
+                # Re-read after waiting, another request may have just indexed it
+                manifest = await self.get_manifest(file_hash, reload=True)
+                if manifest is not None:
+                    return manifest
+            member_count = await processing_pool.run(index_archive, file_path, file_hash)
+        if member_count is None:
+            return None
+        logger.info(f"Indexed {member_count} archive members of {evidence.evidence_number}")
+        # The worker wrote through its own session
+        return await self.get_manifest(file_hash, reload=True)
+
+    @staticmethod
+    def stream_member(file_path: str, archive_format: str, member_path: str) -> Iterator[bytes]:
+        """Yield the content of one member without extracting the archive."""
+        with backend_for(file_path).open(file_path) as f:
+            yield from stream_archive_member(f, archive_format, member_path)
+
+
+async def archive_stage(db: AsyncSession, evidence: Evidence) -> None:
+    if is_archive_evidence(evidence):
+        await ArchiveService(db).index(evidence)
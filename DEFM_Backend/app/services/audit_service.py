@@ -1,4 +1,5 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.models import User, AuditLog
 from datetime import datetime
 from typing import Optional
@@ -10,7 +11,7 @@ logger = logging.getLogger(__name__)
 class AuditService:
     """Service for logging audit trail of user actions."""
     
-    def __init__(self, db: Session, current_user: User):
+    def __init__(self, db: AsyncSession, current_user: User):
         self.db = db
         self.current_user = current_user
     
@@ -50,8 +51,8 @@ class AuditService:
             )
             
             self.db.add(audit_log)
-            self.db.commit()
-            self.db.refresh(audit_log)
+            await self.db.commit()
+            await self.db.refresh(audit_log)
             
             logger.info(
                 f"Audit log created: {action} by user {self.current_user.username} "
@@ -62,10 +63,10 @@ class AuditService:
             
         except Exception as e:
             logger.error(f"Failed to create audit log: {str(e)}")
-            self.db.rollback()
+            await self.db.rollback()
             raise
     
-    def get_logs(
+    async def get_logs(
         self,
         skip: int = 0,
         limit: int = 100,
@@ -86,13 +87,16 @@ class AuditService:
         Returns:
             List of AuditLog entries
         """
-        query = self.db.query(AuditLog)
+        query = select(AuditLog)
         
         if action:
-            query = query.filter(AuditLog.action == action)
+            query = query.where(AuditLog.action == action)
         if entity_type:
-            query = query.filter(AuditLog.entity_type == entity_type)
+            query = query.where(AuditLog.entity_type == entity_type)
         if user_id:
-            query = query.filter(AuditLog.user_id == user_id)
+            query = query.where(AuditLog.user_id == user_id)
         
-        return query.order_by(AuditLog.timestamp.desc()).offset(skip).limit(limit).all()
+        result = await self.db.scalars(
+            query.order_by(AuditLog.timestamp.desc()).offset(skip).limit(limit)
+        )
+        return result.all()
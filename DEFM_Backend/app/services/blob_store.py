@@ -0,0 +1,583 @@
+from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.models.models import (
+    ArchiveManifest,
+    ArchiveMember,
+    Evidence,
+    EvidenceBlob,
+    EvidenceMetadata,
+    EvidenceStatus,
+    ImageHash,
+    MerkleTree,
+    StorageTier,
+)
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.services.rendition_service import delete_renditions
+from app.services.storage_backend import (
+    COMPRESSED_SUFFIX,
+    S3_SCHEME,
+    backend_for,
+    get_s3_backend,
+    get_storage_backend,
+)
+from app.utils.frame_compression import FrameReader, compress_frames
+from typing import BinaryIO, Iterable, Optional, Tuple
+import hashlib
+import logging
+import os
+import threading
+import uuid
+import zlib
+
+logger = logging.getLogger(__name__)
+
+# Changes to the same blob (ingest, release, compression, tier moves) are
+# serialized by one of these locks, picked by hash
+_BLOB_LOCK_STRIPES = 64
+_blob_locks = [threading.RLock() for _ in range(_BLOB_LOCK_STRIPES)]
+
+
+def blob_lock(file_hash: str) -> threading.RLock:
+    """Get the lock serializing changes to the blob with a SHA-256 hash."""
+    return _blob_locks[zlib.crc32(file_hash.encode()) % _BLOB_LOCK_STRIPES]
+
+
+def open_stored_file(file_path: str) -> BinaryIO:
+    """
+    Open a stored evidence file for reading its original bytes.
+
+    Works for local files, compressed archive blobs and object store
+    blobs alike, so callers don't need to know where the file is kept.
+    """
+    return backend_for(file_path).open(file_path)
+
+
+def stored_file_exists(file_path: Optional[str]) -> bool:
+    """Check whether a stored evidence file exists."""
+    if not file_path:
+        return False
+    return backend_for(file_path).exists(file_path)
+
+
+def stat_stored_file(file_path: str) -> Tuple[int, float]:
+    """
+    Get the original size and the modification time of a stored evidence file.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    return backend_for(file_path).stat(file_path)
+
+
+def stored_file_identity(file_path: str) -> Optional[str]:
+    """
+    Get a key identifying the current version of a stored evidence file.
+
+    Local files are identified by device, inode, size and change times,
+    objects by their ETag; None when the backend can't tell.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    return backend_for(file_path).identity(file_path)
+
+
+def new_blob_temp_path() -> str:
+    """Get a temp path in the hot tier to stream an incoming file to."""
+    # Picking the path needs no database access
+    return BlobStore(None).new_temp_path()
+
+
+def ingest_blob(temp_path: str, file_hash: str, file_size: int) -> str:
+    """
+    Move a fully written temp file into the store using a session of its own.
+
+    Request handlers run this in a worker thread, so the file move or
+    object upload doesn't block the event loop. See ``BlobStore.ingest``.
+    """
+    db = SessionLocal()
+    try:
+        return BlobStore(db).ingest(temp_path, file_hash, file_size)
+    finally:
+        db.close()
+
+
+def release_stored_files(stored_files: Iterable[Tuple[Optional[str], Optional[str]]]) -> None:
+    """
+    Release the stored files of evidence, given as (file path, file hash) pairs.
+
+    Uses a session of its own, like ``ingest_blob``.
+    """
+    db = SessionLocal()
+    try:
+        blob_store = BlobStore(db)
+        for file_path, file_hash in stored_files:
+            blob_store.release_file(file_path, file_hash)
+    finally:
+        db.close()
+
+
+async def replace_evidence_file(
+    db: AsyncSession,
+    evidence: Evidence,
+    temp_path: str,
+    file_hash: str,
+    file_size: int,
+    file_name: Optional[str],
+    mime_type: Optional[str]
+) -> str:
+    """
+    Store a new file for an evidence item and release the file it replaces.
+
+    The evidence row is only switched to the new file if it still points
+    at the file it had when ``evidence`` was loaded. Two concurrent uploads
+    to the same evidence would otherwise both release the previous file,
+    dropping its reference twice; the later one gets 409 instead.
+
+    Args:
+        db: Request session ``evidence`` was loaded in
+        evidence: Evidence to attach the file to
+        temp_path: Fully written temp file, consumed
+        file_hash: SHA-256 of the file
+        file_size: Size of the file in bytes
+        file_name: Original file name
+        mime_type: Declared content type
+
+    Returns:
+        Locator of the stored file
+    """
+    previous_path, previous_hash = evidence.file_path, evidence.file_hash
+    saved_path = await run_in_threadpool(ingest_blob, temp_path, file_hash, file_size)
+    try:
+        result = await db.execute(
+            update(Evidence)
+            .where(
+                Evidence.id == evidence.id,
+                Evidence.file_path.is_(None) if previous_path is None else Evidence.file_path == previous_path,
+                Evidence.file_hash.is_(None) if previous_hash is None else Evidence.file_hash == previous_hash,
+            )
+            .values(
+                file_name=file_name,
+                file_path=saved_path,
+                file_size=file_size,
+                file_hash=file_hash,
+                mime_type=mime_type,
+            )
+        )
+        if result.rowcount != 1:
+            raise HTTPException(
+                status_code=409,
+                detail="The evidence file was replaced by another upload, try again"
+            )
+        await db.commit()
+    except Exception:
+        # The evidence doesn't point at the new blob, so give back its reference
+        await db.rollback()
+        await run_in_threadpool(release_stored_files, [(saved_path, file_hash)])
+        raise
+
+    await run_in_threadpool(release_stored_files, [(previous_path, previous_hash)])
+    return saved_path
+
+
+def sync_archive_storage(file_hashes: Iterable[str]) -> None:
+    """
+    Compress or decompress blobs after the status of their evidence changed.
+
+    Meant to run as a background task, so it uses its own session.
+    """
+    if not settings.ARCHIVE_COMPRESSION_ENABLED:
+        return
+    db = SessionLocal()
+    try:
+        blob_store = BlobStore(db)
+        for file_hash in set(file_hashes):
+            if not file_hash:
+                continue
+            try:
+                blob_store.apply_archive_policy(file_hash)
+            except Exception as e:
+                logger.error(f"Failed to update archive storage of blob {file_hash}: {str(e)}")
+    finally:
+        db.close()
+
+
+class BlobStore:
+    """
+    Content-addressed store for evidence files.
+
+    Every distinct file is kept once under ``blobs/<aa>/<bb>/<sha256>`` and
+    shared by all evidence rows with the same ``file_hash``. The
+    ``evidence_blobs`` table counts the references so a blob is only removed
+    when the last evidence pointing at it goes away.
+
+    Blobs live in the hot tier under UPLOAD_DIRECTORY, or in the cold tier
+    under COLD_STORAGE_DIRECTORY once moved there by the tier migrator.
+    With STORAGE_BACKEND=s3 new blobs go to the object store instead; each
+    blob stays on the backend it was first stored on.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.tier_dirs = {StorageTier.hot: os.path.join(settings.UPLOAD_DIRECTORY, "blobs")}
+        if settings.COLD_STORAGE_DIRECTORY:
+            self.tier_dirs[StorageTier.cold] = os.path.join(settings.COLD_STORAGE_DIRECTORY, "blobs")
+
+    def blob_path(self, file_hash: str, tier: StorageTier = StorageTier.hot) -> str:
+        """Get the sharded path of the blob for a SHA-256 hash in a storage tier."""
+        return os.path.join(self.tier_dirs[tier], file_hash[:2], file_hash[2:4], file_hash)
+
+    def compressed_path(self, file_hash: str, tier: StorageTier = StorageTier.hot) -> str:
+        """Get the path of the compressed archive form of a blob."""
+        return self.blob_path(file_hash, tier) + COMPRESSED_SUFFIX
+
+    def tier_of(self, file_hash: str) -> StorageTier:
+        """Get the storage tier currently holding a blob."""
+        tier = self.db.query(EvidenceBlob.tier).filter(EvidenceBlob.file_hash == file_hash).scalar()
+        if tier is None or tier not in self.tier_dirs:
+            return StorageTier.hot
+        return tier
+
+    def backend_of(self, file_hash: str) -> str:
+        """Get the name of the storage backend holding a blob."""
+        backend = self.db.query(EvidenceBlob.storage_backend).filter(
+            EvidenceBlob.file_hash == file_hash
+        ).scalar()
+        return backend or "local"
+
+    def is_blob_path(self, file_path: Optional[str]) -> bool:
+        """Check whether a stored file path is managed by the blob store."""
+        if not file_path:
+            return False
+        if file_path.startswith(S3_SCHEME):
+            # Only blobs are ever stored in the object store
+            return True
+        file_path = os.path.abspath(file_path)
+        return any(
+            file_path.startswith(os.path.abspath(blobs_dir) + os.sep)
+            for blobs_dir in self.tier_dirs.values()
+        )
+
+    def new_temp_path(self, tier: StorageTier = StorageTier.hot) -> str:
+        """
+        Get a unique path to stream an incoming file to before its hash is known.
+
+        The temp directory sits on the same volume as the tier's blobs so
+        that files can be moved into place with a rename.
+        """
+        temp_dir = os.path.join(self.tier_dirs[tier], ".tmp")
+        os.makedirs(temp_dir, exist_ok=True)
+        return os.path.join(temp_dir, uuid.uuid4().hex)
+
+    def ingest(self, temp_path: str, file_hash: str, file_size: int) -> str:
+        """
+        Move a fully written temp file into the store and take a reference on it.
+
+        If a blob with the same hash already exists, the temp file is
+        discarded and the existing blob is shared, whichever tier holds it.
+        Runs under the blob's lock, so a concurrent ``release`` can't
+        remove the blob between taking the reference and checking for it.
+
+        Args:
+            temp_path: Path returned by ``new_temp_path`` holding the content
+            file_hash: SHA-256 of the content
+            file_size: Size of the content in bytes
+
+        Returns:
+            Path of the blob
+        """
+        with blob_lock(file_hash):
+            return self._ingest(temp_path, file_hash, file_size)
+
+    def _ingest(self, temp_path: str, file_hash: str, file_size: int) -> str:
+        self.acquire(file_hash, file_size)
+
+        backend = self.backend_of(file_hash)
+        if backend != "local":
+            return self._ingest_remote(temp_path, file_hash, file_size)
+
+        tier = self.tier_of(file_hash)
+        blob_path = self.blob_path(file_hash, tier)
+        compressed_path = self.compressed_path(file_hash, tier)
+        if os.path.exists(blob_path) or (tier != StorageTier.hot and os.path.exists(compressed_path)):
+            os.remove(temp_path)
+            logger.info(f"Blob {file_hash} already stored, reusing existing content")
+        elif os.path.exists(compressed_path):
+            # New live evidence for archived content: keep the fresh copy uncompressed
+            os.replace(temp_path, blob_path)
+            os.remove(compressed_path)
+            self._mark_compressed(file_hash, False, file_size)
+            logger.info(f"Blob {file_hash} restored from archive storage by new upload")
+        else:
+            os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+            os.replace(temp_path, blob_path)
+            logger.info(f"Blob stored: {blob_path} ({file_size} bytes)")
+
+        return blob_path
+
+    def _ingest_remote(self, temp_path: str, file_hash: str, file_size: int) -> str:
+        backend = get_s3_backend()
+        locator = backend.blob_locator(file_hash)
+        if backend.exists(locator):
+            os.remove(temp_path)
+            logger.info(f"Blob {file_hash} already stored, reusing existing content")
+        else:
+            try:
+                backend.put_file(temp_path, locator)
+            finally:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+            logger.info(f"Blob stored: {locator} ({file_size} bytes)")
+        return locator
+
+    def acquire(self, file_hash: str, file_size: int) -> None:
+        """Add one reference to a blob, registering it if it is new."""
+        updated = self.db.query(EvidenceBlob).filter(
+            EvidenceBlob.file_hash == file_hash
+        ).update(
+            {EvidenceBlob.ref_count: EvidenceBlob.ref_count + 1},
+            synchronize_session=False
+        )
+        if updated:
+            self.db.commit()
+            return
+
+        try:
+            self.db.add(EvidenceBlob(
+                file_hash=file_hash,
+                file_size=file_size,
+                stored_size=file_size,
+                ref_count=1,
+                storage_backend=get_storage_backend().name
+            ))
+            self.db.commit()
+        except IntegrityError:
+            # Another request registered the same blob first
+            self.db.rollback()
+            self.acquire(file_hash, file_size)
+
+    def release(self, file_hash: str) -> bool:
+        """
+        Drop one reference to a blob and delete it once nothing refers to it.
+
+        The row, its derived data and the stored files are all removed
+        under the blob's lock and before the transaction commits: an
+        ``ingest`` in this process waits for the lock, one in another
+        process for the row lock, and either then stores the content anew.
+
+        Returns:
+            True if the blob itself was removed
+        """
+        with blob_lock(file_hash):
+            try:
+                return self._release(file_hash)
+            except Exception:
+                self.db.rollback()
+                raise
+
+    def _release(self, file_hash: str) -> bool:
+        backend = self.backend_of(file_hash)
+        self.db.query(EvidenceBlob).filter(
+            EvidenceBlob.file_hash == file_hash
+        ).update(
+            {EvidenceBlob.ref_count: EvidenceBlob.ref_count - 1},
+            synchronize_session=False
+        )
+        deleted = self.db.query(EvidenceBlob).filter(
+            EvidenceBlob.file_hash == file_hash,
+            EvidenceBlob.ref_count <= 0
+        ).delete(synchronize_session=False)
+
+        if not deleted:
+            self.db.commit()
+            return False
+
+        self.db.query(MerkleTree).filter(MerkleTree.file_hash == file_hash).delete(synchronize_session=False)
+        self.db.query(ArchiveMember).filter(ArchiveMember.file_hash == file_hash).delete(synchronize_session=False)
+        self.db.query(ArchiveManifest).filter(ArchiveManifest.file_hash == file_hash).delete(synchronize_session=False)
+        self.db.query(EvidenceMetadata).filter(EvidenceMetadata.file_hash == file_hash).delete(synchronize_session=False)
+        self.db.query(ImageHash).filter(ImageHash.file_hash == file_hash).delete(synchronize_session=False)
+        delete_renditions(file_hash)
+
+        if backend != "local":
+            locator = get_s3_backend().blob_locator(file_hash)
+            try:
+                get_s3_backend().delete(locator)
+            except Exception as e:
+                logger.error(f"Failed to delete blob {locator}: {str(e)}")
+            self.db.commit()
+            return True
+
+        stored_paths = [
+            path
+            for tier in self.tier_dirs
+            for path in (self.blob_path(file_hash, tier), self.compressed_path(file_hash, tier))
+        ]
+        for blob_path in stored_paths:
+            try:
+                if os.path.exists(blob_path):
+                    os.remove(blob_path)
+                    logger.info(f"Blob deleted: {blob_path}")
+            except Exception as e:
+                logger.error(f"Failed to delete blob {blob_path}: {str(e)}")
+        self.db.commit()
+        return True
+
+    def apply_archive_policy(self, file_hash: str) -> None:
+        """
+        Keep a blob compressed exactly while all evidence referring to it is archived.
+
+        Only applies to local blobs; object stores have their own storage classes.
+        """
+        with blob_lock(file_hash):
+            self._apply_archive_policy(file_hash)
+
+    def _apply_archive_policy(self, file_hash: str) -> None:
+        if self.backend_of(file_hash) != "local":
+            return
+        statuses = {
+            status for (status,) in self.db.query(Evidence.status).filter(
+                Evidence.file_hash == file_hash,
+                Evidence.file_path == self.blob_path(file_hash, self.tier_of(file_hash))
+            )
+        }
+        if not statuses:
+            return
+        if statuses == {EvidenceStatus.archived}:
+            self.compress(file_hash)
+        else:
+            self.decompress(file_hash)
+
+    def compress(self, file_hash: str) -> bool:
+        """
+        Rewrite a blob as seekable zlib frames.
+
+        The original bytes are hashed while compressing and the result is
+        read back before the uncompressed blob is removed, so a corrupt
+        blob is never archived and the stored SHA-256 keeps verifying.
+
+        Returns:
+            True if the blob was compressed
+        """
+        tier = self.tier_of(file_hash)
+        blob_path = self.blob_path(file_hash, tier)
+        if not os.path.exists(blob_path):
+            return False
+
+        temp_path = self.new_temp_path(tier)
+        try:
+            sha256_hash = hashlib.sha256()
+            with open(blob_path, "rb") as source, open(temp_path, "wb") as destination:
+                original_size = compress_frames(
+                    source,
+                    destination,
+                    settings.ARCHIVE_FRAME_SIZE,
+                    settings.ARCHIVE_COMPRESSION_LEVEL,
+                    on_data=sha256_hash.update,
+                )
+            if sha256_hash.hexdigest() != file_hash:
+                logger.error(f"Blob {file_hash} does not match its hash, not archiving it")
+                return False
+
+            with FrameReader.open(temp_path) as reader:
+                if self._hash_stream(reader) != file_hash:
+                    logger.error(f"Compressed copy of blob {file_hash} failed verification")
+                    return False
+
+            stored_size = os.path.getsize(temp_path)
+            os.replace(temp_path, self.compressed_path(file_hash, tier))
+            os.remove(blob_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        self._mark_compressed(file_hash, True, stored_size)
+        logger.info(f"Blob {file_hash} archived: {original_size} -> {stored_size} bytes")
+        return True
+
+    def decompress(self, file_hash: str) -> bool:
+        """
+        Restore the uncompressed form of an archived blob.
+
+        Returns:
+            True if the blob was decompressed
+        """
+        tier = self.tier_of(file_hash)
+        compressed_path = self.compressed_path(file_hash, tier)
+        if not os.path.exists(compressed_path):
+            return False
+
+        temp_path = self.new_temp_path(tier)
+        try:
+            sha256_hash = hashlib.sha256()
+            with FrameReader.open(compressed_path) as reader, open(temp_path, "wb") as destination:
+                for chunk in iter(lambda: reader.read(settings.UPLOAD_CHUNK_SIZE), b""):
+                    sha256_hash.update(chunk)
+                    destination.write(chunk)
+            if sha256_hash.hexdigest() != file_hash:
+                logger.error(f"Archived blob {file_hash} does not match its hash, leaving it compressed")
+                return False
+
+            original_size = os.path.getsize(temp_path)
+            os.replace(temp_path, self.blob_path(file_hash, tier))
+            os.remove(compressed_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        self._mark_compressed(file_hash, False, original_size)
+        logger.info(f"Blob {file_hash} restored from archive storage")
+        return True
+
+    def pending_references(self, file_hash: str) -> int:
+        """
+        Count references to a blob not yet backed by a committed evidence row.
+
+        ``ingest`` takes its reference before the caller commits the
+        evidence pointing at the returned path, so a positive count means
+        that path may still be handed out and must stay where it is.
+        """
+        ref_count = self.db.query(EvidenceBlob.ref_count).filter(
+            EvidenceBlob.file_hash == file_hash
+        ).scalar() or 0
+        referencing = self.db.query(Evidence.id).filter(Evidence.file_hash == file_hash).count()
+        return max(ref_count - referencing, 0)
+
+    def _mark_compressed(self, file_hash: str, compressed: bool, stored_size: int) -> None:
+        self.db.query(EvidenceBlob).filter(EvidenceBlob.file_hash == file_hash).update(
+            {EvidenceBlob.compressed: compressed, EvidenceBlob.stored_size: stored_size},
+            synchronize_session=False
+        )
+        self.db.commit()
+
+    @staticmethod
+    def _hash_stream(stream: BinaryIO) -> str:
+        sha256_hash = hashlib.sha256()
+        for chunk in iter(lambda: stream.read(settings.UPLOAD_CHUNK_SIZE), b""):
+            sha256_hash.update(chunk)
+        return sha256_hash.hexdigest()
+
+    def release_file(self, file_path: Optional[str], file_hash: Optional[str]) -> None:
+        """
+        Release the stored file of an evidence item.
+
+        Blob-backed files drop a reference; files saved before the blob
+        store existed are removed directly as before.
+        """
+        if not file_path:
+            return
+
+        if self.is_blob_path(file_path) and file_hash:
+            self.release(file_hash)
+            return
+
+        if os.path.exists(file_path):
+            try:
+                os.remove(file_path)
+            except Exception as e:
+                logger.error(f"Failed to delete physical file: {str(e)}")
@@ -0,0 +1,89 @@
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.models import Evidence, EvidenceHash
+from app.core.config import settings
+from fastapi import HTTPException
+from datetime import datetime
+from typing import Dict, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class EvidenceHashService:
+    """Service for the per-evidence digests computed alongside SHA-256."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def record_hashes(self, evidence: Evidence, digests: Dict[str, str]) -> None:
+        """
+        Replace the stored digests of an evidence item.
+
+        Args:
+            evidence: Evidence the digests belong to
+            digests: Mapping of algorithm name to hexadecimal digest
+        """
+        await self.db.execute(delete(EvidenceHash).where(EvidenceHash.evidence_id == evidence.id))
+
+        computed_at = datetime.utcnow()
+        for algorithm, digest in digests.items():
+            self.db.add(EvidenceHash(
+                evidence_id=evidence.id,
+                algorithm=algorithm,
+                digest=digest,
+                computed_at=computed_at
+            ))
+        await self.db.commit()
+
+    async def get_hashes(self, evidence: Evidence) -> Dict[str, str]:
+        """
+        Get the stored digests of an evidence item.
+
+        ``Evidence.file_hash`` is used as the SHA-256 for files uploaded
+        before per-algorithm digests were recorded.
+        """
+        digests = {
+            row.algorithm: row.digest
+            for row in await self.db.scalars(select(EvidenceHash).where(EvidenceHash.evidence_id == evidence.id))
+        }
+        if evidence.file_hash and "sha256" not in digests:
+            digests["sha256"] = evidence.file_hash
+        return digests
+
+    async def list_hashes(self, evidence_id: int) -> List[EvidenceHash]:
+        """List the stored digest rows of an evidence item."""
+        result = await self.db.scalars(
+            select(EvidenceHash).where(EvidenceHash.evidence_id == evidence_id).order_by(EvidenceHash.algorithm)
+        )
+        return result.all()
+
+
+def parse_hash_algorithms(algorithms: Optional[str]) -> List[str]:
+    """
+    Parse the ``algorithms`` query parameter of integrity checks.
+
+    Args:
+        algorithms: Comma-separated algorithm names, ``all`` or None for sha256 only
+
+    Returns:
+        List of algorithm names, always including sha256
+    """
+    if not algorithms:
+        return ["sha256"]
+    if algorithms.strip().lower() == "all":
+        return settings.evidence_hash_algorithms_list
+
+    requested = [alg.strip().lower() for alg in algorithms.split(",") if alg.strip()]
+    unsupported = [alg for alg in requested if alg not in settings.evidence_hash_algorithms_list]
+    if unsupported:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"Unsupported hash algorithm(s): {', '.join(unsupported)}. "
+                f"Available: {', '.join(settings.evidence_hash_algorithms_list)}"
+            )
+        )
+    if "sha256" not in requested:
+        requested.append("sha256")
+    return requested
@@ -0,0 +1,68 @@
+from app.core.database import AsyncSessionLocal
+from app.core.config import settings
+from app.models.models import Evidence
+from app.services.archive_service import archive_stage
+from app.services.metadata_service import metadata_stage
+from app.services.similarity_service import perceptual_hash_stage
+from app.services.rendition_service import RenditionService
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Awaitable, Callable, List, Optional, Set
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+Stage = Callable[[AsyncSession, Evidence], Awaitable[None]]
+
+
+async def rendition_stage(db: AsyncSession, evidence: Evidence) -> None:
+    await RenditionService().generate(evidence)
+
+
+class EvidenceProcessingPipeline:
+    """
+    Post-upload processing of evidence files.
+
+    Each upload schedules the stages to run in the background, one after
+    the other; a failing stage is logged and does not stop the others.
+    Heavy work inside a stage runs in the shared processing pool.
+    """
+
+    def __init__(self, stages: Optional[List[Stage]] = None):
+        self.stages = stages if stages is not None else [metadata_stage, rendition_stage, perceptual_hash_stage, archive_stage]
+        self._tasks: Set[asyncio.Task] = set()
+
+    def submit(self, evidence_id: int) -> None:
+        """Schedule processing of a freshly uploaded evidence file."""
+        if not settings.EVIDENCE_PROCESSING_ENABLED:
+            return
+        task = asyncio.create_task(self.process(evidence_id))
+        # Keep a reference so the task isn't garbage collected mid-run
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def process(self, evidence_id: int) -> None:
+        """Run all stages for an evidence item."""
+        async with AsyncSessionLocal() as db:
+            evidence = await db.get(Evidence, evidence_id)
+            if evidence is None or not evidence.file_path:
+                return
+            evidence_number = evidence.evidence_number
+            for stage in self.stages:
+                try:
+                    await stage(db, evidence)
+                except Exception as e:
+                    logger.error(f"Processing stage {stage.__name__} failed for {evidence_number}: {str(e)}")
+                    await db.rollback()
+                    # The rollback expired the evidence; reload it for the next stage
+                    evidence = await db.get(Evidence, evidence_id)
+                    if evidence is None:
+                        return
+
+    async def drain(self) -> None:
+        """Wait for scheduled processing to finish."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+evidence_pipeline = EvidenceProcessingPipeline()
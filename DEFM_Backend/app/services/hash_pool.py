@@ -0,0 +1,294 @@
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from app.core.config import settings
+from app.services.blob_store import open_stored_file, stored_file_identity
+from app.utils.file_utils import MultiHasher
+from app.utils.merkle import hash_leaf
+from fastapi import HTTPException
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class DigestCache:
+    """
+    Recently computed digests keyed by file identity.
+
+    An entry is only used while the file's identity (device, inode, size,
+    mtime and ctime for local files) is unchanged and the entry is younger
+    than the freshness window. Silent corruption that leaves the inode
+    untouched is only caught once the entry expires, which bounds how
+    stale a cached verification can be.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, ttl_seconds: Optional[int] = None):
+        self.max_entries = max_entries if max_entries is not None else settings.HASH_CACHE_MAX_ENTRIES
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.HASH_CACHE_TTL_SECONDS
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, identity: str, algorithms: List[str]) -> Optional[Tuple[Dict[str, str], float]]:
+        """
+        Get cached digests of all requested algorithms.
+
+        Returns:
+            The digests and the time (epoch seconds) they were computed, or None
+        """
+        with self._lock:
+            entry = self._entries.get(identity)
+            if entry is not None:
+                computed_at, digests = entry
+                if time.time() - computed_at > self.ttl_seconds:
+                    del self._entries[identity]
+                elif all(algorithm in digests for algorithm in algorithms):
+                    self._entries.move_to_end(identity)
+                    self.hits += 1
+                    return {algorithm: digests[algorithm] for algorithm in algorithms}, computed_at
+            self.misses += 1
+            return None
+
+    def put(self, identity: str, digests: Dict[str, str]) -> None:
+        if self.ttl_seconds <= 0 or self.max_entries <= 0:
+            return
+        with self._lock:
+            entry = self._entries.pop(identity, None)
+            # Keep digests of other algorithms computed recently for the same version
+            merged = {**entry[1], **digests} if entry and time.time() - entry[0] <= self.ttl_seconds else dict(digests)
+            self._entries[identity] = (time.time(), merged)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+class HashWorkerPool:
+    """
+    Bounded thread pool for hashing evidence files off the event loop.
+
+    hashlib releases the GIL while digesting large buffers, so a thread
+    pool scales across cores without the pickling cost of processes.
+    Requests for the same file and algorithms that overlap in time share
+    a single computation.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, max_queue: Optional[int] = None):
+        self.max_workers = max_workers or settings.HASH_WORKER_POOL_SIZE
+        self.max_queue = max_queue or settings.HASH_WORKER_MAX_QUEUE
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._inflight: Dict[Tuple[str, Tuple[str, ...]], Future] = {}
+        self._lock = threading.Lock()
+        self.cache = DigestCache()
+
+        self._queued = 0
+        self._running = 0
+        self._submitted = 0
+        self._shared = 0
+        self._completed = 0
+        self._failed = 0
+        self._bytes_hashed = 0
+        self._busy_seconds = 0.0
+
+    def submit(self, file_path: str, algorithms: List[str]) -> Future:
+        """
+        Queue a file for hashing, joining an identical job already in flight.
+
+        Args:
+            file_path: Path of the file to hash
+            algorithms: hashlib algorithm names to compute in one pass
+
+        Returns:
+            Future resolving to a mapping of algorithm name to hexadecimal digest
+        """
+        key = (os.path.abspath(file_path), tuple(sorted(algorithms)))
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                self._shared += 1
+                return future
+
+            if self._queued >= self.max_queue:
+                raise HTTPException(
+                    status_code=503,
+                    detail="Hashing queue is full, try again later",
+                    headers={"Retry-After": "5"}
+                )
+
+            self._queued += 1
+            self._submitted += 1
+            future = self._get_executor().submit(self._hash_file, file_path, list(key[1]))
+            self._inflight[key] = future
+
+        future.add_done_callback(lambda _: self._forget(key))
+        return future
+
+    async def compute_digests(self, file_path: str, algorithms: List[str]) -> Dict[str, str]:
+        """Hash a file in the pool and await the digests."""
+        future = self.submit(file_path, algorithms)
+        # Shield the shared job so one cancelled request doesn't cancel it for the others
+        return await asyncio.shield(asyncio.wrap_future(future))
+
+    async def verified_digests(
+        self,
+        file_path: str,
+        algorithms: List[str],
+        force: bool = False
+    ) -> Tuple[Dict[str, str], Optional[float]]:
+        """
+        Get the current digests of a file, reusing a recent result for the same file version.
+
+        Args:
+            file_path: Path of the file to hash
+            algorithms: hashlib algorithm names
+            force: Always re-read the file
+
+        Returns:
+            The digests, and the time (epoch seconds) a cached result was
+            computed, or None if the file was hashed now
+        """
+        identity = await asyncio.to_thread(stored_file_identity, file_path)
+        if identity is not None and not force:
+            cached = self.cache.get(identity, algorithms)
+            if cached is not None:
+                return cached
+
+        digests = await self.compute_digests(file_path, algorithms)
+        # Only cache if the file didn't change while it was being read
+        if identity is not None and identity == await asyncio.to_thread(stored_file_identity, file_path):
+            self.cache.put(identity, digests)
+        return digests, None
+
+    async def hash_chunks(self, file_path: str, chunk_size: int, indexes: List[int]) -> Dict[int, bytes]:
+        """
+        Compute Merkle leaf hashes of selected chunks in parallel.
+
+        At most twice as many chunks as there are workers are in flight at
+        once, which bounds memory to a few chunks per worker.
+
+        Args:
+            file_path: Path of the file
+            chunk_size: Merkle chunk size in bytes
+            indexes: Chunk indexes to hash
+
+        Returns:
+            Mapping of chunk index to leaf hash
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            executor = self._get_executor()
+        window = self.max_workers * 2
+        results: Dict[int, bytes] = {}
+        pending = set()
+
+        def collect(done) -> None:
+            for task in done:
+                index, leaf = task.result()
+                results[index] = leaf
+
+        for index in indexes:
+            if len(pending) >= window:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                collect(done)
+            pending.add(loop.run_in_executor(
+                executor, self._hash_chunk, file_path, chunk_size, index
+            ))
+        if pending:
+            done, _ = await asyncio.wait(pending)
+            collect(done)
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        """Get queue depth and throughput counters for sizing the pool."""
+        with self._lock:
+            throughput = self._bytes_hashed / self._busy_seconds if self._busy_seconds else 0.0
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "queued": self._queued,
+                "running": self._running,
+                "submitted": self._submitted,
+                "shared": self._shared,
+                "completed": self._completed,
+                "failed": self._failed,
+                "bytes_hashed": self._bytes_hashed,
+                "busy_seconds": round(self._busy_seconds, 3),
+                "throughput_bytes_per_second": round(throughput, 1),
+                "cache": self.cache.stats(),
+            }
+
+    def shutdown(self) -> None:
+        """Stop the worker threads, waiting for running jobs."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _hash_file(self, file_path: str, algorithms: List[str]) -> Dict[str, str]:
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+
+        started = time.monotonic()
+        hasher = MultiHasher(algorithms)
+        hashed = 0
+        try:
+            with open_stored_file(file_path) as f:
+                for chunk in iter(lambda: f.read(settings.UPLOAD_CHUNK_SIZE), b""):
+                    hasher.update(chunk)
+                    hashed += len(chunk)
+            digests = hasher.hexdigests()
+        except Exception:
+            with self._lock:
+                self._failed += 1
+            raise
+        finally:
+            elapsed = time.monotonic() - started
+            with self._lock:
+                self._running -= 1
+                self._bytes_hashed += hashed
+                self._busy_seconds += elapsed
+
+        with self._lock:
+            self._completed += 1
+        logger.info(f"Hashed {file_path} ({hashed} bytes) in {elapsed:.2f}s")
+        return digests
+
+    def _hash_chunk(self, file_path: str, chunk_size: int, index: int) -> Tuple[int, bytes]:
+        started = time.monotonic()
+        with open_stored_file(file_path) as f:
+            f.seek(index * chunk_size)
+            data = f.read(chunk_size)
+        leaf = hash_leaf(data)
+        with self._lock:
+            self._bytes_hashed += len(data)
+            self._busy_seconds += time.monotonic() - started
+        return index, leaf
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="hash-worker"
+            )
+        return self._executor
+
+    def _forget(self, key: Tuple[str, Tuple[str, ...]]) -> None:
+        with self._lock:
+            self._inflight.pop(key, None)
+
+
+hash_pool = HashWorkerPool()
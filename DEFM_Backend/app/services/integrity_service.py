@@ -0,0 +1,210 @@
+from sqlalchemy.orm import Session
+from app.models.models import Evidence, EvidenceIntegrityCheck, IntegrityOutcome
+from app.core.database import SessionLocal
+from app.core.config import settings
+from app.services.blob_store import open_stored_file, stored_file_exists
+from app.utils.frame_compression import FrameFormatError
+from datetime import datetime
+from typing import Dict, Optional
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class IntegrityService:
+    """Service for persisting and querying evidence integrity check results."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def record_result(
+        self,
+        evidence: Evidence,
+        outcome: IntegrityOutcome,
+        observed_hash: Optional[str] = None,
+        source: str = "manual"
+    ) -> EvidenceIntegrityCheck:
+        """
+        Store the latest integrity check result of an evidence item.
+
+        Args:
+            evidence: The verified evidence
+            outcome: passed, failed or missing
+            observed_hash: SHA-256 computed during the check
+            source: What triggered the check (scanner, manual, batch)
+
+        Returns:
+            The updated EvidenceIntegrityCheck row
+        """
+        check = self.db.query(EvidenceIntegrityCheck).filter(
+            EvidenceIntegrityCheck.evidence_id == evidence.id
+        ).first()
+        if check is None:
+            check = EvidenceIntegrityCheck(evidence_id=evidence.id)
+            self.db.add(check)
+
+        check.outcome = outcome
+        check.last_verified_at = datetime.utcnow()
+        check.expected_hash = evidence.file_hash
+        check.observed_hash = observed_hash
+        check.source = source
+
+        self.db.commit()
+        return check
+
+    def count_alerts(self) -> int:
+        """Count evidence whose latest integrity check did not pass."""
+        return self.db.query(EvidenceIntegrityCheck).filter(
+            EvidenceIntegrityCheck.outcome != IntegrityOutcome.passed
+        ).count()
+
+
+def hash_file_throttled(
+    file_path: str,
+    bytes_per_second: int,
+    stop_event: Optional[threading.Event] = None
+) -> Optional[str]:
+    """
+    Compute the SHA-256 of a file without reading faster than a bandwidth budget.
+
+    Returns:
+        Hexadecimal hash, or None if stopped before the end of the file
+    """
+    sha256_hash = hashlib.sha256()
+    started = time.monotonic()
+    read = 0
+    with open_stored_file(file_path) as f:
+        for chunk in iter(lambda: f.read(settings.UPLOAD_CHUNK_SIZE), b""):
+            if stop_event is not None and stop_event.is_set():
+                return None
+            sha256_hash.update(chunk)
+            read += len(chunk)
+
+            # Sleep off any time we are ahead of the budget
+            ahead = read / bytes_per_second - (time.monotonic() - started)
+            if ahead > 0:
+                time.sleep(ahead)
+    return sha256_hash.hexdigest()
+
+
+class IntegrityScanner:
+    """
+    Background job that re-hashes every stored evidence file.
+
+    Each batch picks the files that have gone longest without a check
+    (never-checked files first) and reads them under the
+    INTEGRITY_SCAN_BANDWIDTH budget so the scanner doesn't starve uploads
+    and downloads of disk bandwidth.
+    """
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self._stop_event = threading.Event()
+
+    def start(self) -> None:
+        """Start the scanner loop on the running event loop."""
+        if self._task is None:
+            self._stop_event.clear()
+            self._task = asyncio.create_task(self._run())
+            logger.info("Integrity scanner started")
+
+    async def stop(self) -> None:
+        """Stop the scanner, interrupting the file being hashed."""
+        if self._task is None:
+            return
+        self._stop_event.set()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("Integrity scanner stopped")
+
+    async def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                await asyncio.to_thread(self.scan_batch)
+            except Exception as e:
+                logger.error(f"Integrity scan batch failed: {str(e)}")
+            await asyncio.sleep(settings.INTEGRITY_SCAN_INTERVAL_SECONDS)
+
+    def scan_batch(self) -> int:
+        """
+        Verify the next batch of evidence files.
+
+        Returns:
+            Number of evidence items checked
+        """
+        db = SessionLocal()
+        try:
+            batch = (
+                db.query(Evidence)
+                .outerjoin(EvidenceIntegrityCheck, EvidenceIntegrityCheck.evidence_id == Evidence.id)
+                .filter(Evidence.file_path.isnot(None), Evidence.file_hash.isnot(None))
+                .order_by(
+                    EvidenceIntegrityCheck.last_verified_at.isnot(None),
+                    EvidenceIntegrityCheck.last_verified_at,
+                    Evidence.id,
+                )
+                .limit(settings.INTEGRITY_SCAN_BATCH_SIZE)
+                .all()
+            )
+
+            integrity_service = IntegrityService(db)
+            # Deduplicated blobs are shared, so hash each path once per batch;
+            # None marks a path that couldn't be read
+            hashed: Dict[str, Optional[str]] = {}
+            checked = 0
+            for evidence in batch:
+                if self._stop_event.is_set():
+                    break
+
+                if not stored_file_exists(evidence.file_path):
+                    integrity_service.record_result(evidence, IntegrityOutcome.missing, source="scanner")
+                    logger.warning(f"Integrity scan: file missing for {evidence.evidence_number}")
+                    checked += 1
+                    continue
+
+                if evidence.file_path in hashed:
+                    current_hash = hashed[evidence.file_path]
+                else:
+                    try:
+                        current_hash = hash_file_throttled(
+                            evidence.file_path,
+                            settings.INTEGRITY_SCAN_BANDWIDTH,
+                            self._stop_event,
+                        )
+                    except (OSError, FrameFormatError) as e:
+                        # A bad sector or corrupt blob is an integrity failure,
+                        # not a reason to stop the scan at this file every time
+                        current_hash = None
+                        logger.error(f"Integrity scan: cannot read file of {evidence.evidence_number}: {str(e)}")
+                    else:
+                        if current_hash is None:
+                            break
+                    hashed[evidence.file_path] = current_hash
+
+                if current_hash is None:
+                    integrity_service.record_result(evidence, IntegrityOutcome.failed, source="scanner")
+                    checked += 1
+                    continue
+
+                outcome = IntegrityOutcome.passed if current_hash == evidence.file_hash else IntegrityOutcome.failed
+                integrity_service.record_result(evidence, outcome, current_hash, source="scanner")
+                if outcome == IntegrityOutcome.failed:
+                    logger.warning(f"Integrity scan: hash mismatch for {evidence.evidence_number}")
+                checked += 1
+
+            if checked:
+                logger.info(f"Integrity scan batch verified {checked} evidence file(s)")
+            return checked
+        finally:
+            db.close()
+
+
+integrity_scanner = IntegrityScanner()
@@ -0,0 +1,107 @@
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.concurrency import run_in_threadpool
+from app.models.models import Evidence, MerkleTree
+from app.services.blob_store import stat_stored_file
+from app.services.hash_pool import hash_pool
+from app.utils.merkle import (
+    MerkleTreeBuilder,
+    corrupted_ranges,
+    merkle_root,
+    pack_leaves,
+    unpack_leaves,
+)
+from typing import Any, Dict, Optional
+import logging
+import random
+
+logger = logging.getLogger(__name__)
+
+
+class MerkleService:
+    """Service for the per-file Merkle trees used for chunk-level verification."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def record_tree(self, file_hash: str, builder: MerkleTreeBuilder) -> MerkleTree:
+        """
+        Store the Merkle tree of a file unless its content already has one.
+
+        Trees are keyed by the file's SHA-256, so deduplicated blobs share
+        a single tree.
+        """
+        tree = await self.get_tree(file_hash)
+        if tree is not None:
+            return tree
+
+        leaves = builder.finish()
+        tree = MerkleTree(
+            file_hash=file_hash,
+            chunk_size=builder.chunk_size,
+            leaf_count=len(leaves),
+            root_hash=merkle_root(leaves),
+            leaves=pack_leaves(leaves)
+        )
+        try:
+            # A savepoint, so a lost race doesn't expire the caller's objects
+            async with self.db.begin_nested():
+                self.db.add(tree)
+        except IntegrityError:
+            # Same content stored concurrently by another upload
+            return await self.get_tree(file_hash)
+        await self.db.commit()
+        return tree
+
+    async def get_tree(self, file_hash: str) -> Optional[MerkleTree]:
+        """Get the Merkle tree of a file by its SHA-256."""
+        return await self.db.scalar(select(MerkleTree).where(MerkleTree.file_hash == file_hash))
+
+    async def delete_tree(self, file_hash: str) -> None:
+        """Remove the Merkle tree of content that is no longer stored."""
+        await self.db.execute(delete(MerkleTree).where(MerkleTree.file_hash == file_hash))
+        await self.db.commit()
+
+    async def verify_chunks(self, evidence: Evidence, tree: MerkleTree, sample: int = 0) -> Dict[str, Any]:
+        """
+        Re-hash chunks of an evidence file in parallel and compare them to its tree.
+
+        Args:
+            evidence: Evidence whose file is checked
+            tree: Stored Merkle tree of the file
+            sample: Number of randomly chosen chunks to check, 0 for all
+
+        Returns:
+            Verification report including the corrupted byte ranges
+        """
+        leaves = unpack_leaves(tree.leaves)
+        tree_consistent = merkle_root(leaves) == tree.root_hash
+
+        if sample and sample < tree.leaf_count:
+            indexes = sorted(random.SystemRandom().sample(range(tree.leaf_count), sample))
+        else:
+            indexes = list(range(tree.leaf_count))
+
+        current = await hash_pool.hash_chunks(evidence.file_path, tree.chunk_size, indexes)
+        corrupted = [index for index in indexes if current[index] != leaves[index]]
+
+        current_size, _ = await run_in_threadpool(stat_stored_file, evidence.file_path)
+        size_matches = current_size == evidence.file_size
+
+        return {
+            "evidence_id": evidence.id,
+            "evidence_number": evidence.evidence_number,
+            "file_hash": tree.file_hash,
+            "merkle_root": tree.root_hash,
+            "tree_consistent": tree_consistent,
+            "chunk_size": tree.chunk_size,
+            "total_chunks": tree.leaf_count,
+            "checked_chunks": len(indexes),
+            "sampled": len(indexes) < tree.leaf_count,
+            "expected_size": evidence.file_size,
+            "current_size": current_size,
+            "corrupted_chunks": corrupted,
+            "corrupted_ranges": corrupted_ranges(corrupted, tree.chunk_size, evidence.file_size or 0),
+            "integrity_verified": tree_consistent and size_matches and not corrupted,
+        }
@@ -0,0 +1,71 @@
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.models import Evidence, EvidenceMetadata
+from app.services.processing_pool import processing_pool
+from app.services.storage_backend import backend_for
+from app.utils.metadata_utils import extract_metadata, metadata_kind
+from typing import Dict, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def read_file_metadata(file_path: str, kind: str) -> Dict[str, str]:
+    """Extract the embedded metadata of a stored file. Runs in a worker process."""
+    with backend_for(file_path).open(file_path) as f:
+        return extract_metadata(f, kind)
+
+
+class MetadataService:
+    """Service for metadata extracted from evidence files (EXIF, document properties)."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_metadata(self, file_hash: str) -> List[EvidenceMetadata]:
+        result = await self.db.scalars(
+            select(EvidenceMetadata).where(EvidenceMetadata.file_hash == file_hash).order_by(EvidenceMetadata.key)
+        )
+        return result.all()
+
+    async def has_metadata(self, file_hash: str) -> bool:
+        return await self.db.scalar(
+            select(EvidenceMetadata.id).where(EvidenceMetadata.file_hash == file_hash).limit(1)
+        ) is not None
+
+    async def store(self, file_hash: str, source: str, values: Dict[str, str]) -> List[EvidenceMetadata]:
+        """Replace the metadata rows of a file."""
+        await self.db.execute(delete(EvidenceMetadata).where(EvidenceMetadata.file_hash == file_hash))
+        rows = [
+            EvidenceMetadata(file_hash=file_hash, key=key, value=value, source=source)
+            for key, value in sorted(values.items())
+        ]
+        self.db.add_all(rows)
+        await self.db.commit()
+        return rows
+
+    async def extract(self, evidence: Evidence, force: bool = False) -> Optional[List[EvidenceMetadata]]:
+        """
+        Extract the metadata of an evidence file in the processing pool.
+
+        Identical content is only parsed once unless force is set.
+
+        Returns:
+            The stored rows, or None if the file type carries no metadata we read
+        """
+        if not evidence.file_path or not evidence.file_hash:
+            return None
+        kind = metadata_kind(evidence.file_name, evidence.mime_type)
+        if kind is None:
+            return None
+        if not force and await self.has_metadata(evidence.file_hash):
+            return await self.get_metadata(evidence.file_hash)
+
+        values = await processing_pool.run(read_file_metadata, evidence.file_path, kind)
+        rows = await self.store(evidence.file_hash, kind, values)
+        logger.info(f"Extracted {len(rows)} metadata fields from {evidence.evidence_number}")
+        return rows
+
+
+async def metadata_stage(db: AsyncSession, evidence: Evidence) -> None:
+    await MetadataService(db).extract(evidence)
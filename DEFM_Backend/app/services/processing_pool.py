@@ -0,0 +1,81 @@
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from app.core.config import settings
+from typing import Any, Callable, Dict, Optional
+import asyncio
+import logging
+import multiprocessing
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class ProcessingPool:
+    """
+    Process pool for CPU-bound evidence processing (image decoding, parsing).
+
+    Unlike hashing, this work holds the GIL, so it runs in separate
+    processes to keep request handling responsive. Workers are started
+    with ``spawn`` because the API process runs other threads, which
+    ``fork`` does not copy safely.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or settings.PROCESSING_POOL_SIZE
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a picklable top-level function in a worker process and await its result."""
+        with self._lock:
+            executor = self._get_executor()
+            self._submitted += 1
+        loop = asyncio.get_running_loop()
+        try:
+            result = await loop.run_in_executor(executor, func, *args)
+        except BrokenProcessPool:
+            # A worker died (e.g. killed while decoding a hostile file);
+            # start a fresh pool for the next job instead of failing forever
+            with self._lock:
+                self._failed += 1
+                if self._executor is executor:
+                    self._executor = None
+            executor.shutdown(wait=False)
+            raise
+        except Exception:
+            with self._lock:
+                self._failed += 1
+            raise
+        with self._lock:
+            self._completed += 1
+        return result
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+            }
+
+    def shutdown(self) -> None:
+        """Stop the worker processes, waiting for running jobs."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+
+processing_pool = ProcessingPool()
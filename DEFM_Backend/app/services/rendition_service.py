@@ -0,0 +1,119 @@
+from app.core.config import settings
+from app.models.models import Evidence
+from app.services.processing_pool import processing_pool
+from app.services.storage_backend import backend_for
+from app.utils.metadata_utils import IMAGE_EXTENSIONS
+from typing import List, Optional
+import logging
+import os
+import shutil
+import uuid
+
+logger = logging.getLogger(__name__)
+
+RENDITION_FORMAT = "WEBP"
+RENDITION_MEDIA_TYPE = "image/webp"
+
+
+def renditions_dir(file_hash: str) -> str:
+    """Get the cache directory of the renditions of a file, shared by identical content."""
+    return os.path.join(settings.UPLOAD_DIRECTORY, "renditions", file_hash[:2], file_hash[2:4], file_hash)
+
+
+def rendition_path(file_hash: str, size: int) -> str:
+    return os.path.join(renditions_dir(file_hash), f"{size}.webp")
+
+
+def is_image_evidence(evidence: Evidence) -> bool:
+    """Check whether an evidence file is an image we can render previews of."""
+    if evidence.mime_type and evidence.mime_type.startswith("image/"):
+        return True
+    extension = os.path.splitext(evidence.file_name or "")[1].lstrip(".").lower()
+    return extension in IMAGE_EXTENSIONS
+
+
+def render_thumbnails(file_path: str, file_hash: str, sizes: List[int]) -> List[int]:
+    """
+    Decode an image once and write a thumbnail for each size.
+
+    Runs in a worker process. Each thumbnail is written to a temp file and
+    renamed into place, so readers never see a partial rendition.
+
+    Args:
+        file_path: Locator of the stored image
+        file_hash: SHA-256 of the image, which keys the cache
+        sizes: Longest edge in pixels of each rendition
+
+    Returns:
+        The sizes rendered
+    """
+    from PIL import Image, ImageOps
+
+    output_dir = renditions_dir(file_hash)
+    os.makedirs(output_dir, exist_ok=True)
+    rendered = []
+    with backend_for(file_path).open(file_path) as f, Image.open(f) as image:
+        # Let JPEG decode at reduced scale when that is still big enough
+        image.draft("RGB", (max(sizes), max(sizes)))
+        image = ImageOps.exif_transpose(image)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+
+        for size in sorted(sizes, reverse=True):
+            thumbnail = image.copy()
+            thumbnail.thumbnail((size, size), Image.Resampling.LANCZOS)
+            temp_path = os.path.join(output_dir, f".{uuid.uuid4().hex}.tmp")
+            try:
+                thumbnail.save(temp_path, RENDITION_FORMAT, quality=80, method=4)
+                os.replace(temp_path, rendition_path(file_hash, size))
+            finally:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+            rendered.append(size)
+    return rendered
+
+
+class RenditionService:
+    """Service for the cached thumbnail renditions of image evidence."""
+
+    @staticmethod
+    def sizes() -> List[int]:
+        return settings.thumbnail_sizes_list
+
+    async def generate(self, evidence: Evidence) -> List[int]:
+        """
+        Render any missing thumbnails of an image evidence file in the processing pool.
+
+        Returns:
+            The sizes rendered, empty if all were already cached
+        """
+        if not evidence.file_path or not evidence.file_hash or not is_image_evidence(evidence):
+            return []
+        missing = [
+            size for size in self.sizes()
+            if not os.path.exists(rendition_path(evidence.file_hash, size))
+        ]
+        if not missing:
+            return []
+        rendered = await processing_pool.run(render_thumbnails, evidence.file_path, evidence.file_hash, missing)
+        logger.info(f"Rendered thumbnails {rendered} for {evidence.evidence_number}")
+        return rendered
+
+    async def get_rendition(self, evidence: Evidence, size: int) -> Optional[str]:
+        """
+        Get the path of a thumbnail, rendering it now if it is not cached yet.
+
+        Returns:
+            Path of the rendition, or None if the evidence has no image
+        """
+        if not evidence.file_hash or not is_image_evidence(evidence):
+            return None
+        path = rendition_path(evidence.file_hash, size)
+        if not os.path.exists(path):
+            await self.generate(evidence)
+        return path if os.path.exists(path) else None
+
+
+def delete_renditions(file_hash: str) -> None:
+    """Remove the cached renditions of content that is no longer stored."""
+    shutil.rmtree(renditions_dir(file_hash), ignore_errors=True)
@@ -1,4 +1,6 @@
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.models import Report, Case, Evidence
 from typing import Optional
 from datetime import datetime
@@ -16,7 +18,7 @@ logger = logging.getLogger(__name__)
 class ReportService:
     """Service for generating reports."""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.reports_dir = "./reports"
         os.makedirs(self.reports_dir, exist_ok=True)
@@ -40,7 +42,7 @@ class ReportService:
         """
         try:
             # Get case data
-            case = self.db.query(Case).filter(Case.id == case_id).first()
+            case = await self.db.get(Case, case_id)
             if not case:
                 raise ValueError(f"Case {case_id} not found")
             
@@ -87,9 +89,9 @@ class ReportService:
             story.append(Spacer(1, 20))
             
             # Evidence summary
-            evidence_items = self.db.query(Evidence).filter(
-                Evidence.case_id == case_id
-            ).all()
+            evidence_items = (await self.db.scalars(
+                select(Evidence).where(Evidence.case_id == case_id)
+            )).all()
             
             if evidence_items:
                 story.append(Paragraph("<b>Evidence Items:</b>", styles['Heading2']))
@@ -117,8 +119,8 @@ class ReportService:
                 
                 story.append(evidence_table)
             
-            # Build PDF
-            doc.build(story)
+            # Build PDF; layout is CPU-bound, so keep it off the event loop
+            await run_in_threadpool(doc.build, story)
             
             # Create report record
             report = Report(
@@ -132,8 +134,8 @@ class ReportService:
             )
             
             self.db.add(report)
-            self.db.commit()
-            self.db.refresh(report)
+            await self.db.commit()
+            await self.db.refresh(report)
             
             logger.info(f"Report generated: {filepath}")
             
@@ -141,23 +143,26 @@ class ReportService:
             
         except Exception as e:
             logger.error(f"Failed to generate report: {str(e)}")
-            self.db.rollback()
+            await self.db.rollback()
             raise
     
-    def get_report(self, report_id: int) -> Optional[Report]:
+    async def get_report(self, report_id: int) -> Optional[Report]:
         """Get a report by ID."""
-        return self.db.query(Report).filter(Report.id == report_id).first()
+        return await self.db.get(Report, report_id)
     
-    def list_reports(
+    async def list_reports(
         self,
         case_id: Optional[int] = None,
         skip: int = 0,
         limit: int = 100
     ):
         """List reports with optional filtering."""
-        query = self.db.query(Report)
+        query = select(Report)
         
         if case_id:
-            query = query.filter(Report.case_id == case_id)
+            query = query.where(Report.case_id == case_id)
         
-        return query.order_by(Report.generated_at.desc()).offset(skip).limit(limit).all()
+        result = await self.db.scalars(
+            query.order_by(Report.generated_at.desc()).offset(skip).limit(limit)
+        )
+        return result.all()
@@ -0,0 +1,278 @@
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import SessionLocal
+from app.models.models import Evidence, ImageHash
+from app.services.processing_pool import processing_pool
+from app.services.rendition_service import is_image_evidence
+from app.services.storage_backend import backend_for
+from app.utils.perceptual_hash import (
+    HASH_TYPES,
+    compute_perceptual_hashes,
+    hamming_distances,
+    to_signed,
+    to_unsigned,
+)
+from itertools import combinations
+from typing import Dict, List, Optional, Tuple
+import logging
+import threading
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_BITS = 16
+SEGMENTS = 64 // SEGMENT_BITS
+LOAD_BATCH_SIZE = 50000
+# Index matches looked up in the database per query, nearest first
+RESOLVE_BATCH_SIZE = 500
+
+
+def hash_image_file(file_path: str) -> Dict[str, int]:
+    """Compute the perceptual hashes of a stored image. Runs in a worker process."""
+    with backend_for(file_path).open(file_path) as f:
+        return compute_perceptual_hashes(f)
+
+
+def _segment_masks(radius: int) -> np.ndarray:
+    """All 16-bit masks with at most ``radius`` bits set."""
+    masks = [0]
+    for bits in range(1, radius + 1):
+        for positions in combinations(range(SEGMENT_BITS), bits):
+            masks.append(sum(1 << position for position in positions))
+    return np.array(masks, dtype=np.uint16)
+
+
+class MultiIndexHashTable:
+    """
+    Hamming-distance search over 64-bit hashes by multi-index hashing.
+
+    Each hash is split into four 16-bit segments with a sorted index per
+    segment. If two hashes differ in at most ``d`` bits, at least one
+    segment differs in at most ``d // 4`` bits, so a query probes each
+    segment index for the few values within that radius and only checks
+    the full distance of those candidates, instead of scanning every hash.
+    Radii so wide that many rows are candidates fall back to a vectorized
+    scan.
+    """
+
+    def __init__(self):
+        self.hashes = np.empty(0, dtype=np.uint64)
+        self.ids = np.empty(0, dtype=np.int64)
+        self._pending_hashes: List[int] = []
+        self._pending_ids: List[int] = []
+        self._sorted_segments: List[np.ndarray] = []
+        self._segment_order: List[np.ndarray] = []
+        self._masks: Dict[int, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.hashes) + len(self._pending_hashes)
+
+    def add(self, row_id: int, value: int) -> None:
+        self._pending_ids.append(row_id)
+        self._pending_hashes.append(value)
+
+    def query(self, value: int, max_distance: int) -> List[Tuple[int, int]]:
+        """
+        Find the hashes within a Hamming distance of a value.
+
+        Returns:
+            (row id, distance) pairs, nearest first
+        """
+        self._merge_pending()
+        if not len(self.hashes):
+            return []
+
+        masks = self._masks.get(max_distance // SEGMENTS)
+        if masks is None:
+            masks = self._masks[max_distance // SEGMENTS] = _segment_masks(max_distance // SEGMENTS)
+
+        # Uniformly spread hashes hit about len(masks) / 2**16 of the rows per segment
+        if len(masks) * SEGMENTS > (1 << SEGMENT_BITS) // 8:
+            rows = np.arange(len(self.hashes))
+        else:
+            rows = self._candidates(value, masks)
+            if rows is None:
+                # Clustered hashes: the probes hit many rows, and a scan is cheaper
+                rows = np.arange(len(self.hashes))
+            elif not len(rows):
+                return []
+
+        distances = hamming_distances(self.hashes[rows], value)
+        within = distances <= max_distance
+        rows, distances = rows[within], distances[within]
+        order = np.argsort(distances, kind="stable")
+        return [(int(self.ids[row]), int(distance)) for row, distance in zip(rows[order], distances[order])]
+
+    def _candidates(self, value: int, masks: np.ndarray) -> Optional[np.ndarray]:
+        """Rows sharing a segment within the probe radius, or None if that is a large share of all rows."""
+        ranges = []
+        for segment in range(SEGMENTS):
+            shift = SEGMENT_BITS * (SEGMENTS - 1 - segment)
+            probes = np.bitwise_xor(masks, np.uint16((value >> shift) & 0xFFFF))
+            sorted_values = self._sorted_segments[segment]
+            starts = np.searchsorted(sorted_values, probes, side="left")
+            lengths = np.searchsorted(sorted_values, probes, side="right") - starts
+            ranges.append((segment, starts, lengths))
+
+        if sum(int(lengths.sum()) for _, _, lengths in ranges) > len(self.hashes) // 8:
+            return None
+        candidates = []
+        for segment, starts, lengths in ranges:
+            total = int(lengths.sum())
+            if total:
+                # Positions of all hits: each probe's [start, end) range, concatenated
+                offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+                candidates.append(self._segment_order[segment][offsets + np.arange(total)])
+        if not candidates:
+            return np.empty(0, dtype=np.int64)
+        return np.unique(np.concatenate(candidates))
+
+    def _merge_pending(self) -> None:
+        if not self._pending_hashes:
+            return
+        self.hashes = np.concatenate([self.hashes, np.array(self._pending_hashes, dtype=np.uint64)])
+        self.ids = np.concatenate([self.ids, np.array(self._pending_ids, dtype=np.int64)])
+        self._pending_hashes, self._pending_ids = [], []
+
+        self._sorted_segments, self._segment_order = [], []
+        for segment in range(SEGMENTS):
+            shift = np.uint64(SEGMENT_BITS * (SEGMENTS - 1 - segment))
+            values = ((self.hashes >> shift) & np.uint64(0xFFFF)).astype(np.uint16)
+            # Stable sort of 16-bit keys is a radix sort in NumPy
+            order = np.argsort(values, kind="stable")
+            self._segment_order.append(order)
+            self._sorted_segments.append(values[order])
+
+
+class SimilarityIndex:
+    """
+    In-memory similarity index over the stored perceptual hashes of one type.
+
+    The index loads rows it has not seen yet before each query, so hashes
+    written by other processes are picked up. Rows of deleted images stay
+    in the index until restart and are dropped when results are resolved.
+    """
+
+    def __init__(self, hash_type: str):
+        self.hash_type = hash_type
+        self.table = MultiIndexHashTable()
+        self._last_id = 0
+        self._lock = threading.Lock()
+
+    def query(self, value: int, max_distance: int) -> List[Tuple[int, int]]:
+        with self._lock:
+            self._load_new_rows()
+            return self.table.query(value, max_distance)
+
+    def _load_new_rows(self) -> None:
+        column = getattr(ImageHash, self.hash_type)
+        db = SessionLocal()
+        try:
+            while True:
+                rows = db.query(ImageHash.id, column).filter(
+                    ImageHash.id > self._last_id
+                ).order_by(ImageHash.id).limit(LOAD_BATCH_SIZE).all()
+                for row_id, value in rows:
+                    self.table.add(row_id, to_unsigned(value))
+                if rows:
+                    self._last_id = rows[-1][0]
+                if len(rows) < LOAD_BATCH_SIZE:
+                    break
+        finally:
+            db.close()
+
+
+similarity_indexes = {hash_type: SimilarityIndex(hash_type) for hash_type in HASH_TYPES}
+
+
+class SimilarityService:
+    """Service for perceptual hashes of image evidence and similarity search."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_hashes(self, file_hash: str) -> Optional[ImageHash]:
+        return await self.db.scalar(select(ImageHash).where(ImageHash.file_hash == file_hash))
+
+    async def compute(self, evidence: Evidence) -> Optional[ImageHash]:
+        """
+        Compute and store the perceptual hashes of image evidence in the processing pool.
+
+        Returns:
+            The stored hashes, or None if the evidence is not an image
+        """
+        if not evidence.file_path or not evidence.file_hash or not is_image_evidence(evidence):
+            return None
+        file_hash = evidence.file_hash
+        existing = await self.get_hashes(file_hash)
+        if existing is not None:
+            return existing
+
+        hashes = await processing_pool.run(hash_image_file, evidence.file_path)
+        row = ImageHash(
+            file_hash=file_hash,
+            **{hash_type: to_signed(value) for hash_type, value in hashes.items()}
+        )
+        try:
+            # A savepoint, so a lost race doesn't expire the evidence later stages read
+            async with self.db.begin_nested():
+                self.db.add(row)
+        except IntegrityError:
+            # Identical content uploaded concurrently was hashed first
+            return await self.get_hashes(file_hash)
+        await self.db.commit()
+        return row
+
+    async def find_similar(
+        self,
+        evidence_id: int,
+        image_hash: ImageHash,
+        hash_type: str = "phash",
+        max_distance: int = 8,
+        limit: int = 50
+    ) -> List[Tuple[Evidence, int]]:
+        """
+        Find evidence other than ``evidence_id`` whose image is within a Hamming distance.
+
+        The index lookup is CPU-bound and runs in a worker thread. Matches
+        are resolved to evidence nearest first, a batch at a time, and only
+        until ``limit`` results are certain, so a wide radius over a large
+        index doesn't load every match.
+
+        Returns:
+            (evidence, distance) pairs, nearest first
+        """
+        value = to_unsigned(getattr(image_hash, hash_type))
+        matches = await run_in_threadpool(similarity_indexes[hash_type].query, value, max_distance)
+        if not matches:
+            return []
+
+        results: List[Tuple[Evidence, int]] = []
+        for start in range(0, len(matches), RESOLVE_BATCH_SIZE):
+            batch = matches[start:start + RESOLVE_BATCH_SIZE]
+            # Matches come nearest first; later ones can only tie the last result kept
+            if len(results) >= limit and batch[0][1] > results[limit - 1][1]:
+                break
+            distance_by_id = dict(batch)
+            distances: Dict[str, int] = {
+                file_hash: distance_by_id[row_id]
+                for row_id, file_hash in await self.db.execute(
+                    select(ImageHash.id, ImageHash.file_hash).where(ImageHash.id.in_(distance_by_id))
+                )
+            }
+            if not distances:
+                # Rows of deleted images
+                continue
+            for other in await self.db.scalars(select(Evidence).where(
+                Evidence.file_hash.in_(distances),
+                Evidence.id != evidence_id
+            )):
+                results.append((other, distances[other.file_hash]))
+            results.sort(key=lambda result: (result[1], result[0].id))
+        return results[:limit]
+
+
+async def perceptual_hash_stage(db: AsyncSession, evidence: Evidence) -> None:
+    await SimilarityService(db).compute(evidence)
@@ -0,0 +1,353 @@
+from abc import ABC, abstractmethod
+from app.core.config import settings
+from app.utils.frame_compression import FrameReader
+from datetime import datetime, timezone
+from typing import Any, BinaryIO, Dict, Optional, Tuple
+import io
+import itertools
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+COMPRESSED_SUFFIX = ".zf"
+S3_SCHEME = "s3://"
+
+
+class StorageBackend(ABC):
+    """
+    Where evidence file content is kept.
+
+    Stored files are addressed by the locator saved in
+    ``Evidence.file_path``: a filesystem path for the local backend, an
+    ``s3://bucket/key`` URL for the object store.
+    """
+
+    name: str
+
+    @abstractmethod
+    def open(self, locator: str) -> BinaryIO:
+        """Open a stored file for seekable reading of its original bytes."""
+
+    @abstractmethod
+    def exists(self, locator: str) -> bool:
+        """Check whether a stored file exists."""
+
+    @abstractmethod
+    def stat(self, locator: str) -> Tuple[int, float]:
+        """
+        Get the original size and modification time of a stored file.
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+
+    def identity(self, locator: str) -> Optional[str]:
+        """
+        Get a key that changes whenever the stored file may have changed.
+
+        Returns:
+            The identity, or None if the backend can't tell
+        """
+        return None
+
+    @abstractmethod
+    def put_file(self, local_path: str, locator: str) -> None:
+        """Store a local file at a locator, consuming the local file."""
+
+    @abstractmethod
+    def delete(self, locator: str) -> None:
+        """Delete a stored file."""
+
+
+class LocalStorageBackend(StorageBackend):
+    """
+    Evidence files on a locally mounted filesystem.
+
+    Files moved to the compressed archive format are read through a
+    seekable ``FrameReader``, so callers don't need to know how a file is
+    stored.
+    """
+
+    name = "local"
+
+    def open(self, locator: str) -> BinaryIO:
+        try:
+            return open(locator, "rb")
+        except FileNotFoundError:
+            compressed_path = locator + COMPRESSED_SUFFIX
+            if not os.path.exists(compressed_path):
+                raise
+            return FrameReader.open(compressed_path)
+
+    def exists(self, locator: str) -> bool:
+        return os.path.exists(locator) or os.path.exists(locator + COMPRESSED_SUFFIX)
+
+    def stat(self, locator: str) -> Tuple[int, float]:
+        try:
+            stat_result = os.stat(locator)
+            return stat_result.st_size, stat_result.st_mtime
+        except FileNotFoundError:
+            compressed_path = locator + COMPRESSED_SUFFIX
+            mtime = os.stat(compressed_path).st_mtime
+            with FrameReader.open(compressed_path) as reader:
+                return reader.original_size, mtime
+
+    def identity(self, locator: str) -> Optional[str]:
+        try:
+            stat_result = os.stat(locator)
+        except FileNotFoundError:
+            stat_result = os.stat(locator + COMPRESSED_SUFFIX)
+            locator += COMPRESSED_SUFFIX
+        # Rewriting, replacing or touching the file changes at least one of these
+        return (
+            f"{locator}:{stat_result.st_dev}:{stat_result.st_ino}:{stat_result.st_size}:"
+            f"{stat_result.st_mtime_ns}:{stat_result.st_ctime_ns}"
+        )
+
+    def put_file(self, local_path: str, locator: str) -> None:
+        os.makedirs(os.path.dirname(locator), exist_ok=True)
+        os.replace(local_path, locator)
+
+    def delete(self, locator: str) -> None:
+        for path in (locator, locator + COMPRESSED_SUFFIX):
+            if os.path.exists(path):
+                os.remove(path)
+                logger.info(f"File deleted: {path}")
+
+
+class S3RangeReader(io.RawIOBase):
+    """
+    Seekable reader of an S3 object that fetches only the byte ranges it needs.
+
+    Each miss issues one ranged GET covering the read plus
+    ``read_ahead`` bytes, so sequential reads in small pieces don't turn
+    into one request per piece.
+    """
+
+    def __init__(self, client: Any, bucket: str, key: str, size: int, read_ahead: int):
+        self._client = client
+        self._bucket = bucket
+        self._key = key
+        self.size = size
+        self._read_ahead = read_ahead
+        self._position = 0
+        self._buffer_start = 0
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError("Negative seek position")
+        self._position = position
+        return position
+
+    def readinto(self, buffer) -> int:
+        view = memoryview(buffer).cast("B")
+        if self._position >= self.size or not len(view):
+            return 0
+
+        within = self._position - self._buffer_start
+        if not 0 <= within < len(self._buffer):
+            end = min(self._position + max(len(view), self._read_ahead), self.size) - 1
+            response = self._client.get_object(
+                Bucket=self._bucket, Key=self._key, Range=f"bytes={self._position}-{end}"
+            )
+            self._buffer = response["Body"].read()
+            self._buffer_start = self._position
+            within = 0
+
+        take = min(len(view), len(self._buffer) - within)
+        view[:take] = self._buffer[within:within + take]
+        self._position += take
+        return take
+
+
+class S3StorageBackend(StorageBackend):
+    """
+    Evidence files in an S3-compatible object store (AWS S3, MinIO, ...).
+
+    Needs the optional ``boto3`` package. One client, with a connection
+    pool of S3_MAX_POOL_CONNECTIONS, is shared by all threads. Files are
+    uploaded with multipart uploads in S3_MULTIPART_CHUNK_SIZE parts and
+    read with ranged GETs, so neither direction holds a whole file in memory.
+    """
+
+    name = "s3"
+
+    def __init__(self):
+        if not settings.S3_BUCKET:
+            raise RuntimeError("S3_BUCKET must be set to use the s3 storage backend")
+        self.bucket = settings.S3_BUCKET
+        self.prefix = settings.S3_PREFIX.strip("/")
+        self._client = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> Any:
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = self._create_client()
+        return self._client
+
+    @staticmethod
+    def _create_client() -> Any:
+        try:
+            import boto3
+            from botocore.config import Config
+        except ImportError:
+            raise RuntimeError("The s3 storage backend requires boto3 (pip install boto3)")
+
+        return boto3.client(
+            "s3",
+            endpoint_url=settings.S3_ENDPOINT_URL,
+            region_name=settings.S3_REGION,
+            aws_access_key_id=settings.S3_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.S3_SECRET_ACCESS_KEY,
+            config=Config(
+                max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS,
+                retries={"max_attempts": 5, "mode": "standard"},
+            ),
+        )
+
+    def blob_locator(self, file_hash: str) -> str:
+        """Get the locator of the object holding a blob, sharded like local blobs."""
+        key = "/".join(part for part in (self.prefix, "blobs", file_hash[:2], file_hash[2:4], file_hash) if part)
+        return f"{S3_SCHEME}{self.bucket}/{key}"
+
+    def open(self, locator: str) -> BinaryIO:
+        bucket, key = parse_s3_locator(locator)
+        size, _ = self.stat(locator)
+        return S3RangeReader(self.client, bucket, key, size, settings.S3_READ_AHEAD_SIZE)
+
+    def exists(self, locator: str) -> bool:
+        try:
+            self.stat(locator)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def stat(self, locator: str) -> Tuple[int, float]:
+        bucket, key = parse_s3_locator(locator)
+        try:
+            head = self.client.head_object(Bucket=bucket, Key=key)
+        except Exception as e:
+            if _is_not_found(e):
+                raise FileNotFoundError(locator)
+            raise
+        last_modified = head.get("LastModified") or datetime.now(timezone.utc)
+        return head["ContentLength"], last_modified.timestamp()
+
+    def identity(self, locator: str) -> Optional[str]:
+        bucket, key = parse_s3_locator(locator)
+        try:
+            head = self.client.head_object(Bucket=bucket, Key=key)
+        except Exception as e:
+            if _is_not_found(e):
+                raise FileNotFoundError(locator)
+            raise
+        last_modified = head.get("LastModified")
+        return f"{locator}:{head['ContentLength']}:{head.get('ETag')}:{last_modified.timestamp() if last_modified else ''}"
+
+    def put_file(self, local_path: str, locator: str) -> None:
+        with open(local_path, "rb") as f:
+            self.put_stream(f, locator)
+        os.remove(local_path)
+
+    def put_stream(self, stream: BinaryIO, locator: str) -> None:
+        """
+        Upload a stream with a multipart upload, one part in memory at a time.
+
+        Streams that fit in a single part are sent with a plain PUT.
+        """
+        bucket, key = parse_s3_locator(locator)
+        part_size = max(settings.S3_MULTIPART_CHUNK_SIZE, 5 * 1024 * 1024)
+
+        first_part = stream.read(part_size)
+        next_part = stream.read(part_size) if len(first_part) == part_size else b""
+        if not next_part:
+            self.client.put_object(Bucket=bucket, Key=key, Body=first_part)
+            logger.info(f"Stored {locator} ({len(first_part)} bytes)")
+            return
+
+        upload_id = self.client.create_multipart_upload(Bucket=bucket, Key=key)["UploadId"]
+        try:
+            parts = []
+            total = 0
+            chunks = itertools.chain([first_part, next_part], iter(lambda: stream.read(part_size), b""))
+            for part_number, data in enumerate(chunks, start=1):
+                response = self.client.upload_part(
+                    Bucket=bucket, Key=key, UploadId=upload_id, PartNumber=part_number, Body=data
+                )
+                parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+                total += len(data)
+            self.client.complete_multipart_upload(
+                Bucket=bucket, Key=key, UploadId=upload_id, MultipartUpload={"Parts": parts}
+            )
+        except Exception:
+            self.client.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
+            raise
+        logger.info(f"Stored {locator} ({total} bytes in {len(parts)} parts)")
+
+    def delete(self, locator: str) -> None:
+        bucket, key = parse_s3_locator(locator)
+        self.client.delete_object(Bucket=bucket, Key=key)
+        logger.info(f"Object deleted: {locator}")
+
+
+def parse_s3_locator(locator: str) -> Tuple[str, str]:
+    """Split an ``s3://bucket/key`` locator into bucket and key."""
+    bucket, _, key = locator[len(S3_SCHEME):].partition("/")
+    return bucket, key
+
+
+def _is_not_found(error: Exception) -> bool:
+    response: Dict[str, Any] = getattr(error, "response", None) or {}
+    code = str(response.get("Error", {}).get("Code", ""))
+    return code in ("404", "NoSuchKey", "NotFound")
+
+
+_local_backend = LocalStorageBackend()
+_s3_backend: Optional[S3StorageBackend] = None
+_s3_lock = threading.Lock()
+
+
+def get_s3_backend() -> S3StorageBackend:
+    global _s3_backend
+    if _s3_backend is None:
+        with _s3_lock:
+            if _s3_backend is None:
+                _s3_backend = S3StorageBackend()
+    return _s3_backend
+
+
+def get_storage_backend() -> StorageBackend:
+    """Get the backend new evidence files are stored on (STORAGE_BACKEND)."""
+    if settings.STORAGE_BACKEND == "s3":
+        return get_s3_backend()
+    return _local_backend
+
+
+def backend_for(locator: str) -> StorageBackend:
+    """Get the backend holding a stored file, whatever the current STORAGE_BACKEND."""
+    if locator.startswith(S3_SCHEME):
+        return get_s3_backend()
+    return _local_backend
@@ -0,0 +1,289 @@
+from sqlalchemy import and_, exists, func
+from sqlalchemy.orm import Session
+from app.models.models import Case, CaseStatus, Evidence, EvidenceBlob, StorageTier
+from app.core.database import SessionLocal
+from app.core.config import settings
+from app.services.blob_store import BlobStore, blob_lock
+from app.utils.frame_compression import FrameReader
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import hashlib
+import logging
+import os
+import shutil
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Evidence of cases in these states is moved to the cold tier
+COLD_CASE_STATUSES = (CaseStatus.closed, CaseStatus.archived)
+
+
+def copy_file_throttled(
+    source_path: str,
+    destination_path: str,
+    bytes_per_second: int,
+    stop_event: Optional[threading.Event] = None
+) -> bool:
+    """
+    Copy a file without reading faster than a bandwidth budget.
+
+    Returns:
+        True if the copy finished, False if stopped before the end of the file
+    """
+    started = time.monotonic()
+    copied = 0
+    with open(source_path, "rb") as source, open(destination_path, "wb") as destination:
+        for chunk in iter(lambda: source.read(settings.UPLOAD_CHUNK_SIZE), b""):
+            if stop_event is not None and stop_event.is_set():
+                return False
+            destination.write(chunk)
+            copied += len(chunk)
+
+            # Sleep off any time we are ahead of the budget
+            ahead = copied / bytes_per_second - (time.monotonic() - started)
+            if ahead > 0:
+                time.sleep(ahead)
+        destination.flush()
+        os.fsync(destination.fileno())
+    return True
+
+
+class StorageTierService:
+    """Service for placing evidence blobs on the hot or cold storage tier."""
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.blob_store = BlobStore(db)
+
+    def tier_usage(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get how many blobs and bytes sit on each local storage tier.
+
+        ``stored_bytes`` is what the files take on disk (compressed archives
+        included), ``original_bytes`` the size of the content they hold.
+        """
+        rows = self.db.query(
+            EvidenceBlob.tier,
+            func.count(EvidenceBlob.file_hash),
+            func.coalesce(func.sum(EvidenceBlob.stored_size), 0),
+            func.coalesce(func.sum(EvidenceBlob.file_size), 0),
+        ).filter(EvidenceBlob.storage_backend == "local").group_by(EvidenceBlob.tier).all()
+        totals = {tier: (count, stored, original) for tier, count, stored, original in rows}
+
+        usage = {}
+        for tier in StorageTier:
+            count, stored, original = totals.get(tier, (0, 0, 0))
+            blobs_dir = self.blob_store.tier_dirs.get(tier)
+            usage[tier.value] = {
+                "configured": blobs_dir is not None,
+                "directory": blobs_dir,
+                "blobs": count,
+                "stored_bytes": int(stored),
+                "original_bytes": int(original),
+            }
+            if blobs_dir and os.path.isdir(blobs_dir):
+                disk = shutil.disk_usage(blobs_dir)
+                usage[tier.value]["volume_total_bytes"] = disk.total
+                usage[tier.value]["volume_free_bytes"] = disk.free
+        return usage
+
+    def pending_moves(self, limit: int) -> List[Tuple[str, StorageTier]]:
+        """
+        Find blobs stored on the wrong tier.
+
+        A blob belongs on the cold tier when every evidence item referring
+        to it is part of a closed or archived case. Blobs needed by a
+        reopened case are promoted back to the hot tier first.
+
+        Returns:
+            List of (file_hash, target tier)
+        """
+        if StorageTier.cold not in self.blob_store.tier_dirs:
+            return []
+
+        in_live_case = exists().where(and_(
+            Evidence.file_hash == EvidenceBlob.file_hash,
+            Evidence.case_id == Case.id,
+            Case.status.notin_(COLD_CASE_STATUSES),
+        ))
+        referenced = exists().where(Evidence.file_hash == EvidenceBlob.file_hash)
+
+        to_hot = self.db.query(EvidenceBlob.file_hash).filter(
+            EvidenceBlob.storage_backend == "local", EvidenceBlob.tier == StorageTier.cold, in_live_case
+        ).limit(limit).all()
+        moves = [(file_hash, StorageTier.hot) for (file_hash,) in to_hot]
+
+        if len(moves) < limit:
+            to_cold = self.db.query(EvidenceBlob.file_hash).filter(
+                EvidenceBlob.storage_backend == "local",
+                EvidenceBlob.tier == StorageTier.hot,
+                referenced,
+                ~in_live_case
+            ).limit(limit - len(moves)).all()
+            moves.extend((file_hash, StorageTier.cold) for (file_hash,) in to_cold)
+        return moves
+
+    def move_blob(
+        self,
+        file_hash: str,
+        target: StorageTier,
+        bytes_per_second: int,
+        stop_event: Optional[threading.Event] = None
+    ) -> bool:
+        """
+        Move a blob to another tier, verifying the copy before the original is removed.
+
+        Evidence rows are repointed to the new location in the same
+        transaction that records the blob's new tier. The copy runs
+        unlocked; switching over takes the blob's lock, so no ``ingest``
+        hands out the old path meanwhile, and the move is abandoned if an
+        earlier ingest's evidence row isn't committed yet.
+
+        Returns:
+            True if the blob was moved
+        """
+        source_tier = self.blob_store.tier_of(file_hash)
+        if source_tier == target:
+            return False
+
+        source_path = self.blob_store.blob_path(file_hash, source_tier)
+        destination_path = self.blob_store.blob_path(file_hash, target)
+        compressed = False
+        if not os.path.exists(source_path):
+            source_path = self.blob_store.compressed_path(file_hash, source_tier)
+            destination_path = self.blob_store.compressed_path(file_hash, target)
+            compressed = True
+            if not os.path.exists(source_path):
+                logger.warning(f"Tier migration: blob {file_hash} is missing, skipping")
+                return False
+
+        temp_path = self.blob_store.new_temp_path(target)
+        try:
+            if not copy_file_throttled(source_path, temp_path, bytes_per_second, stop_event):
+                return False
+
+            if self._hash_copy(temp_path, compressed) != file_hash:
+                logger.error(f"Tier migration: copy of blob {file_hash} failed verification, keeping it on {source_tier.value}")
+                return False
+
+            os.makedirs(os.path.dirname(destination_path), exist_ok=True)
+            os.replace(temp_path, destination_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        with blob_lock(file_hash):
+            self.db.expire_all()
+            if (
+                self.blob_store.tier_of(file_hash) != source_tier
+                or not os.path.exists(source_path)
+                or self.blob_store.pending_references(file_hash)
+            ):
+                # Released, compressed or just handed to new evidence meanwhile
+                self.db.rollback()
+                os.remove(destination_path)
+                logger.info(f"Tier migration: blob {file_hash} changed during the copy, retrying later")
+                return False
+
+            try:
+                self.db.query(EvidenceBlob).filter(EvidenceBlob.file_hash == file_hash).update(
+                    {EvidenceBlob.tier: target}, synchronize_session=False
+                )
+                self.db.query(Evidence).filter(
+                    Evidence.file_hash == file_hash,
+                    Evidence.file_path == self.blob_store.blob_path(file_hash, source_tier)
+                ).update(
+                    {Evidence.file_path: self.blob_store.blob_path(file_hash, target)},
+                    synchronize_session=False
+                )
+                self.db.commit()
+            except Exception:
+                self.db.rollback()
+                os.remove(destination_path)
+                raise
+
+            os.remove(source_path)
+        logger.info(f"Tier migration: blob {file_hash} moved from {source_tier.value} to {target.value}")
+        return True
+
+    @staticmethod
+    def _hash_copy(file_path: str, compressed: bool) -> str:
+        sha256_hash = hashlib.sha256()
+        with (FrameReader.open(file_path) if compressed else open(file_path, "rb")) as f:
+            for chunk in iter(lambda: f.read(settings.UPLOAD_CHUNK_SIZE), b""):
+                sha256_hash.update(chunk)
+        return sha256_hash.hexdigest()
+
+
+class StorageTierMigrator:
+    """
+    Background job that moves blobs between the hot and cold tiers.
+
+    Copies are read under the STORAGE_TIERING_BANDWIDTH budget so the
+    migration doesn't starve uploads and downloads of disk bandwidth.
+    """
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self._stop_event = threading.Event()
+
+    def start(self) -> None:
+        """Start the migrator loop on the running event loop."""
+        if self._task is None:
+            self._stop_event.clear()
+            self._task = asyncio.create_task(self._run())
+            logger.info("Storage tier migrator started")
+
+    async def stop(self) -> None:
+        """Stop the migrator, interrupting the file being copied."""
+        if self._task is None:
+            return
+        self._stop_event.set()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("Storage tier migrator stopped")
+
+    async def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                await asyncio.to_thread(self.migrate_batch)
+            except Exception as e:
+                logger.error(f"Storage tier migration batch failed: {str(e)}")
+            await asyncio.sleep(settings.STORAGE_TIERING_INTERVAL_SECONDS)
+
+    def migrate_batch(self) -> int:
+        """
+        Move the next batch of blobs to the tier they belong on.
+
+        Returns:
+            Number of blobs moved
+        """
+        db = SessionLocal()
+        try:
+            tier_service = StorageTierService(db)
+            moved = 0
+            for file_hash, target in tier_service.pending_moves(settings.STORAGE_TIERING_BATCH_SIZE):
+                if self._stop_event.is_set():
+                    break
+                try:
+                    if tier_service.move_blob(
+                        file_hash, target, settings.STORAGE_TIERING_BANDWIDTH, self._stop_event
+                    ):
+                        moved += 1
+                except Exception as e:
+                    logger.error(f"Tier migration of blob {file_hash} failed: {str(e)}")
+
+            if moved:
+                logger.info(f"Storage tier migration moved {moved} blob(s)")
+            return moved
+        finally:
+            db.close()
+
+
+storage_tier_migrator = StorageTierMigrator()
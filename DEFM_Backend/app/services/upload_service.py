@@ -0,0 +1,414 @@
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.models import Evidence, UploadSession, UploadSessionStatus
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.utils.file_utils import MultiHasher
+from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, List, Optional, Tuple
+import aiofiles
+import asyncio
+import hashlib
+import logging
+import math
+import os
+import shutil
+import uuid
+
+logger = logging.getLogger(__name__)
+
+# Missing chunk ranges listed in a session response; the rest follow once
+# the first ones are uploaded
+MAX_MISSING_RANGES = 1000
+
+# Chunk directories of all sessions live under this directory, one per session id
+SESSIONS_DIRECTORY = os.path.join(settings.UPLOAD_DIRECTORY, ".upload_sessions")
+
+
+def list_received_chunks(session_dir: str) -> List[int]:
+    """List the indexes of the chunks in a session directory. Blocking."""
+    if not os.path.isdir(session_dir):
+        return []
+
+    received = []
+    for name in os.listdir(session_dir):
+        if name.endswith(".part"):
+            received.append(int(name[:-len(".part")]))
+    return sorted(received)
+
+
+class ChunkedUploadService:
+    """Service for resumable, chunked evidence uploads."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.sessions_dir = SESSIONS_DIRECTORY
+
+    async def create_session(
+        self,
+        evidence: Evidence,
+        file_name: str,
+        total_size: int,
+        created_by: int,
+        chunk_size: Optional[int] = None,
+        mime_type: Optional[str] = None
+    ) -> UploadSession:
+        """
+        Open a new upload session for an evidence item.
+
+        Args:
+            evidence: Evidence the file will be attached to
+            file_name: Declared file name
+            total_size: Total size of the file in bytes
+            created_by: User ID opening the session
+            chunk_size: Chunk size in bytes (defaults to UPLOAD_SESSION_CHUNK_SIZE)
+            mime_type: Declared content type
+
+        Returns:
+            The created UploadSession
+        """
+        if total_size > settings.MAX_CHUNKED_UPLOAD_SIZE:
+            raise HTTPException(
+                status_code=400,
+                detail=f"File size exceeds maximum allowed size of {settings.MAX_CHUNKED_UPLOAD_SIZE} bytes"
+            )
+
+        chunk_size = chunk_size or settings.UPLOAD_SESSION_CHUNK_SIZE
+        if not settings.UPLOAD_SESSION_MIN_CHUNK_SIZE <= chunk_size <= settings.UPLOAD_SESSION_MAX_CHUNK_SIZE:
+            raise HTTPException(
+                status_code=400,
+                detail=(
+                    f"chunk_size must be between {settings.UPLOAD_SESSION_MIN_CHUNK_SIZE} "
+                    f"and {settings.UPLOAD_SESSION_MAX_CHUNK_SIZE} bytes"
+                )
+            )
+        total_chunks = math.ceil(total_size / chunk_size)
+        if total_chunks > settings.UPLOAD_SESSION_MAX_CHUNKS:
+            raise HTTPException(
+                status_code=400,
+                detail=(
+                    f"File would need {total_chunks} chunks, at most {settings.UPLOAD_SESSION_MAX_CHUNKS} "
+                    f"are allowed; use a larger chunk_size"
+                )
+            )
+
+        upload_session = UploadSession(
+            id=uuid.uuid4().hex,
+            evidence_id=evidence.id,
+            file_name=os.path.basename(file_name),
+            mime_type=mime_type,
+            total_size=total_size,
+            chunk_size=chunk_size,
+            total_chunks=total_chunks,
+            status=UploadSessionStatus.active,
+            created_by=created_by
+        )
+
+        self.db.add(upload_session)
+        await self.db.commit()
+        await self.db.refresh(upload_session)
+
+        await run_in_threadpool(os.makedirs, self._session_dir(upload_session), exist_ok=True)
+        return upload_session
+
+    async def get_session(self, evidence_id: int, session_id: str) -> Optional[UploadSession]:
+        """Get an upload session belonging to an evidence item."""
+        return await self.db.scalar(select(UploadSession).where(
+            UploadSession.id == session_id,
+            UploadSession.evidence_id == evidence_id
+        ))
+
+    def expected_chunk_size(self, upload_session: UploadSession, index: int) -> int:
+        """Get the exact size in bytes the chunk at ``index`` must have."""
+        if index < 0 or index >= upload_session.total_chunks:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Chunk index must be between 0 and {upload_session.total_chunks - 1}"
+            )
+        if index == upload_session.total_chunks - 1:
+            return upload_session.total_size - index * upload_session.chunk_size
+        return upload_session.chunk_size
+
+    async def received_chunks(self, upload_session: UploadSession) -> List[int]:
+        """List the indexes of chunks that have been fully received."""
+        # A session can hold up to UPLOAD_SESSION_MAX_CHUNKS files; list them off the event loop
+        return await run_in_threadpool(list_received_chunks, self._session_dir(upload_session))
+
+    async def missing_chunks(self, upload_session: UploadSession, max_ranges: int = MAX_MISSING_RANGES) -> Tuple[int, List[Tuple[int, int]]]:
+        """
+        Get which chunks still have to be uploaded.
+
+        Works from the received chunks only, so the cost doesn't depend on
+        how many chunks the session has.
+
+        Args:
+            upload_session: The upload session
+            max_ranges: Maximum number of ranges to return
+
+        Returns:
+            Number of missing chunks, and the first ``max_ranges`` runs of
+            missing chunks as inclusive (first, last) index pairs
+        """
+        received = await self.received_chunks(upload_session)
+        ranges: List[Tuple[int, int]] = []
+        start = 0
+        for index in received + [upload_session.total_chunks]:
+            if index > start and len(ranges) < max_ranges:
+                ranges.append((start, index - 1))
+            start = index + 1
+        return upload_session.total_chunks - len(received), ranges
+
+    async def write_chunk(
+        self,
+        upload_session: UploadSession,
+        index: int,
+        body: AsyncIterator[bytes],
+        expected_sha256: Optional[str] = None
+    ) -> int:
+        """
+        Stream one chunk of the upload to disk.
+
+        The chunk is written to a private temp file and only renamed into
+        place once it is complete, so concurrent or retried PUTs of the same
+        chunk never leave a partial part behind.
+
+        Args:
+            upload_session: The active upload session
+            index: Zero-based chunk index
+            body: Async iterator over the request body
+            expected_sha256: Optional SHA-256 of the chunk sent by the client
+
+        Returns:
+            Number of bytes written
+        """
+        expected_size = self.expected_chunk_size(upload_session, index)
+        chunk_path = self._chunk_path(upload_session, index)
+        temp_path = f"{chunk_path}.{uuid.uuid4().hex}.tmp"
+        os.makedirs(os.path.dirname(chunk_path), exist_ok=True)
+
+        sha256_hash = hashlib.sha256()
+        received = 0
+        try:
+            async with aiofiles.open(temp_path, "wb") as f:
+                async for data in body:
+                    received += len(data)
+                    if received > expected_size:
+                        raise HTTPException(
+                            status_code=400,
+                            detail=f"Chunk {index} exceeds expected size of {expected_size} bytes"
+                        )
+                    sha256_hash.update(data)
+                    await f.write(data)
+
+            if received != expected_size:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Chunk {index} is {received} bytes, expected {expected_size} bytes"
+                )
+            if expected_sha256 and sha256_hash.hexdigest() != expected_sha256.lower():
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Chunk {index} failed SHA-256 verification"
+                )
+
+            os.replace(temp_path, chunk_path)
+            return received
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def assemble(
+        self,
+        upload_session: UploadSession,
+        destination_path: str,
+        hasher: Optional[MultiHasher] = None
+    ) -> tuple[str, int, str]:
+        """
+        Concatenate all chunks into the destination file.
+
+        The digests are computed while the chunks are copied, so the
+        assembled file is never read back. This is blocking I/O and should
+        be run in a worker thread.
+
+        Args:
+            upload_session: A session with every chunk received
+            destination_path: Full path where the file should be saved
+            hasher: Optional MultiHasher to collect extra digests in the same pass
+
+        Returns:
+            Tuple of (file_path, file_size, file_hash)
+        """
+        os.makedirs(os.path.dirname(destination_path), exist_ok=True)
+
+        hasher = hasher or MultiHasher(["sha256"])
+        file_size = 0
+        try:
+            with open(destination_path, "wb") as out:
+                for index in range(upload_session.total_chunks):
+                    with open(self._chunk_path(upload_session, index), "rb") as part:
+                        for data in iter(lambda: part.read(settings.UPLOAD_CHUNK_SIZE), b""):
+                            hasher.update(data)
+                            file_size += len(data)
+                            out.write(data)
+        except Exception:
+            if os.path.exists(destination_path):
+                os.remove(destination_path)
+            raise
+
+        if file_size != upload_session.total_size:
+            os.remove(destination_path)
+            raise HTTPException(
+                status_code=400,
+                detail=f"Assembled file is {file_size} bytes, expected {upload_session.total_size} bytes"
+            )
+
+        file_hash = hasher.hexdigest("sha256")
+        logger.info(f"Upload session {upload_session.id} assembled: {destination_path} ({file_size} bytes, hash: {file_hash})")
+        return destination_path, file_size, file_hash
+
+    async def claim_for_completion(self, upload_session: UploadSession) -> None:
+        """
+        Move an active session to completing, so only one request assembles it.
+
+        Raises:
+            HTTPException: 409 if another request already claimed or closed the session
+        """
+        result = await self.db.execute(
+            update(UploadSession)
+            .where(UploadSession.id == upload_session.id, UploadSession.status == UploadSessionStatus.active)
+            .values(status=UploadSessionStatus.completing)
+        )
+        await self.db.commit()
+        if result.rowcount != 1:
+            raise HTTPException(status_code=409, detail="Upload session is already being completed")
+
+    async def reopen(self, session_id: str) -> None:
+        """Make a session whose completion failed active again."""
+        await self.db.execute(
+            update(UploadSession)
+            .where(UploadSession.id == session_id, UploadSession.status == UploadSessionStatus.completing)
+            .values(status=UploadSessionStatus.active)
+        )
+        await self.db.commit()
+
+    async def close_session(self, upload_session: UploadSession, status: UploadSessionStatus) -> None:
+        """Mark a session completed or aborted and drop its chunks."""
+        upload_session.status = status
+        upload_session.completed_at = datetime.utcnow()
+        await self.db.commit()
+
+        await run_in_threadpool(shutil.rmtree, self._session_dir(upload_session), ignore_errors=True)
+
+    def _session_dir(self, upload_session: UploadSession) -> str:
+        return os.path.join(self.sessions_dir, upload_session.id)
+
+    def _chunk_path(self, upload_session: UploadSession, index: int) -> str:
+        return os.path.join(self._session_dir(upload_session), f"{index:08d}.part")
+
+
+class UploadSessionCleaner:
+    """
+    Background job that deletes the chunks of abandoned upload sessions.
+
+    Active sessions that got no new chunk for UPLOAD_SESSION_EXPIRY_HOURS
+    are aborted. Chunk directories whose session is gone (deleted with
+    its evidence) or already closed are removed.
+    """
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the cleanup loop on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info("Upload session cleaner started")
+
+    async def stop(self) -> None:
+        """Stop the cleanup loop."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("Upload session cleaner stopped")
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.to_thread(self.cleanup)
+            except Exception as e:
+                logger.error(f"Upload session cleanup failed: {str(e)}")
+            await asyncio.sleep(settings.UPLOAD_SESSION_CLEANUP_INTERVAL_SECONDS)
+
+    def cleanup(self) -> int:
+        """
+        Abort expired sessions and remove orphaned chunk directories.
+
+        Returns:
+            Number of session directories removed
+        """
+        if not os.path.isdir(SESSIONS_DIRECTORY):
+            return 0
+        # Listed before the rows are read: a session row is committed before
+        # its directory is created, so every directory seen here whose row
+        # is missing really is orphaned
+        session_ids = os.listdir(SESSIONS_DIRECTORY)
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=settings.UPLOAD_SESSION_EXPIRY_HOURS)
+
+        db = SessionLocal()
+        try:
+            rows = {
+                session_id: (session_status, created_at)
+                for session_id, session_status, created_at in db.query(
+                    UploadSession.id, UploadSession.status, UploadSession.created_at
+                ).filter(UploadSession.id.in_(session_ids)).all()
+            } if session_ids else {}
+
+            removed = 0
+            for session_id in session_ids:
+                session_dir = os.path.join(SESSIONS_DIRECTORY, session_id)
+                session_status, created_at = rows.get(session_id, (None, None))
+                if session_status == UploadSessionStatus.completing:
+                    continue
+                if session_status == UploadSessionStatus.active:
+                    if not self._expired(session_dir, created_at, cutoff):
+                        continue
+                    # Conditional so a completion that claimed the session meanwhile wins
+                    aborted = db.query(UploadSession).filter(
+                        UploadSession.id == session_id,
+                        UploadSession.status == UploadSessionStatus.active
+                    ).update(
+                        {"status": UploadSessionStatus.aborted, "completed_at": datetime.utcnow()},
+                        synchronize_session=False
+                    )
+                    db.commit()
+                    if not aborted:
+                        continue
+                    logger.info(f"Upload session {session_id} expired")
+                shutil.rmtree(session_dir, ignore_errors=True)
+                removed += 1
+            return removed
+        finally:
+            db.close()
+
+    @staticmethod
+    def _expired(session_dir: str, created_at: Optional[datetime], cutoff: datetime) -> bool:
+        # Storing a chunk renames it into the directory, which updates its mtime
+        try:
+            last_activity = datetime.fromtimestamp(os.path.getmtime(session_dir), timezone.utc)
+        except OSError:
+            return True
+        if created_at is not None:
+            if created_at.tzinfo is None:
+                created_at = created_at.replace(tzinfo=timezone.utc)
+            last_activity = max(last_activity, created_at)
+        return last_activity < cutoff
+
+
+upload_session_cleaner = UploadSessionCleaner()
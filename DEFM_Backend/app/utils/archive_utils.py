@@ -0,0 +1,275 @@
+from datetime import datetime
+from typing import Any, BinaryIO, Dict, Iterator, Optional
+import hashlib
+import queue
+import threading
+import zipfile
+
+# Leading bytes identifying each supported archive format
+ARCHIVE_SIGNATURES = {
+    b"PK\x03\x04": "zip",
+    b"PK\x05\x06": "zip",  # empty zip
+    b"7z\xbc\xaf\x27\x1c": "7z",
+    b"Rar!\x1a\x07": "rar",
+}
+READ_SIZE = 1024 * 1024
+
+
+class ArchiveError(Exception):
+    """Raised when an archive cannot be read."""
+
+
+def detect_archive_format(file_obj: BinaryIO) -> Optional[str]:
+    """Identify a zip, 7z or rar archive from its signature, regardless of its name."""
+    file_obj.seek(0)
+    head = file_obj.read(8)
+    file_obj.seek(0)
+    for signature, archive_format in ARCHIVE_SIGNATURES.items():
+        if head.startswith(signature):
+            return archive_format
+    return None
+
+
+def _hash_stream(stream: BinaryIO) -> str:
+    sha256_hash = hashlib.sha256()
+    for chunk in iter(lambda: stream.read(READ_SIZE), b""):
+        sha256_hash.update(chunk)
+    return sha256_hash.hexdigest()
+
+
+def iter_archive_members(file_obj: BinaryIO, archive_format: str) -> Iterator[Dict[str, Any]]:
+    """
+    List the members of an archive with the SHA-256 of each member's content.
+
+    Members are decompressed into the hash as a stream; nothing is
+    extracted to disk. Encrypted members are listed without a hash.
+
+    Args:
+        file_obj: Seekable stream of the archive
+        archive_format: "zip", "7z" or "rar"
+
+    Yields:
+        One dict per member with member_index, path, is_dir, size,
+        compressed_size, modified_at, encrypted and sha256
+    """
+    if archive_format == "zip":
+        yield from _iter_zip_members(file_obj)
+    elif archive_format == "rar":
+        yield from _iter_rar_members(file_obj)
+    elif archive_format == "7z":
+        yield from _iter_7z_members(file_obj)
+    else:
+        raise ArchiveError(f"Unsupported archive format: {archive_format}")
+
+
+def stream_archive_member(file_obj: BinaryIO, archive_format: str, path: str) -> Iterator[bytes]:
+    """Yield the decompressed content of one archive member in chunks."""
+    if archive_format == "zip":
+        with zipfile.ZipFile(file_obj) as archive, archive.open(path) as member:
+            yield from iter(lambda: member.read(READ_SIZE), b"")
+    elif archive_format == "rar":
+        rarfile = _import_optional("rarfile")
+        with rarfile.RarFile(file_obj) as archive, archive.open(path) as member:
+            yield from iter(lambda: member.read(READ_SIZE), b"")
+    elif archive_format == "7z":
+        yield from _stream_7z_member(file_obj, path)
+    else:
+        raise ArchiveError(f"Unsupported archive format: {archive_format}")
+
+
+def _import_optional(name: str) -> Any:
+    try:
+        return __import__(name)
+    except ImportError:
+        raise ArchiveError(f"Reading this archive format requires the optional '{name}' package")
+
+
+def _iter_zip_members(file_obj: BinaryIO) -> Iterator[Dict[str, Any]]:
+    try:
+        archive = zipfile.ZipFile(file_obj)
+    except zipfile.BadZipFile as e:
+        raise ArchiveError(str(e))
+
+    with archive:
+        for index, info in enumerate(archive.infolist()):
+            encrypted = bool(info.flag_bits & 0x1)
+            sha256 = None
+            if not info.is_dir() and not encrypted:
+                with archive.open(info) as member:
+                    sha256 = _hash_stream(member)
+            yield {
+                "member_index": index,
+                "path": info.filename,
+                "is_dir": info.is_dir(),
+                "size": info.file_size,
+                "compressed_size": info.compress_size,
+                "modified_at": _datetime_from_tuple(info.date_time),
+                "encrypted": encrypted,
+                "sha256": sha256,
+            }
+
+
+def _iter_rar_members(file_obj: BinaryIO) -> Iterator[Dict[str, Any]]:
+    rarfile = _import_optional("rarfile")
+    try:
+        archive = rarfile.RarFile(file_obj)
+    except rarfile.Error as e:
+        raise ArchiveError(str(e))
+
+    with archive:
+        for index, info in enumerate(archive.infolist()):
+            encrypted = info.needs_password()
+            sha256 = None
+            if not info.is_dir() and not encrypted:
+                with archive.open(info) as member:
+                    sha256 = _hash_stream(member)
+            yield {
+                "member_index": index,
+                "path": info.filename,
+                "is_dir": info.is_dir(),
+                "size": info.file_size,
+                "compressed_size": info.compress_size,
+                "modified_at": info.mtime or _datetime_from_tuple(info.date_time),
+                "encrypted": encrypted,
+                "sha256": sha256,
+            }
+
+
+def _iter_7z_members(file_obj: BinaryIO) -> Iterator[Dict[str, Any]]:
+    py7zr = _import_optional("py7zr")
+    from py7zr.io import Py7zIO, WriterFactory
+
+    class HashingIO(Py7zIO):
+        def __init__(self):
+            self.hash = hashlib.sha256()
+            self.length = 0
+
+        def write(self, s) -> int:
+            self.hash.update(s)
+            self.length += len(s)
+            return len(s)
+
+        def read(self, size=None) -> bytes:
+            return b""
+
+        def seek(self, offset: int, whence: int = 0) -> int:
+            return 0
+
+        def flush(self) -> None:
+            pass
+
+        def size(self) -> int:
+            return self.length
+
+    class HashingFactory(WriterFactory):
+        def __init__(self):
+            self.outputs: Dict[str, HashingIO] = {}
+
+        def create(self, filename: str) -> Py7zIO:
+            self.outputs[filename] = HashingIO()
+            return self.outputs[filename]
+
+    try:
+        archive = py7zr.SevenZipFile(file_obj)
+    except py7zr.Bad7zFile as e:
+        raise ArchiveError(str(e))
+
+    with archive:
+        encrypted = archive.needs_password()
+        entries = archive.list()
+        factory = HashingFactory()
+        if not encrypted:
+            # Solid archives decompress sequentially, so hash every member in one pass
+            archive.extractall(factory=factory)
+
+    for index, entry in enumerate(entries):
+        output = factory.outputs.get(entry.filename)
+        yield {
+            "member_index": index,
+            "path": entry.filename,
+            "is_dir": entry.is_directory,
+            "size": entry.uncompressed,
+            "compressed_size": entry.compressed,
+            "modified_at": entry.creationtime,
+            "encrypted": encrypted,
+            "sha256": output.hash.hexdigest() if output is not None and not entry.is_directory else None,
+        }
+
+
+def _stream_7z_member(file_obj: BinaryIO, path: str) -> Iterator[bytes]:
+    """
+    Stream a 7z member through a bounded queue fed by an extractor thread.
+
+    py7zr only pushes data into writers, so the extraction runs in its own
+    thread and blocks when the consumer falls behind.
+    """
+    py7zr = _import_optional("py7zr")
+    from py7zr.io import Py7zIO, WriterFactory
+
+    chunks: "queue.Queue[Any]" = queue.Queue(maxsize=16)
+    cancelled = threading.Event()
+    done = object()
+
+    def put(item: Any) -> bool:
+        """Queue an item for the consumer, False if it stopped reading."""
+        while not cancelled.is_set():
+            try:
+                chunks.put(item, timeout=1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    class QueueIO(Py7zIO):
+        def __init__(self):
+            self.length = 0
+
+        def write(self, s) -> int:
+            if not put(bytes(s)):
+                raise ArchiveError("Member download cancelled")
+            self.length += len(s)
+            return len(s)
+
+        def read(self, size=None) -> bytes:
+            return b""
+
+        def seek(self, offset: int, whence: int = 0) -> int:
+            return 0
+
+        def flush(self) -> None:
+            pass
+
+        def size(self) -> int:
+            return self.length
+
+    class QueueFactory(WriterFactory):
+        def create(self, filename: str) -> Py7zIO:
+            return QueueIO()
+
+    def extract() -> None:
+        try:
+            with py7zr.SevenZipFile(file_obj) as archive:
+                archive.extract(targets=[path], factory=QueueFactory())
+            put(done)
+        except Exception as e:
+            put(e)
+
+    thread = threading.Thread(target=extract, name="7z-member-stream", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = chunks.get()
+            if item is done:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        cancelled.set()
+
+
+def _datetime_from_tuple(date_time) -> Optional[datetime]:
+    try:
+        return datetime(*date_time)
+    except (TypeError, ValueError):
+        return None
@@ -1,8 +1,9 @@
 import hashlib
 import os
-from typing import Optional
+from typing import Dict, List, Optional
 from fastapi import UploadFile, HTTPException
 from app.core.config import settings
+from app.utils.merkle import MerkleTreeBuilder
 import logging
 import aiofiles
 
@@ -35,16 +36,33 @@ async def validate_file(file: UploadFile) -> bool:
     
     # Check file extension
     if file.filename:
-        file_ext = file.filename.split(".")[-1].lower()
-        if file_ext not in settings.allowed_file_types_list:
-            raise HTTPException(
-                status_code=400,
-                detail=f"File type .{file_ext} is not allowed. Allowed types: {', '.join(settings.allowed_file_types_list)}"
-            )
+        validate_file_extension(file.filename)
     
     return True
 
 
+def validate_file_extension(filename: str) -> bool:
+    """
+    Validate a file name against the allowed file types.
+    
+    Args:
+        filename: The declared file name
+        
+    Returns:
+        True if valid
+        
+    Raises:
+        HTTPException: If the extension is not allowed
+    """
+    file_ext = filename.split(".")[-1].lower()
+    if file_ext not in settings.allowed_file_types_list:
+        raise HTTPException(
+            status_code=400,
+            detail=f"File type .{file_ext} is not allowed. Allowed types: {', '.join(settings.allowed_file_types_list)}"
+        )
+    return True
+
+
 async def get_file_hash(content: bytes) -> str:
     """
     Calculate SHA-256 hash of file content.
@@ -60,16 +78,68 @@ async def get_file_hash(content: bytes) -> str:
     return sha256_hash.hexdigest()
 
 
+class MultiHasher:
+    """
+    Feed data once into several hashlib digests at the same time.
+    
+    With ``merkle_chunk_size`` set, Merkle leaf hashes over chunks of that
+    size are built in the same pass and available from ``merkle``.
+    """
+    
+    def __init__(self, algorithms: Optional[List[str]] = None, merkle_chunk_size: Optional[int] = None):
+        algorithms = algorithms or settings.evidence_hash_algorithms_list
+        self.hashers = {
+            algorithm: hashlib.new(algorithm, usedforsecurity=False)
+            for algorithm in algorithms
+        }
+        self.merkle = MerkleTreeBuilder(merkle_chunk_size) if merkle_chunk_size else None
+    
+    def update(self, data: bytes) -> None:
+        for hasher in self.hashers.values():
+            hasher.update(data)
+        if self.merkle is not None:
+            self.merkle.update(data)
+    
+    def hexdigest(self, algorithm: str) -> str:
+        return self.hashers[algorithm].hexdigest()
+    
+    def hexdigests(self) -> Dict[str, str]:
+        return {algorithm: hasher.hexdigest() for algorithm, hasher in self.hashers.items()}
+
+
+def compute_file_digests(file_path: str, algorithms: Optional[List[str]] = None) -> Dict[str, str]:
+    """
+    Compute several digests of a file already stored on disk in a single read.
+    
+    Args:
+        file_path: Path of the file
+        algorithms: hashlib algorithm names (defaults to EVIDENCE_HASH_ALGORITHMS)
+        
+    Returns:
+        Mapping of algorithm name to hexadecimal digest
+    """
+    hasher = MultiHasher(algorithms)
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(settings.UPLOAD_CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    return hasher.hexdigests()
+
+
 async def save_upload_file(
     file: UploadFile,
-    destination_path: str
+    destination_path: str,
+    hasher: Optional[MultiHasher] = None
 ) -> tuple[str, int, str]:
     """
-    Save uploaded file to disk.
+    Stream uploaded file to disk, hashing it on the way.
+    
+    The upload is read in ``UPLOAD_CHUNK_SIZE`` pieces so that at most one
+    chunk is held in memory regardless of the file size.
     
     Args:
         file: The uploaded file
         destination_path: Full path where file should be saved
+        hasher: Optional MultiHasher to collect extra digests in the same pass
         
     Returns:
         Tuple of (file_path, file_size, file_hash)
@@ -78,16 +148,20 @@ async def save_upload_file(
         # Ensure directory exists
         os.makedirs(os.path.dirname(destination_path), exist_ok=True)
         
-        # Read file content
-        content = await file.read()
-        file_size = len(content)
+        hasher = hasher or MultiHasher(["sha256"])
+        file_size = 0
         
-        # Calculate hash
-        file_hash = await get_file_hash(content)
-        
-        # Write file
+        await file.seek(0)
         async with aiofiles.open(destination_path, 'wb') as f:
-            await f.write(content)
+            while True:
+                chunk = await file.read(settings.UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                hasher.update(chunk)
+                file_size += len(chunk)
+                await f.write(chunk)
+        
+        file_hash = hasher.hexdigest("sha256")
         
         logger.info(f"File saved: {destination_path} ({file_size} bytes, hash: {file_hash})")
         
@@ -95,6 +169,9 @@ async def save_upload_file(
         
     except Exception as e:
         logger.error(f"Failed to save file: {str(e)}")
+        # Don't leave a truncated file behind
+        if os.path.exists(destination_path):
+            os.remove(destination_path)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to save file: {str(e)}"
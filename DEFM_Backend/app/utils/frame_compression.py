@@ -0,0 +1,169 @@
+import io
+import struct
+import zlib
+from typing import BinaryIO, Callable, List, Optional
+
+# File layout:
+#   header   MAGIC | frame_size (u64)
+#   frames   zlib streams, each holding frame_size bytes of input (last may be shorter)
+#   index    offset (u64) of every frame
+#   footer   index_offset (u64) | frame_count (u64) | original_size (u64) | INDEX_MAGIC
+MAGIC = b"DEFMZF01"
+INDEX_MAGIC = b"DEFMZIDX"
+HEADER = struct.Struct("<8sQ")
+FOOTER = struct.Struct("<QQQ8s")
+OFFSET = struct.Struct("<Q")
+
+
+class FrameFormatError(Exception):
+    """Raised when a file is not a valid frame-compressed file."""
+
+
+def compress_frames(
+    source: BinaryIO,
+    destination: BinaryIO,
+    frame_size: int,
+    level: int = 6,
+    on_data: Optional[Callable[[bytes], None]] = None,
+) -> int:
+    """
+    Compress a stream into independently decompressible zlib frames.
+
+    Every ``frame_size`` bytes of input become their own zlib stream, and
+    the offsets of all frames are written as an index at the end, so any
+    byte range can later be read by inflating only the frames covering it.
+
+    Args:
+        source: Readable binary stream with the original content
+        destination: Writable binary stream for the compressed file
+        frame_size: Uncompressed bytes per frame
+        level: zlib compression level
+        on_data: Called with every block of original data, e.g. to hash it
+
+    Returns:
+        Number of original bytes compressed
+    """
+    destination.write(HEADER.pack(MAGIC, frame_size))
+    position = HEADER.size
+    offsets: List[int] = []
+    total = 0
+    for frame in iter(lambda: source.read(frame_size), b""):
+        if on_data is not None:
+            on_data(frame)
+        compressed = zlib.compress(frame, level)
+        offsets.append(position)
+        destination.write(compressed)
+        position += len(compressed)
+        total += len(frame)
+
+    destination.write(b"".join(OFFSET.pack(offset) for offset in offsets))
+    destination.write(FOOTER.pack(position, len(offsets), total, INDEX_MAGIC))
+    return total
+
+
+def is_frame_compressed(file_obj: BinaryIO) -> bool:
+    """Check whether an open file starts with the frame format header."""
+    position = file_obj.tell()
+    try:
+        file_obj.seek(0)
+        return file_obj.read(len(MAGIC)) == MAGIC
+    finally:
+        file_obj.seek(position)
+
+
+class FrameReader(io.RawIOBase):
+    """
+    Seekable read-only view of the original bytes of a frame-compressed file.
+
+    Only the frames overlapping a read are inflated, and the most recently
+    used frame is kept so sequential reads inflate each frame once.
+    """
+
+    def __init__(self, raw: BinaryIO):
+        self._raw = raw
+        raw.seek(0)
+        magic, self.frame_size = HEADER.unpack(raw.read(HEADER.size))
+        if magic != MAGIC:
+            raise FrameFormatError("Not a frame-compressed file")
+
+        raw.seek(-FOOTER.size, io.SEEK_END)
+        index_offset, frame_count, self.original_size, index_magic = FOOTER.unpack(raw.read(FOOTER.size))
+        if index_magic != INDEX_MAGIC:
+            raise FrameFormatError("Frame index is missing or truncated")
+
+        raw.seek(index_offset)
+        packed = raw.read(frame_count * OFFSET.size)
+        self._offsets = [offset for (offset,) in OFFSET.iter_unpack(packed)]
+        self._offsets.append(index_offset)
+
+        self._position = 0
+        self._cached_index = -1
+        self._cached_frame = b""
+
+    @classmethod
+    def open(cls, path: str) -> "FrameReader":
+        return cls(open(path, "rb"))
+
+    @property
+    def frame_count(self) -> int:
+        return len(self._offsets) - 1
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def fileno(self) -> int:
+        # Expose no descriptor: the bytes on disk are not the content
+        raise io.UnsupportedOperation("fileno")
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self.original_size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError("Negative seek position")
+        self._position = position
+        return position
+
+    def readinto(self, buffer) -> int:
+        view = memoryview(buffer).cast("B")
+        written = 0
+        while written < len(view) and self._position < self.original_size:
+            index, within = divmod(self._position, self.frame_size)
+            frame = self._frame(index)
+            take = min(len(view) - written, len(frame) - within)
+            if take <= 0:
+                # A frame holding less than frame_size bytes before the end
+                raise FrameFormatError(f"Frame {index} is truncated")
+            view[written:written + take] = frame[within:within + take]
+            written += take
+            self._position += take
+        return written
+
+    def close(self) -> None:
+        if not self.closed:
+            self._raw.close()
+        super().close()
+
+    def _frame(self, index: int) -> bytes:
+        if index != self._cached_index:
+            if index >= self.frame_count:
+                raise FrameFormatError(f"Frame {index} is missing from the index")
+            start, end = self._offsets[index], self._offsets[index + 1]
+            self._raw.seek(start)
+            try:
+                self._cached_frame = zlib.decompress(self._raw.read(end - start))
+            except zlib.error as e:
+                raise FrameFormatError(f"Frame {index} is corrupt: {e}")
+            self._cached_index = index
+        return self._cached_frame
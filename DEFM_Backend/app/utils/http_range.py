@@ -0,0 +1,345 @@
+from email.utils import formatdate, parsedate_to_datetime
+from mimetypes import guess_type
+from typing import BinaryIO, Callable, List, Mapping, Optional, Tuple
+from urllib.parse import quote
+import os
+import secrets
+
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+# Requests asking for more ranges than this get the whole file instead,
+# so a client cannot make us seek around a file thousands of times.
+MAX_RANGES = 32
+
+
+class RangeNotSatisfiable(Exception):
+    """Raised when none of the requested byte ranges overlap the file."""
+
+
+def parse_range_header(range_header: Optional[str], size: int) -> Optional[List[Tuple[int, int]]]:
+    """
+    Parse a ``Range: bytes=...`` header into inclusive byte ranges.
+
+    Overlapping and adjacent ranges are merged.
+
+    Args:
+        range_header: Value of the Range header
+        size: Size of the representation in bytes
+
+    Returns:
+        Sorted list of (start, end) ranges, or None if the header should be
+        ignored and the full content sent
+
+    Raises:
+        RangeNotSatisfiable: If the header is valid but no range fits the file
+    """
+    if not range_header:
+        return None
+    unit, _, spec = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or not spec.strip():
+        return None
+
+    ranges: List[Tuple[int, int]] = []
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        first, sep, last = part.partition("-")
+        first, last = first.strip(), last.strip()
+        if not sep or not (first.isdigit() or first == "") or not (last.isdigit() or last == ""):
+            return None
+
+        if first == "":
+            # Suffix range: the last N bytes
+            if last == "":
+                return None
+            length = int(last)
+            if length == 0 or size == 0:
+                # An empty file has no last bytes to send
+                continue
+            ranges.append((max(size - length, 0), size - 1))
+            continue
+
+        start = int(first)
+        if last and int(last) < start:
+            return None
+        if start >= size:
+            continue
+        end = min(int(last), size - 1) if last else size - 1
+        ranges.append((start, end))
+
+    if len(ranges) > MAX_RANGES:
+        return None
+    if not ranges:
+        raise RangeNotSatisfiable()
+
+    ranges.sort()
+    merged = [ranges[0]]
+    for start, end in ranges[1:]:
+        last_start, last_end = merged[-1]
+        if start <= last_end + 1:
+            merged[-1] = (last_start, max(last_end, end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match style list against an ETag."""
+    if header.strip() == "*":
+        return True
+    bare = etag[2:] if etag.startswith("W/") else etag
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == bare:
+            return True
+    return False
+
+
+def _not_modified_since(header: str, mtime: float) -> bool:
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    if since is None:
+        return False
+    return int(mtime) <= since.timestamp()
+
+
+class RangeFileResponse(Response):
+    """
+    File response with conditional GET and byte range support.
+
+    Handles ``If-None-Match``/``If-Modified-Since`` (304), ``Range`` with
+    single (206) and multiple (206 ``multipart/byteranges``) ranges,
+    ``If-Range`` and unsatisfiable ranges (416). The file is streamed in
+    fixed-size chunks, so memory use does not depend on the file size.
+    Servers offering the ASGI ``http.response.pathsend`` or
+    ``http.response.zerocopy`` extensions send the file data with
+    sendfile() instead.
+    """
+
+    chunk_size = 64 * 1024
+
+    def __init__(
+        self,
+        path: str,
+        media_type: Optional[str] = None,
+        filename: Optional[str] = None,
+        etag: Optional[str] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        content_disposition_type: str = "attachment",
+        stat_result: Optional[os.stat_result] = None,
+        opener: Optional[Callable[[], BinaryIO]] = None,
+        size: Optional[int] = None,
+        mtime: Optional[float] = None,
+    ) -> None:
+        """
+        Args:
+            path: Path of the file to send
+            media_type: Content type, guessed from the filename if not given
+            filename: Name offered to the client in Content-Disposition
+            etag: Strong validator for the content, typically its stored hash;
+                derived from mtime and size if not given
+            headers: Extra response headers
+            content_disposition_type: "attachment" or "inline"
+            stat_result: Already known ``os.stat`` of the file
+            opener: Opens a seekable stream of the content when the bytes at
+                ``path`` are not the content itself (e.g. compressed files);
+                requires ``size`` and ``mtime``
+            size: Size of the content returned by ``opener``
+            mtime: Modification time of the content returned by ``opener``
+        """
+        self.path = path
+        self.status_code = 200
+        self.filename = filename
+        self.media_type = media_type or guess_type(filename or path)[0] or "application/octet-stream"
+        self.background = None
+        self.body = b""
+        self.stat_result = stat_result
+        self.opener = opener
+        self.size = size
+        self.mtime = mtime
+        self.etag = f'"{etag}"' if etag else None
+        self.init_headers(headers)
+        self.headers.setdefault("accept-ranges", "bytes")
+        if filename is not None:
+            quoted = quote(filename)
+            if quoted != filename:
+                disposition = f"{content_disposition_type}; filename*=utf-8''{quoted}"
+            else:
+                disposition = f'{content_disposition_type}; filename="{filename}"'
+            self.headers.setdefault("content-disposition", disposition)
+
+    def init_headers(self, headers: Optional[Mapping[str, str]] = None) -> None:
+        # Content-Length and Content-Type depend on the ranges, set per request
+        self.raw_headers = [
+            (k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in (headers or {}).items()
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self.opener is not None:
+            size, mtime = self.size, self.mtime
+        else:
+            stat_result = self.stat_result or await anyio.to_thread.run_sync(os.stat, self.path)
+            size, mtime = stat_result.st_size, stat_result.st_mtime
+        etag = self.etag or f'W/"{int(mtime * 1000):x}-{size:x}"'
+        last_modified = formatdate(mtime, usegmt=True)
+
+        headers = MutableHeaders(raw=self.raw_headers)
+        headers["etag"] = etag
+        headers["last-modified"] = last_modified
+
+        request_headers = Headers(scope=scope)
+        send_body = scope["method"].upper() != "HEAD"
+
+        if self._is_not_modified(request_headers, etag, mtime):
+            await self._send_empty(send, 304, headers)
+            return
+
+        ranges = None
+        if self._if_range_holds(request_headers, etag, last_modified):
+            try:
+                ranges = parse_range_header(request_headers.get("range"), size)
+            except RangeNotSatisfiable:
+                headers["content-range"] = f"bytes */{size}"
+                await self._send_empty(send, 416, headers)
+                return
+
+        part_headers: List[bytes] = []
+        closing = b""
+        if ranges is None:
+            status_code = 200
+            ranges = [(0, size - 1)] if size else []
+            headers["content-type"] = self._content_type()
+            headers["content-length"] = str(size)
+        elif len(ranges) == 1:
+            status_code = 206
+            start, end = ranges[0]
+            headers["content-type"] = self._content_type()
+            headers["content-range"] = f"bytes {start}-{end}/{size}"
+            headers["content-length"] = str(end - start + 1)
+        else:
+            status_code = 206
+            boundary = secrets.token_hex(16)
+            part_headers = [
+                (
+                    f"--{boundary}\r\n"
+                    f"Content-Type: {self._content_type()}\r\n"
+                    f"Content-Range: bytes {start}-{end}/{size}\r\n\r\n"
+                ).encode("latin-1")
+                for start, end in ranges
+            ]
+            closing = f"--{boundary}--\r\n".encode("latin-1")
+            length = sum(len(h) + (end - start + 1) + 2 for h, (start, end) in zip(part_headers, ranges))
+            headers["content-type"] = f"multipart/byteranges; boundary={boundary}"
+            headers["content-length"] = str(length + len(closing))
+
+        await self._start(send, status_code, headers)
+        extensions = scope.get("extensions") or {}
+        if not send_body:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        elif self.opener is None and status_code == 200 and "http.response.pathsend" in extensions:
+            # The server sends the whole file itself, typically with sendfile()
+            await send({"type": "http.response.pathsend", "path": os.path.abspath(self.path)})
+        else:
+            zerocopy = self.opener is None and "http.response.zerocopy" in extensions
+            await self._send_ranges(send, ranges, part_headers, closing, zerocopy)
+
+        if self.background is not None:
+            await self.background()
+
+    def _content_type(self) -> str:
+        if self.media_type.startswith("text/") and "charset=" not in self.media_type:
+            return f"{self.media_type}; charset={self.charset}"
+        return self.media_type
+
+    @staticmethod
+    def _is_not_modified(request_headers: Headers, etag: str, mtime: float) -> bool:
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match is not None:
+            return _etag_matches(if_none_match, etag)
+        if_modified_since = request_headers.get("if-modified-since")
+        if if_modified_since is not None:
+            return _not_modified_since(if_modified_since, mtime)
+        return False
+
+    @staticmethod
+    def _if_range_holds(request_headers: Headers, etag: str, last_modified: str) -> bool:
+        """Check that the client's cached copy is current, so a partial response is safe."""
+        if_range = request_headers.get("if-range")
+        if if_range is None:
+            return True
+        if_range = if_range.strip()
+        if if_range.startswith('"') or if_range.startswith("W/"):
+            # If-Range requires a strong comparison
+            return not etag.startswith("W/") and if_range == etag
+        return if_range == last_modified
+
+    async def _start(self, send: Send, status_code: int, headers: MutableHeaders) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": headers.raw,
+        })
+
+    async def _send_empty(self, send: Send, status_code: int, headers: MutableHeaders) -> None:
+        if status_code == 416:
+            headers["content-length"] = "0"
+        await self._start(send, status_code, headers)
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    async def _send_ranges(
+        self,
+        send: Send,
+        ranges: List[Tuple[int, int]],
+        part_headers: List[bytes],
+        closing: bytes,
+        zerocopy: bool = False,
+    ) -> None:
+        """
+        Stream byte ranges of the file, framed as multipart parts if headers are given.
+
+        With the ASGI zero-copy extension the server copies file data to the
+        socket itself (sendfile), so no file content passes through Python.
+        """
+        if self.opener is not None:
+            file = anyio.wrap_file(await anyio.to_thread.run_sync(self.opener))
+        else:
+            file = await anyio.open_file(self.path, mode="rb")
+        async with file:
+            for index, (start, end) in enumerate(ranges):
+                if part_headers:
+                    prefix = b"\r\n" if index else b""
+                    await send({
+                        "type": "http.response.body",
+                        "body": prefix + part_headers[index],
+                        "more_body": True,
+                    })
+                if zerocopy:
+                    await send({
+                        "type": "http.response.zerocopy",
+                        "file": file.wrapped,
+                        "offset": start,
+                        "count": end - start + 1,
+                        "more_body": True,
+                    })
+                    continue
+                await file.seek(start)
+                remaining = end - start + 1
+                while remaining > 0:
+                    chunk = await file.read(min(self.chunk_size, remaining))
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+                    await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({
+            "type": "http.response.body",
+            "body": (b"\r\n" + closing) if closing else b"",
+            "more_body": False,
+        })
@@ -0,0 +1,105 @@
+import hashlib
+from typing import Dict, List, Tuple
+
+# Domain separation prefixes (as in RFC 6962) so a leaf can never be
+# passed off as an internal node.
+LEAF_PREFIX = b"\x00"
+NODE_PREFIX = b"\x01"
+DIGEST_SIZE = 32
+
+
+class MerkleTreeBuilder:
+    """
+    Incrementally compute SHA-256 leaf hashes over fixed-size chunks.
+
+    Data can be fed in pieces of any size; each leaf is hashed as the bytes
+    arrive, so nothing beyond the current piece is buffered.
+    """
+
+    def __init__(self, chunk_size: int):
+        self.chunk_size = chunk_size
+        self.leaves: List[bytes] = []
+        self._current = hashlib.sha256(LEAF_PREFIX)
+        self._current_size = 0
+
+    def update(self, data: bytes) -> None:
+        view = memoryview(data)
+        while view:
+            take = min(len(view), self.chunk_size - self._current_size)
+            self._current.update(view[:take])
+            self._current_size += take
+            view = view[take:]
+            if self._current_size == self.chunk_size:
+                self._close_leaf()
+
+    def finish(self) -> List[bytes]:
+        """Close the trailing partial chunk and return all leaf hashes."""
+        if self._current_size or not self.leaves:
+            self._close_leaf()
+        return self.leaves
+
+    def _close_leaf(self) -> None:
+        self.leaves.append(self._current.digest())
+        self._current = hashlib.sha256(LEAF_PREFIX)
+        self._current_size = 0
+
+
+def hash_leaf(data: bytes) -> bytes:
+    """Hash one chunk of file content as a Merkle leaf."""
+    leaf = hashlib.sha256(LEAF_PREFIX)
+    leaf.update(data)
+    return leaf.digest()
+
+
+def merkle_root(leaves: List[bytes]) -> str:
+    """
+    Compute the Merkle root of a list of leaf hashes.
+
+    An unpaired node at the end of a level is promoted unchanged.
+
+    Returns:
+        Hexadecimal root hash
+    """
+    level = list(leaves) or [hash_leaf(b"")]
+    while len(level) > 1:
+        next_level = [
+            hashlib.sha256(NODE_PREFIX + level[i] + level[i + 1]).digest()
+            for i in range(0, len(level) - 1, 2)
+        ]
+        if len(level) % 2:
+            next_level.append(level[-1])
+        level = next_level
+    return level[0].hex()
+
+
+def pack_leaves(leaves: List[bytes]) -> bytes:
+    """Serialize leaf hashes for storage."""
+    return b"".join(leaves)
+
+
+def unpack_leaves(packed: bytes) -> List[bytes]:
+    """Deserialize leaf hashes stored with ``pack_leaves``."""
+    return [packed[i:i + DIGEST_SIZE] for i in range(0, len(packed), DIGEST_SIZE)]
+
+
+def corrupted_ranges(chunk_indexes: List[int], chunk_size: int, file_size: int) -> List[Dict[str, int]]:
+    """
+    Turn mismatching chunk indexes into merged, inclusive byte ranges.
+
+    Args:
+        chunk_indexes: Indexes of chunks whose hash did not match
+        chunk_size: Size of a Merkle chunk in bytes
+        file_size: Expected size of the file in bytes
+
+    Returns:
+        List of {"start": ..., "end": ...} byte ranges
+    """
+    ranges: List[Tuple[int, int]] = []
+    for index in sorted(chunk_indexes):
+        start = index * chunk_size
+        end = min(start + chunk_size, max(file_size, start + 1)) - 1
+        if ranges and ranges[-1][1] + 1 == start:
+            ranges[-1] = (ranges[-1][0], end)
+        else:
+            ranges.append((start, end))
+    return [{"start": start, "end": end} for start, end in ranges]
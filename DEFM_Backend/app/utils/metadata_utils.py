@@ -0,0 +1,230 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, BinaryIO, Dict, Optional
+import logging
+import os
+import re
+import zipfile
+import xml.etree.ElementTree as ElementTree
+
+logger = logging.getLogger(__name__)
+
+MAX_VALUE_LENGTH = 1024
+
+IMAGE_EXTENSIONS = {"jpg", "jpeg", "png", "gif", "bmp", "tif", "tiff", "webp"}
+DOCX_EXTENSIONS = {"docx", "xlsx", "pptx"}
+PDF_EXTENSIONS = {"pdf"}
+
+# EXIF tags copied from the main IFD and the Exif sub-IFD
+EXIF_IFD_POINTER = 0x8769
+GPS_IFD_POINTER = 0x8825
+EXIF_TAGS = {
+    0x010F: "exif.make",
+    0x0110: "exif.model",
+    0x0131: "exif.software",
+    0x0132: "exif.datetime",
+    0x013B: "exif.artist",
+    0x8298: "exif.copyright",
+    0x9003: "exif.datetime_original",
+    0x9004: "exif.datetime_digitized",
+    0x9010: "exif.offset_time",
+    0xA420: "exif.image_unique_id",
+    0xA430: "exif.camera_owner",
+    0xA431: "exif.body_serial_number",
+    0xA434: "exif.lens_model",
+}
+
+# Office Open XML core and extended properties
+OOXML_NAMESPACES = {
+    "cp": "http://schemas.openxmlformats.org/package/2006/metadata/core-properties",
+    "dc": "http://purl.org/dc/elements/1.1/",
+    "dcterms": "http://purl.org/dc/terms/",
+    "ep": "http://schemas.openxmlformats.org/officeDocument/2006/extended-properties",
+}
+OOXML_CORE_PROPERTIES = {
+    "dc:title": "document.title",
+    "dc:subject": "document.subject",
+    "dc:creator": "document.author",
+    "cp:lastModifiedBy": "document.last_modified_by",
+    "cp:keywords": "document.keywords",
+    "cp:revision": "document.revision",
+    "dcterms:created": "document.created",
+    "dcterms:modified": "document.modified",
+    "cp:lastPrinted": "document.last_printed",
+}
+OOXML_APP_PROPERTIES = {
+    "ep:Application": "document.application",
+    "ep:Company": "document.company",
+    "ep:TotalTime": "document.editing_minutes",
+    "ep:Pages": "document.pages",
+}
+
+PDF_PROPERTIES = {
+    "/Title": "document.title",
+    "/Subject": "document.subject",
+    "/Author": "document.author",
+    "/Keywords": "document.keywords",
+    "/Creator": "document.application",
+    "/Producer": "document.producer",
+    "/CreationDate": "document.created",
+    "/ModDate": "document.modified",
+}
+PDF_DATE_PROPERTIES = {"/CreationDate", "/ModDate"}
+PDF_DATE_PATTERN = re.compile(
+    r"(?:D:)?(\d{4})(\d{2})?(\d{2})?(\d{2})?(\d{2})?(\d{2})?(?:([Z+-])(\d{2})?'?(\d{2})?'?)?"
+)
+
+
+def metadata_kind(file_name: Optional[str], mime_type: Optional[str] = None) -> Optional[str]:
+    """
+    Tell which extractor handles a file.
+
+    Returns:
+        "image", "docx" or "pdf", or None if no metadata is extracted
+    """
+    extension = os.path.splitext(file_name or "")[1].lstrip(".").lower()
+    if extension in IMAGE_EXTENSIONS or (mime_type or "").startswith("image/"):
+        return "image"
+    if extension in DOCX_EXTENSIONS:
+        return "docx"
+    if extension in PDF_EXTENSIONS or mime_type == "application/pdf":
+        return "pdf"
+    return None
+
+
+def extract_metadata(file_obj: BinaryIO, kind: str) -> Dict[str, str]:
+    """
+    Read the embedded metadata of a file.
+
+    Args:
+        file_obj: Seekable stream of the file
+        kind: "image", "docx" or "pdf", see metadata_kind
+
+    Returns:
+        Dict of normalised keys (e.g. exif.model, gps.latitude,
+        document.author) to string values
+    """
+    if kind == "image":
+        values = _extract_image_metadata(file_obj)
+    elif kind == "docx":
+        values = _extract_ooxml_metadata(file_obj)
+    elif kind == "pdf":
+        values = _extract_pdf_metadata(file_obj)
+    else:
+        raise ValueError(f"Unsupported metadata kind: {kind}")
+
+    metadata = {}
+    for key, value in values.items():
+        text = _format_value(value)
+        if text:
+            metadata[key] = text[:MAX_VALUE_LENGTH]
+    return metadata
+
+
+def _format_value(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, bytes):
+        value = value.decode("utf-8", errors="replace")
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, float):
+        return f"{value:.7f}".rstrip("0").rstrip(".")
+    return str(value).replace("\x00", "").strip()
+
+
+def _extract_image_metadata(file_obj: BinaryIO) -> Dict[str, Any]:
+    from PIL import Image
+
+    values: Dict[str, Any] = {}
+    with Image.open(file_obj) as image:
+        # Only the header is parsed; the pixel data is never decoded
+        values["image.width"] = image.width
+        values["image.height"] = image.height
+        values["image.format"] = image.format
+        exif = image.getexif()
+
+    tags = dict(exif)
+    tags.update(exif.get_ifd(EXIF_IFD_POINTER))
+    for tag, key in EXIF_TAGS.items():
+        if tag in tags:
+            values[key] = tags[tag]
+
+    gps = exif.get_ifd(GPS_IFD_POINTER)
+    if gps:
+        values["gps.latitude"] = _gps_coordinate(gps.get(2), gps.get(1))
+        values["gps.longitude"] = _gps_coordinate(gps.get(4), gps.get(3))
+        if gps.get(6) is not None:
+            altitude = float(gps[6])
+            values["gps.altitude"] = -altitude if gps.get(5) in (1, b"\x01") else altitude
+        if gps.get(29):
+            values["gps.datestamp"] = gps[29]
+    return values
+
+
+def _gps_coordinate(dms, ref) -> Optional[float]:
+    """Convert EXIF degrees/minutes/seconds to signed decimal degrees."""
+    try:
+        degrees, minutes, seconds = (float(part) for part in dms)
+    except (TypeError, ValueError, ZeroDivisionError):
+        return None
+    coordinate = degrees + minutes / 60 + seconds / 3600
+    if isinstance(ref, bytes):
+        ref = ref.decode("ascii", errors="ignore")
+    if ref in ("S", "W"):
+        coordinate = -coordinate
+    return coordinate
+
+
+def _extract_ooxml_metadata(file_obj: BinaryIO) -> Dict[str, Any]:
+    values: Dict[str, Any] = {}
+    with zipfile.ZipFile(file_obj) as package:
+        names = set(package.namelist())
+        for part, properties in (("docProps/core.xml", OOXML_CORE_PROPERTIES),
+                                 ("docProps/app.xml", OOXML_APP_PROPERTIES)):
+            if part not in names:
+                continue
+            root = ElementTree.fromstring(package.read(part))
+            for path, key in properties.items():
+                element = root.find(path, OOXML_NAMESPACES)
+                if element is not None and element.text:
+                    values[key] = element.text
+    return values
+
+
+def _extract_pdf_metadata(file_obj: BinaryIO) -> Dict[str, Any]:
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        logger.warning("pypdf is not installed, skipping PDF metadata")
+        return {}
+
+    reader = PdfReader(file_obj)
+    values: Dict[str, Any] = {"document.pages": len(reader.pages)}
+    info = reader.metadata or {}
+    for name, key in PDF_PROPERTIES.items():
+        value = info.get(name)
+        if value is not None and name in PDF_DATE_PROPERTIES:
+            value = _parse_pdf_date(str(value)) or value
+        values[key] = value
+    return values
+
+
+def _parse_pdf_date(value: str) -> Optional[datetime]:
+    """Parse a PDF date string such as D:20240131120000+01'00'."""
+    match = PDF_DATE_PATTERN.match(value.strip())
+    if not match:
+        return None
+    year, month, day, hour, minute, second, sign, offset_hours, offset_minutes = match.groups()
+    try:
+        parsed = datetime(
+            int(year), int(month or 1), int(day or 1),
+            int(hour or 0), int(minute or 0), int(second or 0)
+        )
+    except ValueError:
+        return None
+    if sign in ("+", "-"):
+        offset = timedelta(hours=int(offset_hours or 0), minutes=int(offset_minutes or 0))
+        parsed = parsed.replace(tzinfo=timezone(-offset if sign == "-" else offset))
+    elif sign == "Z":
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
@@ -0,0 +1,122 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from typing import Any, List, Optional, Sequence
+import binascii
+import json
+
+from sqlalchemy import DateTime, Select, String, literal, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.types import TypeDecorator
+
+# Response header carrying the cursor of the page after the current one
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class InvalidCursor(ValueError):
+    """Raised when a pagination cursor can't be decoded for this listing."""
+
+
+class _CursorDateTime(TypeDecorator):
+    """
+    Binds a datetime from a cursor in the text format SQLite stored it in.
+
+    SQLite compares datetimes as text. Rows written with CURRENT_TIMESTAMP
+    (``server_default=func.now()``) have no fractional seconds, while
+    SQLAlchemy always binds six digits, so a cursor at "10:00:00" bound as
+    "10:00:00.000000" would sort after its own row and repeat it. A value
+    written from Python with exactly zero microseconds is the one case
+    still bound in the wrong form.
+    """
+
+    impl = DateTime
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "sqlite":
+            return dialect.type_descriptor(String())
+        return dialect.type_descriptor(self.impl_instance)
+
+    def process_bind_param(self, value, dialect):
+        if dialect.name == "sqlite":
+            return value.strftime("%Y-%m-%d %H:%M:%S.%f" if value.microsecond else "%Y-%m-%d %H:%M:%S")
+        return value
+
+
+class Keyset:
+    """
+    Keyset (cursor) pagination over a stable sort key.
+
+    Offset paging makes the database read and discard every row before the
+    requested page, so deep pages get slower the further a client goes. A
+    cursor holds the sort key of the last row returned, and the next page
+    starts with ``WHERE (key) > (cursor)``, which an index on the key
+    answers by seeking straight to the first row of the page.
+
+    The last column must be unique (the primary key) so that no two rows
+    share a position and no row is skipped or repeated between pages.
+    """
+
+    def __init__(self, *columns: InstrumentedAttribute, descending: bool = False):
+        self.columns = columns
+        self.descending = descending
+
+    def order_by(self, query: Select) -> Select:
+        """Sort a query by the key."""
+        return query.order_by(*(column.desc() if self.descending else column.asc() for column in self.columns))
+
+    def paginate(self, query: Select, cursor: Optional[str], skip: int, limit: int) -> Select:
+        """
+        Sort a query by the key and limit it to one page.
+
+        Args:
+            query: Filtered listing query
+            cursor: Cursor of the page to return, None for offset paging
+            skip: Rows to skip when no cursor is given
+            limit: Maximum number of rows on the page
+
+        Raises:
+            InvalidCursor: If the cursor wasn't issued for this key
+        """
+        query = self.order_by(query)
+        if cursor is not None:
+            key = tuple_(*self.columns)
+            position = tuple_(*(
+                literal(value, _CursorDateTime(timezone=column.type.timezone))
+                if isinstance(value, datetime) else value
+                for column, value in zip(self.columns, self.decode(cursor))
+            ))
+            query = query.where(key < position if self.descending else key > position)
+        elif skip:
+            query = query.offset(skip)
+        return query.limit(limit)
+
+    def next_cursor(self, rows: Sequence[Any], limit: int) -> Optional[str]:
+        """Get the cursor of the page after ``rows``, None if this was the last page."""
+        if not rows or len(rows) < limit:
+            return None
+        return self.encode([getattr(rows[-1], column.key) for column in self.columns])
+
+    def encode(self, values: List[Any]) -> str:
+        payload = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+        return urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+    def decode(self, cursor: str) -> List[Any]:
+        try:
+            payload = json.loads(urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        except (binascii.Error, UnicodeDecodeError, ValueError):
+            raise InvalidCursor("Malformed cursor")
+        if not isinstance(payload, list) or len(payload) != len(self.columns):
+            raise InvalidCursor("Cursor does not belong to this listing")
+
+        values = []
+        for column, value in zip(self.columns, payload):
+            python_type = column.type.python_type
+            try:
+                if python_type is datetime:
+                    value = datetime.fromisoformat(value)
+                elif not isinstance(value, python_type) or isinstance(value, bool):
+                    raise TypeError
+            except (TypeError, ValueError):
+                raise InvalidCursor("Cursor does not belong to this listing")
+            values.append(value)
+        return values
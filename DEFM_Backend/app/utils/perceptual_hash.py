@@ -0,0 +1,87 @@
+from typing import BinaryIO, Dict
+import numpy as np
+
+HASH_TYPES = ("ahash", "dhash", "phash")
+
+# Bits set in each byte value, for popcounts on NumPy versions without bitwise_count
+_POPCOUNT_TABLE = np.array([bin(value).count("1") for value in range(256)], dtype=np.uint8)
+
+
+def _dct_matrix(size: int) -> np.ndarray:
+    """Orthonormal DCT-II basis, so a 2-D DCT is two matrix products."""
+    n = np.arange(size)
+    matrix = np.cos(np.pi * (2 * n[None, :] + 1) * n[:, None] / (2 * size))
+    matrix[0] *= np.sqrt(1 / size)
+    matrix[1:] *= np.sqrt(2 / size)
+    return matrix
+
+
+_DCT_32 = _dct_matrix(32)
+
+
+def _pack_bits(bits: np.ndarray) -> int:
+    """Pack 64 booleans into an unsigned 64-bit integer, first bit most significant."""
+    return int.from_bytes(np.packbits(bits.ravel()).tobytes(), "big")
+
+
+def _grayscale(image, width: int, height: int) -> np.ndarray:
+    from PIL import Image
+
+    resized = image.convert("L").resize((width, height), Image.Resampling.LANCZOS)
+    return np.asarray(resized, dtype=np.float64)
+
+
+def average_hash(image) -> int:
+    """aHash: 8x8 grayscale pixels compared with their mean."""
+    pixels = _grayscale(image, 8, 8)
+    return _pack_bits(pixels > pixels.mean())
+
+
+def difference_hash(image) -> int:
+    """dHash: horizontal gradient signs of a 9x8 grayscale image."""
+    pixels = _grayscale(image, 9, 8)
+    return _pack_bits(pixels[:, 1:] > pixels[:, :-1])
+
+
+def dct_hash(image) -> int:
+    """pHash: low-frequency 8x8 DCT coefficients of a 32x32 image compared with their median."""
+    pixels = _grayscale(image, 32, 32)
+    coefficients = (_DCT_32 @ pixels @ _DCT_32.T)[:8, :8]
+    # The DC term only reflects overall brightness, so it doesn't set the threshold
+    median = np.median(coefficients.ravel()[1:])
+    return _pack_bits(coefficients > median)
+
+
+def compute_perceptual_hashes(file_obj: BinaryIO) -> Dict[str, int]:
+    """
+    Compute aHash, dHash and pHash of an image in one decode.
+
+    Returns:
+        Mapping of hash type to unsigned 64-bit hash
+    """
+    from PIL import Image, ImageOps
+
+    with Image.open(file_obj) as image:
+        # Decode at reduced scale where the format allows; 32px is all we need
+        image.draft("RGB", (64, 64))
+        image = ImageOps.exif_transpose(image)
+        return {
+            "ahash": average_hash(image),
+            "dhash": difference_hash(image),
+            "phash": dct_hash(image),
+        }
+
+
+def hamming_distances(hashes: np.ndarray, value: int) -> np.ndarray:
+    """Hamming distance of every uint64 in an array to one hash."""
+    xor = np.bitwise_xor(hashes, np.uint64(value))
+    return _POPCOUNT_TABLE[xor.view(np.uint8)].reshape(-1, 8).sum(axis=1, dtype=np.uint8)
+
+
+def to_signed(value: int) -> int:
+    """Store an unsigned 64-bit hash in a signed BIGINT column."""
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def to_unsigned(value: int) -> int:
+    return value + (1 << 64) if value < 0 else value
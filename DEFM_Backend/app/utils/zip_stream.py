@@ -0,0 +1,120 @@
+from datetime import datetime
+from typing import BinaryIO, Callable, Iterator, List, Optional, Set, Tuple
+import zipfile
+
+READ_SIZE = 1024 * 1024
+
+
+class _StreamSink:
+    """
+    Write-only file object that hands written bytes to the consumer.
+
+    It has no ``tell`` or ``seek``, so ``zipfile`` writes data descriptors
+    after each member instead of seeking back to patch its header.
+    """
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        if data:
+            self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> Iterator[bytes]:
+        chunks, self._chunks = self._chunks, []
+        yield from chunks
+
+
+class ZipStreamWriter:
+    """
+    Build a ZIP64 archive on the fly, yielding its bytes as they are produced.
+
+    Members are stored uncompressed (evidence is usually already
+    compressed media) and every member uses ZIP64 records, so sizes beyond
+    4 GiB and more than 65,535 members are fine. Only one read buffer of
+    member data is held at a time.
+
+    Usage::
+
+        writer = ZipStreamWriter()
+        yield from writer.add_file("a.txt", opener)
+        yield from writer.add_bytes("manifest.csv", data)
+        yield from writer.close()
+    """
+
+    def __init__(self, compression: int = zipfile.ZIP_STORED):
+        self._sink = _StreamSink()
+        self._zip = zipfile.ZipFile(self._sink, "w", compression=compression, allowZip64=True)
+        self._compression = compression
+
+    def add_file(
+        self,
+        arcname: str,
+        opener: Callable[[], BinaryIO],
+        date_time: Optional[datetime] = None,
+        on_data: Optional[Callable[[bytes], None]] = None
+    ) -> Iterator[bytes]:
+        """
+        Add a member read from a file object.
+
+        Args:
+            arcname: Path of the member in the archive
+            opener: Returns the file object to read, which is closed afterwards
+            date_time: Modification time recorded for the member
+            on_data: Called with each chunk, e.g. to hash the content as it is sent
+        """
+        info = self._member_info(arcname, date_time)
+        with opener() as source, self._zip.open(info, "w", force_zip64=True) as member:
+            for chunk in iter(lambda: source.read(READ_SIZE), b""):
+                member.write(chunk)
+                if on_data is not None:
+                    on_data(chunk)
+                yield from self._sink.drain()
+        yield from self._sink.drain()
+
+    def add_bytes(self, arcname: str, data: bytes, date_time: Optional[datetime] = None) -> Iterator[bytes]:
+        """Add a small member held in memory."""
+        info = self._member_info(arcname, date_time)
+        with self._zip.open(info, "w", force_zip64=True) as member:
+            member.write(data)
+        yield from self._sink.drain()
+
+    def close(self) -> Iterator[bytes]:
+        """Write the central directory."""
+        self._zip.close()
+        yield from self._sink.drain()
+
+    def _member_info(self, arcname: str, date_time: Optional[datetime]) -> zipfile.ZipInfo:
+        stamp = date_time or datetime.now()
+        # ZIP timestamps can't go before 1980
+        date_tuple: Tuple[int, ...] = max(stamp.timetuple()[:6], (1980, 1, 1, 0, 0, 0))
+        info = zipfile.ZipInfo(arcname, date_time=date_tuple)
+        info.compress_type = self._compression
+        info.external_attr = 0o644 << 16
+        return info
+
+
+def unique_arcname(arcname: str, used: Set[str]) -> str:
+    """Make a member path unique by numbering repeats, e.g. a.txt, a (2).txt."""
+    candidate = arcname
+    stem, dot, extension = arcname.rpartition(".")
+    if not dot or "/" in extension:
+        stem, dot, extension = arcname, "", ""
+    counter = 2
+    while candidate in used:
+        candidate = f"{stem} ({counter}){dot}{extension}"
+        counter += 1
+    used.add(candidate)
+    return candidate
+
+
+def safe_member_name(name: str) -> str:
+    """Reduce a user-supplied file name to a single safe path component."""
+    name = name.replace("\\", "/").split("/")[-1].strip()
+    name = "".join(c for c in name if c >= " " and c not in '<>:"|?*')
+    return name.lstrip(".") or "file"
+
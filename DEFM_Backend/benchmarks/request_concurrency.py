@@ -0,0 +1,148 @@
+"""
+Request concurrency benchmark: one uvicorn worker, N concurrent clients.
+
+Starts the app on a scratch SQLite database, seeds 50 cases, then has N
+clients loop on one endpoint for a few seconds per concurrency level and
+reports throughput and latency. ``--db-latency-ms`` adds a sleep inside
+every SQL statement, where the driver runs it, to emulate the network
+round trip of a remote database server.
+
+    python benchmarks/request_concurrency.py [--path /cases/1] [--clients 1,4,16,64] [--db-latency-ms 2]
+
+To compare with another version of the backend, point ``--tree`` at its
+checkout; the benchmark runs that tree's app.
+"""
+import argparse
+import asyncio
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SEED_CASES = 50
+
+
+def serve(tree: str, port: int, latency_ms: float) -> None:
+    """Run the app of ``tree``, sleeping ``latency_ms`` in every SQL statement."""
+    sys.path.insert(0, tree)
+    import uvicorn
+    from sqlalchemy import event
+    import app.core.database as database
+
+    delay = latency_ms / 1000
+    if delay:
+        def trace(_statement):
+            time.sleep(delay)
+
+        @event.listens_for(database.engine, "connect")
+        def _sync_connect(dbapi_connection, _record):
+            dbapi_connection.set_trace_callback(trace)
+
+        # Older trees only have the synchronous engine
+        async_engine = getattr(database, "async_engine", None)
+        if async_engine is not None:
+            @event.listens_for(async_engine.sync_engine, "connect")
+            def _async_connect(dbapi_connection, _record):
+                # Runs on the aiosqlite thread, like the statements themselves
+                dbapi_connection.await_(dbapi_connection._connection.set_trace_callback(trace))
+
+    import main
+    uvicorn.run(main.app, port=port, log_level="warning")
+
+
+async def run_clients(base_url: str, path: str, levels, seconds: float) -> None:
+    limits = httpx.Limits(max_connections=max(levels) * 2)
+    async with httpx.AsyncClient(base_url=base_url, timeout=60, trust_env=False, limits=limits) as client:
+        for _ in range(600):
+            try:
+                response = await client.post("/auth/login", json={"username": "admin", "password": "admin123"})
+                break
+            except httpx.HTTPError:
+                await asyncio.sleep(0.2)
+        else:
+            raise SystemExit("The server did not start")
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        for i in range(SEED_CASES):
+            case = (await client.post("/cases/", json={"title": f"Case {i}"}, headers=headers)).json()
+            await client.post(
+                "/evidence/", json={"title": "Evidence", "evidence_type": "digital", "case_id": case["id"]},
+                headers=headers,
+            )
+
+        for clients in levels:
+            done, errors, latencies = 0, 0, []
+            end = time.perf_counter() + seconds
+
+            async def worker():
+                nonlocal done, errors
+                while time.perf_counter() < end:
+                    started = time.perf_counter()
+                    try:
+                        ok = (await client.get(path, headers=headers, timeout=10)).status_code == 200
+                    except httpx.HTTPError:
+                        ok = False
+                    if ok:
+                        done += 1
+                        latencies.append(time.perf_counter() - started)
+                    else:
+                        errors += 1
+
+            started = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(clients)))
+            elapsed = time.perf_counter() - started
+            latencies = sorted(latencies) or [float("nan")]
+            print(
+                f"c={clients:<3d} {done / elapsed:7.1f} req/s  "
+                f"p50 {latencies[len(latencies) // 2] * 1000:6.1f} ms  "
+                f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:6.1f} ms  errors {errors}",
+                flush=True,
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--path", default="/cases/1", help="Endpoint under /api/v1 to request")
+    parser.add_argument("--clients", default="1,4,16,64", help="Comma-separated concurrency levels")
+    parser.add_argument("--seconds", type=float, default=5, help="Duration of each level")
+    parser.add_argument("--db-latency-ms", type=float, default=0, help="Emulated round trip per SQL statement")
+    parser.add_argument("--tree", default=BACKEND_DIR, help="Backend checkout to benchmark")
+    parser.add_argument("--serve", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(os.path.abspath(args.tree), args.serve, args.db_latency_ms)
+        return
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    scratch = tempfile.mkdtemp()
+    env = dict(
+        os.environ,
+        DATABASE_URL=f"sqlite:///{scratch}/benchmark.db",
+        UPLOAD_DIRECTORY=f"{scratch}/uploads",
+        INTEGRITY_SCAN_ENABLED="false",
+    )
+    server = subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), "--serve", str(port),
+         "--tree", os.path.abspath(args.tree), "--db-latency-ms", str(args.db_latency_ms)],
+        cwd=args.tree, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        print(f"GET {args.path}, SQL latency {args.db_latency_ms:g} ms, tree {os.path.abspath(args.tree)}")
+        levels = [int(level) for level in args.clients.split(",")]
+        asyncio.run(run_clients(f"http://127.0.0.1:{port}/api/v1", args.path, levels, args.seconds))
+    finally:
+        server.terminate()
+        server.wait()
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
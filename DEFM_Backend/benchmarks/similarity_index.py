@@ -0,0 +1,64 @@
+"""
+Similarity index benchmark: multi-index hashing against a linear scan.
+
+Builds a MultiIndexHashTable over random 64-bit hashes (1M by default)
+and times queries at growing Hamming radii, next to a vectorized scan
+over the same hashes. Every query result is checked against the scan.
+
+    python benchmarks/similarity_index.py [--size 1000000] [--queries 200]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.similarity_service import MultiIndexHashTable  # noqa: E402
+from app.utils.perceptual_hash import hamming_distances  # noqa: E402
+
+RADII = (4, 8, 12, 16, 20)
+SCAN_QUERIES = 20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=1_000_000, help="Number of hashes in the index")
+    parser.add_argument("--queries", type=int, default=200, help="Queries timed per radius")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    hashes = rng.integers(0, 2 ** 64, size=args.size, dtype=np.uint64)
+
+    table = MultiIndexHashTable()
+    started = time.perf_counter()
+    for row_id, value in enumerate(hashes.tolist()):
+        table.add(row_id, value)
+    # The first query merges the pending rows; time it as part of the build
+    table.query(0, 0)
+    print(f"{args.size} hashes, build {time.perf_counter() - started:.2f} s")
+
+    # Near-duplicates of stored hashes, like a re-encoded copy of an image
+    queries = [value ^ 0b1011 for value in hashes[rng.integers(0, args.size, args.queries)].tolist()]
+    for radius in RADII:
+        started = time.perf_counter()
+        results = [table.query(value, radius) for value in queries]
+        indexed_ms = (time.perf_counter() - started) / len(queries) * 1000
+
+        started = time.perf_counter()
+        for value in queries[:SCAN_QUERIES]:
+            np.nonzero(hamming_distances(hashes, value) <= radius)
+        scan_ms = (time.perf_counter() - started) / SCAN_QUERIES * 1000
+
+        for value, result in zip(queries, results):
+            expected = np.nonzero(hamming_distances(hashes, value) <= radius)[0].tolist()
+            assert sorted(row_id for row_id, _ in result) == expected, f"d={radius} differs from the scan"
+        print(f"d={radius:<3d} index {indexed_ms:7.2f} ms/query   linear scan {scan_ms:6.1f} ms/query")
+    print("Results match the linear scan")
+
+
+if __name__ == "__main__":
+    main()
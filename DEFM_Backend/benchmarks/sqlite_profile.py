@@ -0,0 +1,161 @@
+"""
+SQLite profile benchmark: concurrent readers and writers on the app's engine.
+
+Each mix of reader and writer threads runs for a few seconds against a
+fresh database of 2000 cases, once with SQLite's own defaults (rollback
+journal, synchronous=FULL) and once with the configured SQLITE_* profile.
+Readers run the dashboard counts and the first page of the case list;
+writers update one case per transaction.
+
+    python benchmarks/sqlite_profile.py [--mixes 0:1,4:0,4:1,8:4] [--dir /path/on/the/data/disk]
+
+Commit cost depends on fsync, so put the database (``--dir``) on the disk
+the real one lives on rather than on a tmpfs.
+"""
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SEED_CASES = 2000
+
+# The pragmas SQLite runs with when nothing sets them; the 5 s busy
+# timeout is the one Python's sqlite3 module applies by default
+SQLITE_DEFAULTS = {
+    "SQLITE_JOURNAL_MODE": "delete",
+    "SQLITE_SYNCHRONOUS": "full",
+    "SQLITE_CACHE_SIZE_KB": "2000",
+    "SQLITE_MMAP_SIZE": "0",
+    "SQLITE_BUSY_TIMEOUT_MS": "5000",
+    "SQLITE_TEMP_STORE": "default",
+}
+
+
+def run_mix(readers: int, writers: int, seconds: float) -> None:
+    """Measure one mix on the database in DATABASE_URL. Runs in its own process."""
+    sys.path.insert(0, BACKEND_DIR)
+    from sqlalchemy import func, select, update
+    from app.core.database import SessionLocal, create_tables
+    from app.models.models import Case, Evidence, User
+    from app.services.initial_data import create_initial_data
+
+    create_tables()
+    create_initial_data()
+    db = SessionLocal()
+    user_id = db.scalar(select(User.id))
+    db.add_all(
+        Case(case_number=f"CASE-{i:05d}", title=f"Case {i}", description="x" * 500, created_by=user_id)
+        for i in range(SEED_CASES)
+    )
+    db.commit()
+    db.close()
+
+    stats = {"read": [0, 0, []], "write": [0, 0, []]}
+    lock = threading.Lock()
+    end = time.perf_counter() + seconds
+
+    def record(kind: str, ok: bool, started: float) -> None:
+        with lock:
+            counts = stats[kind]
+            if ok:
+                counts[0] += 1
+                counts[2].append(time.perf_counter() - started)
+            else:
+                counts[1] += 1
+
+    def reader() -> None:
+        while time.perf_counter() < end:
+            started = time.perf_counter()
+            session = SessionLocal()
+            try:
+                session.scalar(select(func.count(Case.id)))
+                session.scalar(select(func.count(Evidence.id)))
+                session.scalars(select(Case).order_by(Case.id.desc()).limit(50)).all()
+                ok = True
+            except Exception:
+                ok = False
+            finally:
+                session.close()
+            record("read", ok, started)
+
+    def writer(offset: int) -> None:
+        i = offset
+        while time.perf_counter() < end:
+            i += 1
+            started = time.perf_counter()
+            session = SessionLocal()
+            try:
+                session.execute(
+                    update(Case).where(Case.id == 1 + i % SEED_CASES).values(description=f"w{i}" * 100)
+                )
+                session.commit()
+                ok = True
+            except Exception:
+                session.rollback()
+                ok = False
+            finally:
+                session.close()
+            record("write", ok, started)
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    threads += [threading.Thread(target=writer, args=(n * 97,)) for n in range(writers)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    for kind, (ok, errors, latencies) in stats.items():
+        if not ok and not errors:
+            continue
+        latencies = sorted(latencies) or [float("nan")]
+        print(
+            f"  {kind:5s} {ok / elapsed:7.1f} /s  p50 {latencies[len(latencies) // 2] * 1000:7.2f} ms  "
+            f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:7.2f} ms  errors {errors}",
+            flush=True,
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--mixes", default="0:1,4:0,4:1,8:4", help="Comma-separated readers:writers thread counts")
+    parser.add_argument("--seconds", type=float, default=10, help="Duration of each mix")
+    parser.add_argument("--dir", default=None, help="Directory for the scratch databases")
+    parser.add_argument("--run", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        readers, writers = (int(count) for count in args.run.split(":"))
+        run_mix(readers, writers, args.seconds)
+        return
+
+    profiles = [("SQLite defaults", SQLITE_DEFAULTS), ("configured profile", {})]
+    for mix in args.mixes.split(","):
+        readers, writers = mix.split(":")
+        print(f"{readers} readers, {writers} writers")
+        for name, overrides in profiles:
+            scratch = tempfile.mkdtemp(dir=args.dir)
+            try:
+                env = dict(
+                    os.environ,
+                    DATABASE_URL=f"sqlite:///{scratch}/benchmark.db",
+                    UPLOAD_DIRECTORY=f"{scratch}/uploads",
+                    **overrides,
+                )
+                print(f" {name}", flush=True)
+                subprocess.run(
+                    [sys.executable, os.path.abspath(__file__), "--run", mix, "--seconds", str(args.seconds)],
+                    cwd=BACKEND_DIR, env=env, check=True,
+                )
+            finally:
+                shutil.rmtree(scratch, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
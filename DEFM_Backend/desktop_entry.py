@@ -1,3 +1,4 @@
+import multiprocessing
 import os
 import socket
 import shutil
@@ -212,4 +213,7 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    # The processing pool spawns worker processes; in the PyInstaller build
+    # each one re-runs this executable and must be handed to the worker here
+    multiprocessing.freeze_support()
     main()
@@ -4,10 +4,13 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from app.core.config import settings
 from app.audit_service import AuditService
-from app.core.database import create_tables
+from app.core.database import create_tables, replica_set
 from app.api.router import api_router  # Fixed import
 from app.core.lifespan import lifespan  # Use imported lifespan
+from app.core.replicas import ReplicaRoutingMiddleware
+from app.core.upload_admission import UploadAdmissionMiddleware
 from app.services.initial_data import create_initial_data
+from app.utils.pagination import NEXT_CURSOR_HEADER
 import logging
 import os
 
@@ -25,6 +28,13 @@ app = FastAPI(
     lifespan=lifespan  # Use the imported lifespan
 )
 
+# Reject uploads before their body is read when they can't be accepted
+# (added first so CORS headers still wrap its responses)
+app.add_middleware(UploadAdmissionMiddleware)
+
+# Serve the reads of GET requests from read replicas when configured
+app.add_middleware(ReplicaRoutingMiddleware, replicas=replica_set)
+
 # Add CORS middleware with relaxed settings to prevent preflight OPTIONS 400 errors
 app.add_middleware(
     CORSMiddleware,
@@ -33,6 +43,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Let browser clients read the cursor of the next page
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 # Include API routes
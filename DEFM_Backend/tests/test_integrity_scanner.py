@@ -0,0 +1,68 @@
+"""Integrity scanner batches over unreadable evidence files."""
+import hashlib
+import io
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.models.models import Case, Evidence, EvidenceIntegrityCheck, EvidenceType, IntegrityOutcome, User, UserRole
+from app.services import integrity_service
+from app.services.integrity_service import IntegrityScanner
+from app.services.storage_backend import COMPRESSED_SUFFIX
+from app.utils.frame_compression import HEADER, compress_frames
+
+CONTENT = b"evidence content " * 4096
+
+
+@pytest.fixture
+def session_factory(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'scanner.db'}")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(integrity_service, "SessionLocal", factory)
+    yield factory
+    engine.dispose()
+
+
+def _add_evidence(db, number: str, file_path: str) -> None:
+    db.add(Evidence(
+        evidence_number=number, case_id=1, title=number, evidence_type=EvidenceType.digital,
+        collected_by=1, file_path=file_path, file_hash=hashlib.sha256(CONTENT).hexdigest(),
+    ))
+
+
+def test_corrupt_blob_is_recorded_and_the_batch_goes_on(session_factory, tmp_path):
+    # An archived blob whose first frame no longer inflates
+    compressed = io.BytesIO()
+    compress_frames(io.BytesIO(CONTENT), compressed, frame_size=16 * 1024)
+    data = bytearray(compressed.getvalue())
+    data[HEADER.size + 10] ^= 0xFF
+    corrupt_path = str(tmp_path / "corrupt")
+    with open(corrupt_path + COMPRESSED_SUFFIX, "wb") as f:
+        f.write(data)
+    intact_path = str(tmp_path / "intact")
+    with open(intact_path, "wb") as f:
+        f.write(CONTENT)
+
+    db = session_factory()
+    db.add(User(id=1, username="scanner", email="scanner@example.com", full_name="Scanner",
+                hashed_password="x", role=UserRole.investigator))
+    db.add(Case(id=1, case_number="CASE-00001", title="Case", created_by=1))
+    # The corrupt file comes first in the never-checked order
+    _add_evidence(db, "EV-1", corrupt_path)
+    _add_evidence(db, "EV-2", intact_path)
+    db.commit()
+
+    assert IntegrityScanner().scan_batch() == 2
+
+    outcomes = {
+        check.evidence.evidence_number: (check.outcome, check.source)
+        for check in db.query(EvidenceIntegrityCheck)
+    }
+    assert outcomes == {
+        "EV-1": (IntegrityOutcome.failed, "scanner"),
+        "EV-2": (IntegrityOutcome.passed, "scanner"),
+    }
+    db.close()
@@ -0,0 +1,78 @@
+"""Round trip of evidence files through the S3 storage backend, against moto's fake S3."""
+import os
+
+import pytest
+
+moto = pytest.importorskip("moto")
+boto3 = pytest.importorskip("boto3")
+
+from app.core.config import settings
+from app.services.storage_backend import S3StorageBackend, StorageBackend, parse_s3_locator
+
+BUCKET = "defm-test-evidence"
+PART_SIZE = 5 * 1024 * 1024
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    monkeypatch.setattr(settings, "S3_BUCKET", BUCKET)
+    monkeypatch.setattr(settings, "S3_PREFIX", "evidence")
+    monkeypatch.setattr(settings, "S3_ENDPOINT_URL", None)
+    monkeypatch.setattr(settings, "S3_REGION", "us-east-1")
+    monkeypatch.setattr(settings, "S3_ACCESS_KEY_ID", "testing")
+    monkeypatch.setattr(settings, "S3_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setattr(settings, "S3_MULTIPART_CHUNK_SIZE", PART_SIZE)
+    monkeypatch.setattr(settings, "S3_READ_AHEAD_SIZE", 64 * 1024)
+    with moto.mock_aws():
+        boto3.client("s3", region_name="us-east-1").create_bucket(Bucket=BUCKET)
+        yield S3StorageBackend()
+
+
+def _write(path, data: bytes) -> str:
+    with open(path, "wb") as f:
+        f.write(data)
+    return str(path)
+
+
+def test_storage_backend_is_abstract():
+    with pytest.raises(TypeError):
+        StorageBackend()
+
+
+@pytest.mark.parametrize("size", [1000, 2 * PART_SIZE + 12345], ids=["single-put", "multipart"])
+def test_round_trip(backend, tmp_path, size):
+    data = os.urandom(size)
+    locator = backend.blob_locator("ab" * 32)
+    assert parse_s3_locator(locator) == (BUCKET, f"evidence/blobs/ab/ab/{'ab' * 32}")
+    assert not backend.exists(locator)
+
+    local_path = _write(tmp_path / "upload", data)
+    backend.put_file(local_path, locator)
+    assert not os.path.exists(local_path)
+
+    assert backend.exists(locator)
+    assert backend.stat(locator)[0] == size
+    identity = backend.identity(locator)
+    assert identity is not None and identity == backend.identity(locator)
+
+    with backend.open(locator) as reader:
+        assert reader.read() == data
+        reader.seek(size // 2)
+        assert reader.read(100) == data[size // 2:size // 2 + 100]
+        reader.seek(-10, os.SEEK_END)
+        assert reader.read() == data[-10:]
+
+    backend.delete(locator)
+    assert not backend.exists(locator)
+    with pytest.raises(FileNotFoundError):
+        backend.stat(locator)
+
+
+def test_replacing_an_object_changes_its_identity(backend, tmp_path):
+    locator = backend.blob_locator("cd" * 32)
+    backend.put_file(_write(tmp_path / "first", b"first version"), locator)
+    identity = backend.identity(locator)
+    backend.put_file(_write(tmp_path / "second", b"second version!"), locator)
+    assert backend.identity(locator) != identity
+    with backend.open(locator) as reader:
+        assert reader.read() == b"second version!"
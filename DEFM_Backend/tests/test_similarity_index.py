@@ -0,0 +1,83 @@
+"""Similarity index results and their resolution to evidence."""
+import asyncio
+
+import numpy as np
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.database import Base
+from app.models.models import Case, Evidence, EvidenceType, ImageHash, User, UserRole
+from app.services import similarity_service
+from app.services.similarity_service import MultiIndexHashTable, SimilarityService
+from app.utils.perceptual_hash import hamming_distances
+
+
+@pytest.mark.parametrize("clustered", [False, True])
+def test_index_matches_linear_scan(clustered):
+    rng = np.random.default_rng(1)
+    hashes = rng.integers(0, 2 ** 64, size=20000, dtype=np.uint64)
+    if clustered:
+        # Most hashes share their high bits, so the segment probes hit many rows
+        hashes &= np.uint64(0x0000FFFFFFFFFFFF)
+    table = MultiIndexHashTable()
+    for row_id, value in enumerate(hashes.tolist()):
+        table.add(row_id, value)
+
+    for value in hashes[:25].tolist():
+        for radius in (0, 3, 8, 13, 20):
+            expected_distances = hamming_distances(hashes, value ^ 0b1011)
+            expected = np.nonzero(expected_distances <= radius)[0].tolist()
+            result = table.query(value ^ 0b1011, radius)
+            assert sorted(row_id for row_id, _ in result) == expected
+            assert [distance for _, distance in result] == sorted(distance for _, distance in result)
+
+
+class _FixedIndex:
+    def __init__(self, matches):
+        self.matches = matches
+
+    def query(self, value, max_distance):
+        return self.matches
+
+
+def test_find_similar_resolves_nearest_batches_only(tmp_path, monkeypatch):
+    # (image hash row id, distance), nearest first, as the index returns them;
+    # row 9 belongs to a deleted image
+    matches = [(1, 0), (2, 1), (9, 1), (3, 2), (4, 2), (6, 2), (5, 5)]
+    monkeypatch.setattr(similarity_service, "similarity_indexes", {"phash": _FixedIndex(matches)})
+    monkeypatch.setattr(similarity_service, "RESOLVE_BATCH_SIZE", 2)
+
+    async def run():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'similar.db'}")
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        lookups = []
+
+        @event.listens_for(engine.sync_engine, "before_cursor_execute")
+        def count_lookups(connection, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().startswith("SELECT image_hashes.id"):
+                lookups.append(parameters)
+
+        async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+            db.add(User(id=1, username="examiner", email="examiner@example.com", full_name="Examiner",
+                        hashed_password="x", role=UserRole.investigator))
+            db.add(Case(id=1, case_number="CASE-00001", title="Case", created_by=1))
+            for row_id in range(1, 7):
+                db.add(ImageHash(id=row_id, file_hash=f"h{row_id}", ahash=0, dhash=0, phash=0))
+            # Evidence 3 and 4 tie evidence 5 and 6 at distance 2 in a later batch
+            for evidence_id, file_hash in [(1, "h1"), (2, "h2"), (5, "h3"), (6, "h3"), (3, "h4"), (4, "h6"), (7, "h5")]:
+                db.add(Evidence(id=evidence_id, evidence_number=f"EV-{evidence_id}", case_id=1, title="Image",
+                                evidence_type=EvidenceType.image, collected_by=1, file_hash=file_hash))
+            await db.commit()
+
+            image_hash = await db.get(ImageHash, 1)
+            lookups.clear()
+            results = await SimilarityService(db).find_similar(1, image_hash, limit=3)
+        await engine.dispose()
+        return [(evidence.id, distance) for evidence, distance in results], len(lookups)
+
+    results, lookups = asyncio.run(run())
+    assert results == [(2, 1), (3, 2), (4, 2)]
+    # The batch at distance 5 can't beat the third result and is never looked up
+    assert lookups == 3
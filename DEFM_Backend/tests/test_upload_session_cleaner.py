@@ -0,0 +1,79 @@
+"""Upload session cleaner over expired sessions and orphaned chunk directories."""
+import os
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.core.database import Base
+from app.models.models import Case, Evidence, EvidenceType, UploadSession, UploadSessionStatus, User, UserRole
+from app.services import upload_service
+from app.services.upload_service import UploadSessionCleaner
+
+
+@pytest.fixture
+def session_factory(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'cleaner.db'}")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(upload_service, "SessionLocal", factory)
+    monkeypatch.setattr(upload_service, "SESSIONS_DIRECTORY", str(tmp_path / "sessions"))
+    yield factory
+    engine.dispose()
+
+
+def _session_dir(session_id: str, age: timedelta) -> str:
+    session_dir = os.path.join(upload_service.SESSIONS_DIRECTORY, session_id)
+    os.makedirs(session_dir)
+    with open(os.path.join(session_dir, "00000000.part"), "wb") as f:
+        f.write(b"chunk")
+    last_chunk = time.time() - age.total_seconds()
+    os.utime(session_dir, (last_chunk, last_chunk))
+    return session_dir
+
+
+def _add_session(db, session_id: str, status: UploadSessionStatus, age: timedelta) -> None:
+    db.add(UploadSession(
+        id=session_id, evidence_id=1, file_name="disk.img", total_size=10, chunk_size=5, total_chunks=2,
+        status=status, created_by=1, created_at=datetime.utcnow() - age,
+    ))
+
+
+def test_expired_and_orphaned_sessions_are_removed(session_factory):
+    expired = timedelta(hours=settings.UPLOAD_SESSION_EXPIRY_HOURS + 1)
+    fresh = timedelta(minutes=5)
+
+    db = session_factory()
+    db.add(User(id=1, username="uploader", email="uploader@example.com", full_name="Uploader",
+                hashed_password="x", role=UserRole.investigator))
+    db.add(Case(id=1, case_number="CASE-00001", title="Case", created_by=1))
+    db.add(Evidence(id=1, evidence_number="EV-1", case_id=1, title="EV-1",
+                    evidence_type=EvidenceType.digital, collected_by=1))
+    _add_session(db, "abandoned", UploadSessionStatus.active, expired)
+    # Opened long ago but still receiving chunks
+    _add_session(db, "slow", UploadSessionStatus.active, expired)
+    _add_session(db, "fresh", UploadSessionStatus.active, fresh)
+    _add_session(db, "assembling", UploadSessionStatus.completing, expired)
+    _add_session(db, "aborted", UploadSessionStatus.aborted, fresh)
+    db.commit()
+
+    dirs = {
+        "abandoned": _session_dir("abandoned", expired),
+        "slow": _session_dir("slow", fresh),
+        "fresh": _session_dir("fresh", fresh),
+        "assembling": _session_dir("assembling", expired),
+        "aborted": _session_dir("aborted", fresh),
+        # Its session row was deleted along with the evidence
+        "orphaned": _session_dir("orphaned", fresh),
+    }
+
+    assert UploadSessionCleaner().cleanup() == 3
+
+    assert {name for name, path in dirs.items() if os.path.isdir(path)} == {"slow", "fresh", "assembling"}
+    statuses = dict(db.query(UploadSession.id, UploadSession.status))
+    assert statuses["abandoned"] == UploadSessionStatus.aborted
+    assert statuses["slow"] == statuses["fresh"] == UploadSessionStatus.active
+    db.close()